@@ -0,0 +1,145 @@
+"""
+⚡ Super Prady Bros - Engine Benchmark ⚡
+Steps each level of the browser game's engine headlessly in Node (web/headless.js
+loads the bundle with stub canvases) under the same scripted input, and reports
+update throughput against a stored baseline.
+
+    python bench.py                         # 50000 steps per level vs bench_baseline.json
+    python bench.py --frames 50000 --levels 3
+    python bench.py --breakdown             # also time each level's update functions (not compared)
+    python bench.py --save-baseline         # record this machine's numbers as the baseline
+
+Reported per level:
+    steps/s     simulation steps per second (60 steps is one second of play)
+    mean/p50/p99  microseconds per step
+    restarts    times the level was reloaded after the player died or finished it
+    vs base     steps/s change against the baseline
+
+Each level is warmed up first so the JIT has settled, and the best of --runs
+fresh Node processes is kept. Baselines only compare on the machine (and Node
+version) that recorded them. The exit status is 1 when a level is more than
+--tolerance percent slower than its baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import bundle
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+RUNNER = os.path.join(ROOT, 'web', 'headless.js')
+BASELINE = os.path.join(ROOT, 'bench_baseline.json')
+LEVEL_NAMES = {1: 'THE GRID', 2: 'NYC', 3: 'SPACE', 4: 'CYCLE'}
+
+
+def run_engine(engine, args):
+    """One Node process stepping every level - returns its parsed report"""
+    command = ['node', RUNNER, engine, '--frames', str(args.frames), '--warmup', str(args.warmup),
+               '--levels', args.levels, '--seed', str(args.seed)]
+    if args.breakdown:
+        command.append('--breakdown')
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def best_of(reports):
+    """Per level, the run with the highest throughput"""
+    best = {}
+    for report in reports:
+        for level in report['levels']:
+            key = str(level['level'])
+            if key not in best or level['steps_per_sec'] > best[key]['steps_per_sec']:
+                best[key] = level
+    return best
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def report(levels, baseline, tolerance):
+    """Print the table and return the levels that regressed past the tolerance"""
+    base_levels = baseline['levels'] if baseline else {}
+    print(f"{'level':<12} {'steps/s':>10} {'mean':>8} {'p50':>8} {'p99':>8} {'restarts':>9} {'vs base':>8}")
+    slower = []
+    for key, level in levels.items():
+        change = ''
+        base = base_levels.get(key)
+        if base:
+            delta = (level['steps_per_sec'] / base['steps_per_sec'] - 1) * 100
+            change = f"{delta:+.1f}%"
+            if delta < -tolerance:
+                slower.append(key)
+        name = f"{key} {LEVEL_NAMES.get(int(key), '')}"
+        print(f"{name:<12} {level['steps_per_sec']:>10,} {level['mean_us']:>8.2f} {level['p50_us']:>8.2f} "
+              f"{level['p99_us']:>8.2f} {level['restarts']:>9} {change:>8}")
+        for function, us in level.get('functions_us', {}).items():
+            print(f"    {function:<28} {us:>8.2f} us/step")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless update() benchmark for the browser game's engine")
+    parser.add_argument('--frames', type=int, default=50000, help="timed steps per level")
+    parser.add_argument('--warmup', type=int, default=20000, help="untimed steps per level before timing")
+    parser.add_argument('--levels', default='1,2,3,4', help="comma separated levels")
+    parser.add_argument('--seed', type=int, default=42, help="random seed for every level")
+    parser.add_argument('--runs', type=int, default=5, help="fresh Node processes; the best is kept")
+    parser.add_argument('--breakdown', action='store_true', help="time each level's update functions too")
+    parser.add_argument('--baseline', default=BASELINE, help="baseline file to compare against or save")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--tolerance', type=float, default=20, help="percent slower than baseline that fails")
+    args = parser.parse_args()
+
+    if shutil.which('node') is None:
+        print("bench.py needs Node.js on the PATH to run the engine: https://nodejs.org/")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = os.path.join(tmp, 'game.js')
+        with open(engine, 'w', encoding='utf-8') as f:
+            f.write(bundle.bundle_js())
+        reports = [run_engine(engine, args) for _ in range(args.runs)]
+    levels = best_of(reports)
+
+    if args.breakdown and args.save_baseline:
+        print("--breakdown timing slows every step, so it can't be saved as a baseline")
+        return 1
+    # The breakdown's timers slow every step, so those numbers aren't compared either
+    baseline = None if args.save_baseline or args.breakdown else load_baseline(args.baseline)
+    print(f"Engine benchmark - {args.frames} steps per level, best of {args.runs} "
+          f"(Node {reports[0]['node']}, times in us)")
+    if baseline:
+        print(f"Baseline: {os.path.relpath(args.baseline)} (Node {baseline['node']}, {baseline['platform']})")
+    slower = report(levels, baseline, args.tolerance)
+
+    if args.save_baseline:
+        saved = {
+            'node': reports[0]['node'],
+            'platform': platform.platform(),
+            'frames': args.frames,
+            'seed': args.seed,
+            'levels': {key: {name: level[name] for name in ('steps_per_sec', 'mean_us', 'p50_us', 'p99_us')}
+                       for key, level in levels.items()},
+        }
+        with open(args.baseline, 'w') as f:
+            json.dump(saved, f, indent=2)
+            f.write('\n')
+        print(f"Saved baseline to {os.path.relpath(args.baseline)}")
+    elif slower:
+        print(f"Slower than baseline by more than {args.tolerance:g}%: level {', '.join(slower)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+⚡ Super Prady Bros - Game Bundle ⚡
+Bundles the browser game's JavaScript modules (web/src/), minifies them and
+writes content-hashed, precompressed static assets. server.py serves them, and
+app.py publishes the page and engine to static/game/ for Streamlit to serve.
+
+    python bundle.py                 # build into web/dist/
+    python bundle.py --no-minify     # readable bundle for debugging
+    python bundle.py --worker        # run the game in a Web Worker by default
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+# Brotli is optional - gzip alone is still a big win
+BROTLI_AVAILABLE = False
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+
+# rjsmin is optional - the built-in minifier only strips comments and whitespace
+RJSMIN_AVAILABLE = False
+try:
+    import rjsmin
+    RJSMIN_AVAILABLE = True
+except ImportError:
+    rjsmin = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(ROOT, 'web', 'game.html')
+SOURCE_DIR = os.path.join(ROOT, 'web', 'src')
+# Page-side loader that starts the engine on the page or in a Web Worker
+HOST_SCRIPT = os.path.join(ROOT, 'web', 'host.js')
+DIST_DIR = os.path.join(ROOT, 'web', 'dist')
+# Streamlit serves the app's static/ folder at app/static/ (see app.py)
+STATIC_DIR = os.path.join(ROOT, 'static', 'game')
+MANIFEST = 'manifest.json'
+
+# Engine modules in load order - later modules may use anything declared earlier
+MODULES = [
+    'thread.js',
+    'random.js',
+    'projectiles.js',
+    'config.js',
+    'resolution.js',
+    'quality.js',
+    'spatial.js',
+    'broadphase.js',
+    'offscreen.js',
+    'layers.js',
+    'glow.js',
+    'sprites.js',
+    'levels.js',
+    'grid.js',
+    'nyc.js',
+    'space.js',
+    'lightcycle.js',
+    'hud.js',
+    'perfhud.js',
+    'menus.js',
+    'input.js',
+    'replay.js',
+    'main.js',
+]
+
+# The page refers to the bundle by this name; the build swaps in the host script,
+# which loads the hashed file (or the inline copy) itself
+SCRIPT_TAG = '<script src="game.js"></script>'
+
+# Hashed files never change, so browsers may keep them forever
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+# Preferred first - (Accept-Encoding token, file suffix)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.json': 'application/json',
+}
+
+
+def content_hash(data):
+    """Short, stable fingerprint for a file's contents"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def hashed_name(name, data):
+    """game.html -> game.<hash>.html"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{content_hash(data)}{ext}"
+
+
+def compress(data):
+    """Precompressed variants of an asset, keyed by file suffix"""
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if BROTLI_AVAILABLE:
+        variants['.br'] = brotli.compress(data, quality=11)
+    return variants
+
+
+def bundle_js(modules=MODULES):
+    """Concatenate the engine modules into one script"""
+    parts = []
+    for name in modules:
+        with open(os.path.join(SOURCE_DIR, name), encoding='utf-8') as f:
+            parts.append(f.read())
+    return '\n'.join(parts)
+
+
+# A '/' after one of these starts a regex literal rather than a division
+REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = ('return', 'typeof', 'case')
+WORD = re.compile(r'[A-Za-z0-9_$]')
+# A line break after these can never end a statement
+JOINS_NEXT_LINE = set('{;,([')
+
+
+def skip_quoted(js, i):
+    """Index just past the string, template or regex literal starting at js[i]"""
+    quote = '/' if js[i] == '/' else js[i]
+    i += 1
+    in_class = False
+    depth = 0
+    while i < len(js):
+        c = js[i]
+        if c == '\\':
+            i += 2
+            continue
+        if quote == '`' and c == '$' and js[i + 1:i + 2] == '{':
+            depth += 1
+            i += 2
+            continue
+        if depth:
+            if c in '\'"`':
+                i = skip_quoted(js, i)
+                continue
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+        elif quote == '/' and c == '[':
+            in_class = True
+        elif quote == '/' and c == ']':
+            in_class = False
+        elif c == quote and not in_class:
+            return i + 1
+        i += 1
+    raise ValueError(f"unterminated literal in bundle at offset {i}")
+
+
+def starts_regex(out):
+    """Whether a '/' following the minified output so far begins a regex"""
+    text = ''.join(out[-8:]).rstrip()
+    return not text or text[-1] in REGEX_PREFIX or text.endswith(REGEX_KEYWORDS)
+
+
+def minify_js(js):
+    """Strip comments, indentation and redundant whitespace from JavaScript"""
+    if RJSMIN_AVAILABLE:
+        return rjsmin.jsmin(js)
+
+    out = []
+    i = 0
+    pending_space = pending_newline = False
+    while i < len(js):
+        c = js[i]
+        if c in ' \t\r\n':
+            pending_newline = pending_newline or c == '\n'
+            pending_space = True
+            i += 1
+            continue
+        if js.startswith('//', i):
+            end = js.find('\n', i)
+            i = len(js) if end < 0 else end
+            continue
+        if js.startswith('/*', i):
+            i = js.index('*/', i) + 2
+            pending_space = True
+            continue
+
+        if pending_space and out:
+            last = out[-1][-1]
+            if pending_newline and last not in JOINS_NEXT_LINE and c != '}':
+                out.append('\n')
+            elif (WORD.match(last) and WORD.match(c)) or (last in '+-' and c == last):
+                out.append(' ')
+        pending_space = pending_newline = False
+
+        if c in '\'"`' or (c == '/' and starts_regex(out)):
+            end = skip_quoted(js, i)
+            out.append(js[i:end])
+            i = end
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out) + '\n'
+
+
+def minify_html(html):
+    """Drop indentation and blank lines from the page markup and styles"""
+    lines = (line.strip() for line in html.splitlines())
+    return '\n'.join(line for line in lines if line) + '\n'
+
+
+def write_asset(out_dir, name, data):
+    """Write an asset and its compressed variants, returning the hashed name"""
+    filename = hashed_name(name, data)
+    with open(os.path.join(out_dir, filename), 'wb') as f:
+        f.write(data)
+    for suffix, packed in compress(data).items():
+        with open(os.path.join(out_dir, filename + suffix), 'wb') as f:
+            f.write(packed)
+    return filename
+
+
+def clean(out_dir, keep):
+    """Remove assets left over from previous builds"""
+    for filename in os.listdir(out_dir):
+        if filename == MANIFEST:
+            continue
+        base = filename
+        for _, suffix in ENCODINGS:
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base not in keep:
+            os.remove(os.path.join(out_dir, filename))
+
+
+def build(out_dir=DIST_DIR, minify=True, worker=False):
+    """Build the game into out_dir and return the manifest.
+    worker=True makes the pages render in a Web Worker where the browser allows it
+    (?worker=0 or ?worker=1 on the page URL overrides this)."""
+    os.makedirs(out_dir, exist_ok=True)
+    with open(SOURCE, encoding='utf-8') as f:
+        page = f.read()
+    with open(HOST_SCRIPT, encoding='utf-8') as f:
+        host = f.read()
+    script = bundle_js()
+    if minify:
+        page = minify_html(page)
+        script = minify_js(script)
+        host = minify_js(host)
+    mode = 'on' if worker else 'off'
+
+    manifest = {'game.js': write_asset(out_dir, 'game.js', script.encode())}
+    linked = page.replace(SCRIPT_TAG, f'<script data-engine="{manifest["game.js"]}" data-worker="{mode}">\n'
+                          + host + '</script>')
+    manifest['game.html'] = write_asset(out_dir, 'game.html', linked.encode())
+    # Single self-contained page for hosts that can only send HTML inline -
+    # the engine rides along as inert text for the host script to start
+    inline = page.replace(SCRIPT_TAG, '<script type="text/x-game-engine" id="gameEngine">\n' + script + '</script>\n'
+                          f'<script data-worker="{mode}">\n' + host + '</script>')
+    manifest['game.inline.html'] = write_asset(out_dir, 'game.inline.html', inline.encode())
+    clean(out_dir, set(manifest.values()))
+    with open(os.path.join(out_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def publish(manifest, out_dir=STATIC_DIR, names=('game.js', 'game.html')):
+    """Copy built files to a folder another server sends as-is, removing older builds"""
+    os.makedirs(out_dir, exist_ok=True)
+    published = {name: manifest[name] for name in names}
+    for filename in published.values():
+        shutil.copyfile(os.path.join(DIST_DIR, filename), os.path.join(out_dir, filename))
+    clean(out_dir, set(published.values()))
+    return published
+
+
+class Asset:
+    """One built file held in memory with its compressed variants"""
+
+    def __init__(self, path, cache_control):
+        self.cache_control = cache_control
+        self.content_type = CONTENT_TYPES.get(os.path.splitext(path)[1], 'application/octet-stream')
+        with open(path, 'rb') as f:
+            self.variants = {'identity': f.read()}
+        for encoding, suffix in ENCODINGS:
+            if os.path.exists(path + suffix):
+                with open(path + suffix, 'rb') as f:
+                    self.variants[encoding] = f.read()
+        self.etag = content_hash(self.variants['identity'])
+
+    def negotiate(self, accept_encoding):
+        """Pick the smallest variant the client accepts"""
+        accepted = {token.split(';')[0].strip() for token in accept_encoding.split(',')}
+        for encoding, _ in ENCODINGS:
+            if encoding in accepted and encoding in self.variants:
+                return encoding
+        return 'identity'
+
+
+def load_assets(out_dir=DIST_DIR):
+    """Map URL paths to in-memory assets for everything in the manifest"""
+    with open(os.path.join(out_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    assets = {}
+    for name, filename in manifest.items():
+        asset = Asset(os.path.join(out_dir, filename), IMMUTABLE)
+        assets['/' + filename] = asset
+        # The unhashed name always points at the latest build
+        assets['/' + name] = Asset(os.path.join(out_dir, filename), REVALIDATE)
+    assets['/'] = assets['/game.html']
+    assets.pop('/game.inline.html', None)
+    return assets
+
+
+if __name__ == "__main__":
+    manifest = build(minify='--no-minify' not in sys.argv, worker='--worker' in sys.argv)
+    for name, filename in manifest.items():
+        print(f"{name} -> web/dist/{filename}")
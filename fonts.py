@@ -0,0 +1,77 @@
+"""
+⚡ Super Prady Bros - Font Bundler ⚡
+Downloads the page fonts (both SIL Open Font License) from the Google Fonts
+repository once, subsets them to printable ASCII and writes small woff2 files
+to static/fonts/, so the app never waits on fonts.googleapis.com.
+
+    pip install fonttools brotli
+    python fonts.py
+
+Commit the generated files - the app serves them with Streamlit's static
+file serving and skips any that are missing.
+"""
+
+import io
+import os
+import sys
+import urllib.request
+
+FONT_REPO = 'https://raw.githubusercontent.com/google/fonts/main/ofl'
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'fonts')
+
+# Printable ASCII covers every string the page draws in these fonts
+UNICODES = range(0x20, 0x7F)
+
+# (family, weight, source file in the repo, output file)
+FONTS = [
+    ('Orbitron', 700, 'orbitron/Orbitron%5Bwght%5D.ttf', 'orbitron-700.woff2'),
+    ('Press Start 2P', 400, 'pressstart2p/PressStart2P-Regular.ttf', 'press-start-2p-400.woff2'),
+]
+
+
+def download(path):
+    with urllib.request.urlopen(f'{FONT_REPO}/{path}', timeout=30) as response:
+        return response.read()
+
+
+def make_woff2(data, weight):
+    """Pin a variable font to one weight, subset it and encode as woff2"""
+    # Only needed when (re)building the fonts, so app.py can import this module without it
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    font = TTFont(io.BytesIO(data))
+    if 'fvar' in font:
+        font = instancer.instantiateVariableFont(font, {'wght': weight})
+
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['kern', 'liga']
+    options.name_IDs = [1, 2]
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=UNICODES)
+    subsetter.subset(font)
+
+    out = io.BytesIO()
+    font.flavor = 'woff2'
+    font.save(out)
+    return out.getvalue()
+
+
+def main():
+    os.makedirs(FONT_DIR, exist_ok=True)
+    for family, weight, source, filename in FONTS:
+        woff2 = make_woff2(download(source), weight)
+        with open(os.path.join(FONT_DIR, filename), 'wb') as f:
+            f.write(woff2)
+        print(f"{family} {weight} -> static/fonts/{filename} ({len(woff2) / 1024:.1f} KB)")
+
+        folder = source.split('/')[0]
+        with open(os.path.join(FONT_DIR, f'OFL-{folder}.txt'), 'wb') as f:
+            f.write(download(f'{folder}/OFL.txt'))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
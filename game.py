@@ -10,9 +10,12 @@ Controls:
 """
 
 import pygame
+import array
+import itertools
 import random
 import math
 import sys
+import time
 
 # Initialize Pygame
 pygame.init()
@@ -25,6 +28,16 @@ try:
 except:
     print("Note: Sound is not available on this system. The game will run without sound.")
 
+# numpy lets the particle pool update and draw in bulk (optional - it isn't in
+# requirements.txt, and the pure-Python path is the supported default; it only
+# matters for very large bursts: pip install numpy)
+NUMPY_AVAILABLE = False
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    numpy = None
+
 # Game Constants
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 600
@@ -49,6 +62,7 @@ COLORS = {
     'flag_pole': (139, 69, 19),       # Saddle brown
     'flag': (0, 255, 127),            # Spring green
     'cloud': (255, 255, 255),         # White
+    'cloud_far': (222, 240, 248),     # Hazy white
     'text': (255, 255, 255),          # White
     'text_shadow': (50, 50, 50),      # Dark gray
     'hill_back': (34, 120, 34),       # Dark green
@@ -56,6 +70,19 @@ COLORS = {
     'bush': (0, 100, 0),              # Dark green
 }
 
+# Colour that marks "see-through" pixels on cached layers (never used in art)
+LAYER_COLORKEY = (255, 0, 255)
+
+# Particle effects
+MAX_PARTICLES = 50000
+PARTICLE_GRAVITY = 0.25
+PARTICLE_COLORS = [
+    COLORS['coin'], COLORS['coin_shine'], COLORS['text'],   # 0-2: coin sparkle
+    COLORS['player'], (255, 120, 0), COLORS['enemy'],       # 3-5: game over burst
+]
+SPARKLE = (0, 1, 2)
+DEATH_BURST = (3, 4, 5)
+
 # Set up the display
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("🍄 Super Prady Bros 🍄")
@@ -216,98 +243,457 @@ class SoundEffects:
                 pass
 
 
-class Player:
-    """The main player character - our hero!"""
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(math.ceil(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class LatencyTracker:
+    """Measures the time from a key change to the frame that first shows it"""
     
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 40
-        self.height = 50
-        self.vel_x = 0
-        self.vel_y = 0
-        self.on_ground = False
-        self.facing_right = True
-        self.animation_frame = 0
-        self.animation_timer = 0
-        self.is_jumping = False
-    
-    def update(self, platforms):
-        """Update player physics and position"""
-        # Apply gravity
-        self.vel_y += GRAVITY
-        
-        # Cap falling speed
-        if self.vel_y > 15:
-            self.vel_y = 15
-        
-        # Update animation
-        self.animation_timer += 1
-        if self.animation_timer > 8:
-            self.animation_timer = 0
-            self.animation_frame = (self.animation_frame + 1) % 4
-        
-        # Move horizontally
-        self.x += self.vel_x
-        
-        # Check horizontal collisions
-        for platform in platforms:
-            if self._collides_with(platform):
-                if self.vel_x > 0:  # Moving right
-                    self.x = platform.x - self.width
-                elif self.vel_x < 0:  # Moving left
-                    self.x = platform.x + platform.width
+    # Keys the game reacts to - only these count as input
+    GAME_KEYS = (
+        pygame.K_LEFT, pygame.K_RIGHT, pygame.K_a, pygame.K_d,
+        pygame.K_SPACE, pygame.K_UP, pygame.K_w, pygame.K_r,
+    )
+    
+    def __init__(self):
+        self.pending = None       # When the oldest not-yet-shown key change was seen
+        self.last_keys = None     # Game key states from the previous frame
+        self.last_poll = None     # When the event queue was last polled
+        self.draw_start = 0
+        self.flip_start = 0
+        self.samples = {'total': [], 'update': [], 'draw': [], 'flip': []}
+        self.poll_gaps = []
+    
+    def input_seen(self):
+        """Remember when a key change was first noticed"""
+        if self.pending is None:
+            self.pending = time.perf_counter()
+    
+    def polled(self):
+        """Called right after pygame.event.get() - tracks how often we poll"""
+        now = time.perf_counter()
+        if self.last_poll is not None:
+            self.poll_gaps.append(now - self.last_poll)
+        self.last_poll = now
+    
+    def check_keys(self, keys):
+        """Compare key states from pygame.key.get_pressed() with last frame"""
+        state = tuple(keys[k] for k in self.GAME_KEYS)
+        if self.last_keys is not None and state != self.last_keys:
+            self.input_seen()
+        self.last_keys = state
+    
+    def begin_draw(self):
+        self.draw_start = time.perf_counter()
+    
+    def begin_flip(self):
+        self.flip_start = time.perf_counter()
+    
+    def end_flip(self):
+        """Called after pygame.display.flip() - closes out a pending key change"""
+        if self.pending is None:
+            return
+        now = time.perf_counter()
+        self.samples['total'].append(now - self.pending)
+        self.samples['update'].append(self.draw_start - self.pending)
+        self.samples['draw'].append(self.flip_start - self.draw_start)
+        self.samples['flip'].append(now - self.flip_start)
+        self.pending = None
+    
+    def report(self):
+        """Print p50/p95/p99 for this session"""
+        count = len(self.samples['total'])
+        print(f"Input-to-present latency ({count} key changes):")
+        if count == 0:
+            return
+        rows = [(name, values) for name, values in self.samples.items()]
+        rows.append(('poll gap', self.poll_gaps))
+        for name, values in rows:
+            p50, p95, p99 = (percentile(values, p) * 1000 for p in (50, 95, 99))
+            print(f"  {name:<9} p50 {p50:6.1f} ms   p95 {p95:6.1f} ms   p99 {p99:6.1f} ms")
+
+
+class Layer:
+    """A full-screen surface that is only repainted when invalidated"""
+    
+    def __init__(self, paint, key=None, transparent=False):
+        self.paint = paint            # Function that draws the layer onto a surface
+        self.key = key                # Optional function - repaint when its value changes
+        self.transparent = transparent
+        self.area = None              # Optional pygame.Rect - only this part is shown
+        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        if transparent:
+            self.surface.set_colorkey(LAYER_COLORKEY)
+        self.last_key = None
+        self.dirty = True
+    
+    def invalidate(self):
+        """Force a repaint on the next frame"""
+        self.dirty = True
+    
+    def refresh(self):
+        """Repaint the cached surface if anything it shows has changed"""
+        if self.key is not None:
+            key = self.key()
+            if key != self.last_key:
+                self.last_key = key
+                self.dirty = True
+        if self.dirty:
+            if self.transparent:
+                self.surface.fill(LAYER_COLORKEY, self.area)
+            self.paint(self.surface)
+            self.dirty = False
+    
+    def draw(self, surface):
+        """Refresh if needed, then blit the cached surface"""
+        self.refresh()
+        if self.area is None:
+            surface.blit(self.surface, (0, 0))
+        else:
+            surface.blit(self.surface, self.area.topleft, self.area)
+
+
+class Compositor:
+    """Stacks layers back to front onto the screen"""
+    
+    def __init__(self, layers):
+        self.layers = layers
+    
+    def composite(self, surface):
+        for layer in self.layers:
+            layer.draw(surface)
+
+
+# Entity kinds
+KIND_PLAYER = 0
+KIND_COIN = 1
+KIND_ENEMY = 2
+KIND_FLAG = 3
+
+# Components an entity can have (bit flags)
+POSITION = 1 << 0
+VELOCITY = 1 << 1
+FALLING = 1 << 2       # Pulled down by gravity, lands on platforms
+CONTROLLED = 1 << 3    # Moved by the keyboard
+PATROL = 1 << 4        # Walks back and forth between two points
+ANIMATION = 1 << 5     # Has an animation timer and frame counter
+COLLIDER = 1 << 6      # Something happens when the player touches it
+
+
+class SystemTiming:
+    """Running totals of how long one system takes per frame"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+    
+    def add(self, seconds):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+
+
+class World:
+    """Every entity is one slot in a set of flat component arrays
+    
+    Each component field is a typed array indexed by entity id, so systems
+    walk plain numbers instead of chasing attributes on lots of objects.
+    """
+    
+    # Component fields and their array typecodes
+    FIELDS = {
+        'kind': 'b', 'mask': 'I', 'alive': 'b',
+        'x': 'd', 'y': 'd', 'vel_x': 'd', 'vel_y': 'd',
+        'width': 'd', 'height': 'd', 'hit_x': 'd',
+        'on_ground': 'b', 'facing_right': 'b',
+        'anim_frame': 'i', 'anim_timer': 'i', 'anim_period': 'i', 'anim_frames': 'i',
+        'patrol_left': 'd', 'patrol_right': 'd', 'speed': 'd', 'direction': 'b',
+    }
+    
+    def __init__(self, systems):
+        self.systems = systems        # (name, function) pairs, run in order
+        self.timings = {name: SystemTiming() for name, _ in systems}
+        self.contacts = []            # Entities the player touched this frame
+        self.queries = {}
+        self.count = 0
+        for name, typecode in self.FIELDS.items():
+            setattr(self, name, array.array(typecode))
+    
+    def clear(self):
+        """Remove every entity (system timings are kept)"""
+        for name in self.FIELDS:
+            del getattr(self, name)[:]
+        self.contacts.clear()
+        self.queries.clear()
+        self.count = 0
+    
+    def spawn(self, kind, mask, x, y, width, height):
+        """Add an entity and return its id"""
+        for name in self.FIELDS:
+            getattr(self, name).append(0)
+        eid = self.count
+        self.count += 1
+        self.kind[eid] = kind
+        self.mask[eid] = mask
+        self.alive[eid] = 1
+        self.x[eid] = x
+        self.y[eid] = y
+        self.width[eid] = width
+        self.height[eid] = height
+        self.queries.clear()
+        return eid
+    
+    def query(self, mask):
+        """Ids of every entity that has all the components in mask"""
+        ids = self.queries.get(mask)
+        if ids is None:
+            ids = [eid for eid in range(self.count) if self.mask[eid] & mask == mask]
+            self.queries[mask] = ids
+        return ids
+    
+    def run(self, game):
+        """Run each system once, in order, timing each one"""
+        for name, system in self.systems:
+            start = time.perf_counter()
+            system(self, game)
+            self.timings[name].add(time.perf_counter() - start)
+    
+    def report(self):
+        """Print average and worst time per system for this session"""
+        print("System timings:")
+        for name, timing in self.timings.items():
+            if timing.calls == 0:
+                continue
+            average = timing.total / timing.calls * 1000
+            print(f"  {name:<9} avg {average:6.3f} ms   max {timing.worst * 1000:6.3f} ms")
+
+
+def _overlaps(x, y, width, height, other):
+    """Axis-aligned box test against anything with x/y/width/height"""
+    return (x < other.x + other.width and
+            x + width > other.x and
+            y < other.y + other.height and
+            y + height > other.y)
+
+
+def input_system(world, game):
+    """Turn held keys into movement for keyboard-controlled entities"""
+    keys = game.keys
+    left = keys[pygame.K_LEFT] or keys[pygame.K_a]
+    right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+    jump = keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]
+    
+    for eid in world.query(CONTROLLED | VELOCITY):
+        if left:
+            world.vel_x[eid] = -PLAYER_SPEED
+            world.facing_right[eid] = 0
+        elif right:
+            world.vel_x[eid] = PLAYER_SPEED
+            world.facing_right[eid] = 1
+        else:
+            world.vel_x[eid] = 0
+        
+        if jump and world.on_ground[eid]:
+            world.vel_y[eid] = JUMP_STRENGTH
+            world.on_ground[eid] = 0
+            game.sounds.play_jump()
+
+
+def physics_system(world, game):
+    """Gravity, movement and platform collisions"""
+    xs, ys = world.x, world.y
+    vel_xs, vel_ys = world.vel_x, world.vel_y
+    widths, heights = world.width, world.height
+    platforms = game.platforms
+    
+    for eid in world.query(POSITION | VELOCITY | FALLING):
+        width, height = widths[eid], heights[eid]
+        vel_x = vel_xs[eid]
         
-        # Move vertically
-        self.y += self.vel_y
+        # Apply gravity, capping falling speed
+        vel_y = min(vel_ys[eid] + GRAVITY, 15)
         
-        # Check vertical collisions
-        self.on_ground = False
+        # Move horizontally and push back out of platforms
+        x = xs[eid] + vel_x
+        y = ys[eid]
         for platform in platforms:
-            if self._collides_with(platform):
-                if self.vel_y > 0:  # Falling
-                    self.y = platform.y - self.height
-                    self.vel_y = 0
-                    self.on_ground = True
-                    self.is_jumping = False
-                elif self.vel_y < 0:  # Jumping up
-                    self.y = platform.y + platform.height
-                    self.vel_y = 0
+            if _overlaps(x, y, width, height, platform):
+                if vel_x > 0:  # Moving right
+                    x = platform.x - width
+                elif vel_x < 0:  # Moving left
+                    x = platform.x + platform.width
+        
+        # Move vertically and land on / bump into platforms
+        y += vel_y
+        on_ground = 0
+        for platform in platforms:
+            if _overlaps(x, y, width, height, platform):
+                if vel_y > 0:  # Falling
+                    y = platform.y - height
+                    vel_y = 0
+                    on_ground = 1
+                elif vel_y < 0:  # Jumping up
+                    y = platform.y + platform.height
+                    vel_y = 0
         
         # Screen boundaries
-        if self.x < 0:
-            self.x = 0
-        if self.x > SCREEN_WIDTH - self.width:
-            self.x = SCREEN_WIDTH - self.width
-    
-    def _collides_with(self, platform):
-        """Check if player collides with a platform"""
-        return (self.x < platform.x + platform.width and
-                self.x + self.width > platform.x and
-                self.y < platform.y + platform.height and
-                self.y + self.height > platform.y)
-    
-    def jump(self, sounds):
-        """Make the player jump"""
-        if self.on_ground:
-            self.vel_y = JUMP_STRENGTH
-            self.on_ground = False
-            self.is_jumping = True
-            sounds.play_jump()
-    
-    def move_left(self):
-        """Move player left"""
-        self.vel_x = -PLAYER_SPEED
-        self.facing_right = False
-    
-    def move_right(self):
-        """Move player right"""
-        self.vel_x = PLAYER_SPEED
-        self.facing_right = True
-    
-    def stop(self):
-        """Stop horizontal movement"""
-        self.vel_x = 0
+        if x < 0:
+            x = 0
+        if x > SCREEN_WIDTH - width:
+            x = SCREEN_WIDTH - width
+        
+        xs[eid], ys[eid] = x, y
+        vel_ys[eid] = vel_y
+        world.on_ground[eid] = on_ground
+
+
+def patrol_system(world, game):
+    """Walk patrolling enemies back and forth"""
+    xs = world.x
+    for eid in world.query(POSITION | PATROL):
+        xs[eid] += world.speed[eid] * world.direction[eid]
+        
+        # Reverse direction at patrol boundaries
+        if xs[eid] <= world.patrol_left[eid]:
+            world.direction[eid] = 1
+        elif xs[eid] >= world.patrol_right[eid]:
+            world.direction[eid] = -1
+
+
+def animation_system(world, game):
+    """Advance animation timers and frames, and drift the clouds"""
+    timers, frames = world.anim_timer, world.anim_frame
+    for eid in world.query(ANIMATION):
+        timers[eid] += 1
+        period = world.anim_period[eid]
+        # A period of 0 means the timer just keeps counting (e.g. the flag wave)
+        if period and timers[eid] > period:
+            timers[eid] = 0
+            frames[eid] = (frames[eid] + 1) % world.anim_frames[eid]
+    
+    for band in game.cloud_bands:
+        band.update()
+
+
+def collision_system(world, game):
+    """Record which colliders the player is touching this frame"""
+    contacts = world.contacts
+    contacts.clear()
+    xs, ys, widths, heights = world.x, world.y, world.width, world.height
+    
+    for player in world.query(CONTROLLED | POSITION):
+        px, py = xs[player], ys[player]
+        right, bottom = px + widths[player], py + heights[player]
+        for eid in world.query(COLLIDER):
+            if not world.alive[eid]:
+                continue
+            x = xs[eid] + world.hit_x[eid]
+            y = ys[eid]
+            if px < x + widths[eid] and right > x and py < y + heights[eid] and bottom > y:
+                contacts.append(eid)
+
+
+def scoring_system(world, game):
+    """Collect coins, lose to enemies or falls, win at the flag"""
+    for eid in world.contacts:
+        kind = world.kind[eid]
+        if kind == KIND_COIN:
+            world.alive[eid] = 0
+            game.score += 1
+            game.sounds.play_coin()
+            game.particles.emit(world.x[eid] + world.width[eid] / 2,
+                                world.y[eid] + world.height[eid] / 2, 40, SPARKLE)
+        elif kind == KIND_ENEMY:
+            _player_lost(world, game)
+        elif kind == KIND_FLAG:
+            game.game_won = True
+            game.sounds.play_win()
+    
+    # Check if the player fell off screen
+    for player in world.query(CONTROLLED | POSITION):
+        if world.y[player] > SCREEN_HEIGHT:
+            _player_lost(world, game)
+
+
+def _player_lost(world, game):
+    """Game over - the player bursts into pieces"""
+    if not game.game_over:
+        player = game.player.eid
+        x = world.x[player] + world.width[player] / 2
+        y = min(world.y[player] + world.height[player] / 2, SCREEN_HEIGHT - 10)
+        game.particles.emit(x, y, 400, DEATH_BURST, speed=7, life=70)
+    game.game_over = True
+    game.sounds.play_lose()
+
+
+# Systems in the order they run every frame
+SYSTEMS = [
+    ('input', input_system),
+    ('physics', physics_system),
+    ('patrol', patrol_system),
+    ('animation', animation_system),
+    ('collision', collision_system),
+    ('scoring', scoring_system),
+]
+
+
+def component(field):
+    """Attribute that reads and writes one entity's slot in a world array"""
+    def get(self):
+        return getattr(self.world, field)[self.eid]
+    
+    def set(self, value):
+        getattr(self.world, field)[self.eid] = value
+    
+    return property(get, set)
+
+
+class Entity:
+    """Handle to one entity in the world - the data lives in the world arrays"""
+    
+    x = component('x')
+    y = component('y')
+    width = component('width')
+    height = component('height')
+    animation_frame = component('anim_frame')
+    animation_timer = component('anim_timer')
+    
+    def __init__(self, world, kind, mask, x, y, width, height):
+        self.world = world
+        self.eid = world.spawn(kind, mask, x, y, width, height)
+    
+    def set_animation(self, period, frames):
+        """Step to the next of `frames` frames every `period` ticks"""
+        self.world.anim_period[self.eid] = period
+        self.world.anim_frames[self.eid] = frames
+    
+    def get_rect(self):
+        """Get entity's collision rectangle"""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+
+class Player(Entity):
+    """The main player character - our hero!"""
+    
+    vel_x = component('vel_x')
+    vel_y = component('vel_y')
+    on_ground = component('on_ground')
+    facing_right = component('facing_right')
+    
+    def __init__(self, world, x, y):
+        super().__init__(world, KIND_PLAYER,
+                         POSITION | VELOCITY | FALLING | CONTROLLED | ANIMATION,
+                         x, y, 40, 50)
+        self.facing_right = 1
+        self.set_animation(8, 4)
     
     def draw(self, surface):
         """Draw the player character"""
@@ -350,11 +736,6 @@ class Player:
         pygame.draw.ellipse(surface, (101, 67, 33), (x + 5, y + 45, 14, 8))
         pygame.draw.ellipse(surface, (101, 67, 33), (x + 21, y + 45, 14, 8))
     
-    def get_rect(self):
-        """Get player's collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
 class Platform:
     """A platform that the player can stand on"""
     
@@ -396,25 +777,17 @@ class Platform:
                                    (self.x + col, self.y + row + 8, 28, 13), 1)
 
 
-class Coin:
+class Coin(Entity):
     """Collectible coins that give points"""
     
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 25
-        self.height = 25
-        self.collected = False
-        self.animation_frame = 0
-        self.animation_timer = 0
+    def __init__(self, world, x, y):
+        super().__init__(world, KIND_COIN, POSITION | ANIMATION | COLLIDER, x, y, 25, 25)
+        self.set_animation(5, 8)
         self.float_offset = random.random() * math.pi * 2
     
-    def update(self):
-        """Animate the coin"""
-        self.animation_timer += 1
-        if self.animation_timer > 5:
-            self.animation_timer = 0
-            self.animation_frame = (self.animation_frame + 1) % 8
+    @property
+    def collected(self):
+        return not self.world.alive[self.eid]
     
     def draw(self, surface):
         """Draw the spinning coin"""
@@ -440,41 +813,22 @@ class Coin:
                               (self.x + x_offset + 3, float_y + 3, 
                                display_width // 3, self.height // 3))
     
-    def get_rect(self):
-        """Get coin's collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
-class Enemy:
+class Enemy(Entity):
     """A bad guy that the player must avoid"""
     
-    def __init__(self, x, y, patrol_left, patrol_right):
-        self.x = x
-        self.y = y
-        self.width = 40
-        self.height = 35
+    patrol_left = component('patrol_left')
+    patrol_right = component('patrol_right')
+    speed = component('speed')
+    direction = component('direction')
+    
+    def __init__(self, world, x, y, patrol_left, patrol_right):
+        super().__init__(world, KIND_ENEMY, POSITION | PATROL | ANIMATION | COLLIDER,
+                         x, y, 40, 35)
         self.patrol_left = patrol_left
         self.patrol_right = patrol_right
         self.speed = 2
         self.direction = 1
-        self.animation_frame = 0
-        self.animation_timer = 0
-    
-    def update(self):
-        """Move the enemy back and forth"""
-        self.x += self.speed * self.direction
-        
-        # Reverse direction at patrol boundaries
-        if self.x <= self.patrol_left:
-            self.direction = 1
-        elif self.x >= self.patrol_right:
-            self.direction = -1
-        
-        # Animate
-        self.animation_timer += 1
-        if self.animation_timer > 10:
-            self.animation_timer = 0
-            self.animation_frame = (self.animation_frame + 1) % 2
+        self.set_animation(10, 2)
     
     def draw(self, surface):
         """Draw the enemy (a purple goomba-like creature)"""
@@ -509,24 +863,19 @@ class Enemy:
         pygame.draw.ellipse(surface, (80, 30, 180), 
                           (x + 23, y + 30 - foot_offset, 15, 8))
     
-    def get_rect(self):
-        """Get enemy's collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-
-class Flag:
+class Flag(Entity):
     """The goal flag that ends the level"""
     
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+    def __init__(self, world, x, y):
         self.pole_height = 150
-        self.flag_y = y + 20
-        self.animation_timer = 0
+        # Touching anywhere near the pole counts, so the hitbox starts left of it
+        super().__init__(world, KIND_FLAG, POSITION | ANIMATION | COLLIDER,
+                         x, y, 30, self.pole_height)
+        world.hit_x[self.eid] = -10
     
-    def update(self):
-        """Animate the flag waving"""
-        self.animation_timer += 1
+    def get_wave(self):
+        """How far the flag tip is blown out right now (whole pixels)"""
+        return round(math.sin(self.animation_timer / 10) * 5)
     
     def draw(self, surface):
         """Draw the victory flag"""
@@ -540,7 +889,7 @@ class Flag:
         pygame.draw.circle(surface, COLORS['coin'], (x + 4, y), 8)
         
         # Flag with wave effect
-        wave = math.sin(self.animation_timer / 10) * 5
+        wave = self.get_wave()
         flag_points = [
             (x + 8, y + 10),
             (x + 60 + wave, y + 25),
@@ -568,34 +917,251 @@ class Flag:
     def get_rect(self):
         """Get flag's collision rectangle"""
         return pygame.Rect(self.x - 10, self.y, 30, self.pole_height)
+    
+    def get_draw_rect(self):
+        """Area the flag can paint into, including the wave"""
+        return pygame.Rect(self.x - 4, self.y - 8, 72, self.pole_height + 8)
 
 
 class Cloud:
-    """Decorative background clouds"""
+    """Decorative background cloud, drawn from a pre-rendered sprite"""
+    
+    # Sprites are shared by every cloud with the same size and colour
+    sprites = {}
     
-    def __init__(self, x, y, size):
+    def __init__(self, x, y, size, color=COLORS['cloud']):
         self.x = x
         self.y = y
         self.size = size
-        self.speed = 0.2 + random.random() * 0.3
+        self.color = color
     
-    def update(self):
-        """Slowly move the cloud"""
-        self.x -= self.speed
-        if self.x < -100:
-            self.x = SCREEN_WIDTH + 50
-            self.y = random.randint(30, 150)
+    @classmethod
+    def get_sprite(cls, size, color):
+        """Rasterize a fluffy cloud once and reuse it"""
+        key = (size, color)
+        if key not in cls.sprites:
+            s = size
+            sprite = pygame.Surface((int(s * 3.9) + 2, int(s * 2.2) + 2)).convert()
+            sprite.fill(LAYER_COLORKEY)
+            sprite.set_colorkey(LAYER_COLORKEY)
+            x, y = s, int(s * 1.15) + 1
+            
+            # Multiple overlapping circles for fluffy effect
+            pygame.draw.circle(sprite, color, (x, y), s)
+            pygame.draw.circle(sprite, color, (x + s, y - s//3), int(s * 0.8))
+            pygame.draw.circle(sprite, color, (x + s * 2, y), int(s * 0.9))
+            pygame.draw.circle(sprite, color, (x + s, y + s//4), int(s * 0.7))
+            cls.sprites[key] = sprite
+        return cls.sprites[key]
+    
+    def get_draw_rect(self):
+        """Where the cloud sprite lands when drawn"""
+        sprite = Cloud.get_sprite(self.size, self.color)
+        return sprite.get_rect(topleft=(int(self.x) - self.size,
+                                        int(self.y) - int(self.size * 1.15) - 1))
     
     def draw(self, surface):
         """Draw a fluffy cloud"""
-        x, y = int(self.x), int(self.y)
-        s = self.size
+        surface.blit(Cloud.get_sprite(self.size, self.color), self.get_draw_rect())
+
+
+class CloudBand:
+    """A screen-wide strip of clouds that scrolls sideways and wraps around
+    
+    All clouds are baked into one strip when the band is created, so
+    drawing costs two blits no matter how many clouds are in it.
+    """
+    
+    def __init__(self, clouds, speed):
+        self.clouds = clouds
+        self.speed = speed
+        self.scroll = 0.0
+        
+        # Strip only needs to be as tall as the clouds it holds
+        rects = [cloud.get_draw_rect() for cloud in clouds]
+        self.top = min(rect.top for rect in rects)
+        height = max(rect.bottom for rect in rects) - self.top
+        self.strip = pygame.Surface((SCREEN_WIDTH, height)).convert()
+        self.strip.fill(LAYER_COLORKEY)
+        self.strip.set_colorkey(LAYER_COLORKEY)
+        
+        for cloud, rect in zip(clouds, rects):
+            sprite = Cloud.get_sprite(cloud.size, cloud.color)
+            rect = rect.move(0, -self.top)
+            # Clouds hanging over either edge also show up on the other side
+            for shift in (-SCREEN_WIDTH, 0, SCREEN_WIDTH):
+                self.strip.blit(sprite, rect.move(shift, 0))
+    
+    @classmethod
+    def scattered(cls, count, speed, sizes, top, bottom, color=COLORS['cloud'], seed=0):
+        """Build a band of randomly placed clouds (same layout for the same seed)"""
+        rng = random.Random(seed)
+        clouds = [Cloud(rng.randint(0, SCREEN_WIDTH - 1), rng.randint(top, bottom),
+                        rng.choice(sizes), color)
+                  for _ in range(count)]
+        return cls(clouds, speed)
+    
+    def update(self):
+        """Drift the band to the left"""
+        self.scroll = (self.scroll + self.speed) % SCREEN_WIDTH
+    
+    def draw(self, surface):
+        """Blit the strip twice so it tiles across the screen"""
+        offset = int(self.scroll)
+        surface.blit(self.strip, (-offset, self.top))
+        surface.blit(self.strip, (SCREEN_WIDTH - offset, self.top))
+
+
+class ParticlePool:
+    """Fixed-size pool of 2x2 pixel particles stored as flat arrays
+    
+    Live particles are packed at the front of each array. Nothing is
+    allocated per frame: with numpy the whole pool moves with in-place
+    array maths and is written to the screen in one scatter; without it,
+    particles are blitted in a single Surface.blits() call.
+    """
+    
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        if NUMPY_AVAILABLE:
+            self.x = numpy.zeros(capacity, numpy.float32)
+            self.y = numpy.zeros(capacity, numpy.float32)
+            self.vel_x = numpy.zeros(capacity, numpy.float32)
+            self.vel_y = numpy.zeros(capacity, numpy.float32)
+            self.life = numpy.zeros(capacity, numpy.float32)
+            self.color = numpy.zeros(capacity, numpy.uint8)
+            # Scratch space so updates and draws never allocate
+            self._keep = numpy.zeros(capacity, bool)
+            self._test = numpy.zeros(capacity, bool)
+            self._spare = numpy.zeros(capacity, numpy.float32)
+            self._spare_color = numpy.zeros(capacity, numpy.uint8)
+            self._px = numpy.zeros(capacity, numpy.intp)
+            self._py = numpy.zeros(capacity, numpy.intp)
+            self._pixels = numpy.zeros(capacity, numpy.uint32)
+            self._mapped = None
+        else:
+            self.x = array.array('f', bytes(4 * capacity))
+            self.y = array.array('f', bytes(4 * capacity))
+            self.vel_x = array.array('f', bytes(4 * capacity))
+            self.vel_y = array.array('f', bytes(4 * capacity))
+            self.life = array.array('f', bytes(4 * capacity))
+            self.color = array.array('B', bytes(capacity))
+        self._dots = None
+        self._blit_list = None
+    
+    def emit(self, x, y, count, colors, speed=4.0, life=40):
+        """Spray up to `count` particles out from (x, y) in every direction"""
+        count = min(count, self.capacity - self.count)
+        for i in range(self.count, self.count + count):
+            angle = random.random() * math.pi * 2
+            power = speed * (0.3 + random.random() * 0.7)
+            self.x[i] = x
+            self.y[i] = y
+            self.vel_x[i] = math.cos(angle) * power
+            self.vel_y[i] = math.sin(angle) * power - speed * 0.5
+            self.life[i] = life * (0.6 + random.random() * 0.4)
+            self.color[i] = random.choice(colors)
+        self.count += count
+    
+    def update(self):
+        """Move every live particle and drop the ones that died or left the screen"""
+        if self.count == 0:
+            return
+        if NUMPY_AVAILABLE:
+            self._update_bulk()
+        else:
+            self._update_each()
+    
+    def _update_bulk(self):
+        n = self.count
+        x, y, life = self.x[:n], self.y[:n], self.life[:n]
+        vel_y = self.vel_y[:n]
+        numpy.add(x, self.vel_x[:n], out=x)
+        numpy.add(vel_y, PARTICLE_GRAVITY, out=vel_y)
+        numpy.add(y, vel_y, out=y)
+        numpy.subtract(life, 1, out=life)
+        
+        # Particles off screen are gone for good - keep the rest on screen
+        keep, test = self._keep[:n], self._test[:n]
+        numpy.greater(life, 0, out=keep)
+        for values, low, high in ((x, 0, SCREEN_WIDTH - 2), (y, 0, SCREEN_HEIGHT - 2)):
+            keep &= numpy.greater_equal(values, low, out=test)
+            keep &= numpy.less(values, high, out=test)
+        alive = int(numpy.count_nonzero(keep))
+        if alive == n:
+            return
         
-        # Multiple overlapping circles for fluffy effect
-        pygame.draw.circle(surface, COLORS['cloud'], (x, y), s)
-        pygame.draw.circle(surface, COLORS['cloud'], (x + s, y - s//3), int(s * 0.8))
-        pygame.draw.circle(surface, COLORS['cloud'], (x + s * 2, y), int(s * 0.9))
-        pygame.draw.circle(surface, COLORS['cloud'], (x + s, y + s//4), int(s * 0.7))
+        # Pack the survivors at the front of each array
+        for values in (self.x, self.y, self.vel_x, self.vel_y, self.life):
+            numpy.compress(keep, values[:n], out=self._spare[:alive])
+            values[:alive] = self._spare[:alive]
+        numpy.compress(keep, self.color[:n], out=self._spare_color[:alive])
+        self.color[:alive] = self._spare_color[:alive]
+        self.count = alive
+    
+    def _update_each(self):
+        x, y, vel_x, vel_y = self.x, self.y, self.vel_x, self.vel_y
+        life, color = self.life, self.color
+        i = 0
+        while i < self.count:
+            vel_y[i] += PARTICLE_GRAVITY
+            x[i] += vel_x[i]
+            y[i] += vel_y[i]
+            life[i] -= 1
+            if (life[i] > 0 and 0 <= x[i] < SCREEN_WIDTH - 2
+                    and 0 <= y[i] < SCREEN_HEIGHT - 2):
+                i += 1
+                continue
+            # Swap the last live particle into this slot
+            last = self.count - 1
+            x[i], y[i] = x[last], y[last]
+            vel_x[i], vel_y[i] = vel_x[last], vel_y[last]
+            life[i], color[i] = life[last], color[last]
+            self.count = last
+    
+    def draw(self, surface):
+        """Draw every live particle"""
+        if self.count == 0:
+            return
+        if NUMPY_AVAILABLE and surface.get_bytesize() == 4:
+            self._draw_bulk(surface)
+        else:
+            self._draw_blits(surface)
+    
+    def _draw_bulk(self, surface):
+        n = self.count
+        if self._mapped is None:
+            self._mapped = numpy.array([surface.map_rgb(c) for c in PARTICLE_COLORS],
+                                       numpy.uint32)
+        px, py, pixels = self._px[:n], self._py[:n], self._pixels[:n]
+        numpy.copyto(px, self.x[:n], casting='unsafe')
+        numpy.copyto(py, self.y[:n], casting='unsafe')
+        numpy.take(self._mapped, self.color[:n], out=pixels)
+        
+        target = pygame.surfarray.pixels2d(surface)
+        # Step (x, y) -> (x+1, y) -> (x+1, y+1) -> (x, y+1) to fill each 2x2 dot
+        for dx, dy in ((0, 0), (1, 0), (0, 1), (-1, 0)):
+            px += dx
+            py += dy
+            target[px, py] = pixels
+        del target
+    
+    def _draw_blits(self, surface):
+        if self._dots is None:
+            self._dots = []
+            for color in PARTICLE_COLORS:
+                dot = pygame.Surface((2, 2)).convert()
+                dot.fill(color)
+                self._dots.append(dot)
+            self._blit_list = [[self._dots[0], pygame.Rect(0, 0, 2, 2)]
+                               for _ in range(self.capacity)]
+        for i in range(self.count):
+            entry = self._blit_list[i]
+            entry[0] = self._dots[self.color[i]]
+            entry[1].x = int(self.x[i])
+            entry[1].y = int(self.y[i])
+        surface.blits(itertools.islice(self._blit_list, self.count), doreturn=False)
 
 
 class Game:
@@ -603,12 +1169,43 @@ class Game:
     
     def __init__(self):
         self.sounds = SoundEffects()
+        self.latency = LatencyTracker()
+        self.world = World(SYSTEMS)
+        self.particles = ParticlePool()
+        self.keys = pygame.key.get_pressed()
+        
+        # Static layer: sky, hills and platforms - only changes on reset
+        self.static_layer = Layer(self.paint_static_layer)
+        # Slow layer: the goal flag - repainted when it waves a whole pixel
+        self.slow_layer = Layer(self.paint_slow_layer, key=self.slow_layer_key,
+                                transparent=True)
+        
+        # Parallax clouds: a hazy far band behind a faster near band
+        self.cloud_bands = [
+            CloudBand.scattered(12, 0.12, sizes=(14, 18, 22), top=40, bottom=130,
+                                color=COLORS['cloud_far'], seed=7),
+            CloudBand([
+                Cloud(100, 80, 30),
+                Cloud(300, 50, 25),
+                Cloud(500, 100, 35),
+                Cloud(700, 60, 28),
+                Cloud(900, 90, 32),
+            ], 0.3),
+        ]
+        # The flag's slow layer isn't in the stack - it goes between the
+        # coins and enemies and the player, as it always has (see draw)
+        self.compositor = Compositor([self.static_layer, *self.cloud_bands])
+        
         self.reset_game()
     
     def reset_game(self):
         """Reset/initialize the game state"""
+        # Start from an empty world
+        self.world.clear()
+        self.particles.count = 0
+        
         # Create player
-        self.player = Player(50, 400)
+        self.player = Player(self.world, 50, 400)
         
         # Create platforms
         self.platforms = [
@@ -629,52 +1226,62 @@ class Game:
         
         # Create coins
         self.coins = [
-            Coin(230, 410),
-            Coin(280, 410),
-            Coin(430, 340),
-            Coin(180, 260),
-            Coin(380, 180),
-            Coin(420, 180),
-            Coin(580, 260),
-            Coin(730, 360),
-            Coin(780, 360),
-            Coin(880, 240),
+            Coin(self.world, 230, 410),
+            Coin(self.world, 280, 410),
+            Coin(self.world, 430, 340),
+            Coin(self.world, 180, 260),
+            Coin(self.world, 380, 180),
+            Coin(self.world, 420, 180),
+            Coin(self.world, 580, 260),
+            Coin(self.world, 730, 360),
+            Coin(self.world, 780, 360),
+            Coin(self.world, 880, 240),
         ]
         
         # Create enemies
         self.enemies = [
-            Enemy(100, 515, 50, 350),
-            Enemy(550, 515, 500, 680),
-            Enemy(380, 185, 350, 450),
+            Enemy(self.world, 100, 515, 50, 350),
+            Enemy(self.world, 550, 515, 500, 680),
+            Enemy(self.world, 380, 185, 350, 450),
         ]
         
         # Create the goal flag
-        self.flag = Flag(920, 400)
-        
-        # Create decorative clouds
-        self.clouds = [
-            Cloud(100, 80, 30),
-            Cloud(300, 50, 25),
-            Cloud(500, 100, 35),
-            Cloud(700, 60, 28),
-            Cloud(900, 90, 32),
-        ]
+        self.flag = Flag(self.world, 920, 400)
         
         # Game state
         self.score = 0
         self.game_won = False
         self.game_over = False
         self.message_timer = 0
+        
+        # New level geometry - the cached layers must be repainted
+        self.static_layer.invalidate()
+        self.slow_layer.area = self.flag.get_draw_rect()
+        self.slow_layer.invalidate()
+    
+    def paint_static_layer(self, surface):
+        """Paint everything that never moves: sky, hills and platforms"""
+        self.draw_background(surface)
+        for platform in self.platforms:
+            platform.draw(surface)
+    
+    def paint_slow_layer(self, surface):
+        """Paint the slow-moving scenery: the goal flag"""
+        self.flag.draw(surface)
+    
+    def slow_layer_key(self):
+        """Pixel position of everything on the slow layer"""
+        return self.flag.get_wave()
     
-    def draw_background(self):
-        """Draw the sky and background elements"""
+    def draw_background(self, surface):
+        """Draw the sky and background hills"""
         # Gradient sky
         for y in range(SCREEN_HEIGHT):
             ratio = y / SCREEN_HEIGHT
             r = int(COLORS['sky_top'][0] * (1 - ratio) + COLORS['sky_bottom'][0] * ratio)
             g = int(COLORS['sky_top'][1] * (1 - ratio) + COLORS['sky_bottom'][1] * ratio)
             b = int(COLORS['sky_top'][2] * (1 - ratio) + COLORS['sky_bottom'][2] * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.line(surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
         
         # Background hills
         hill_points = [
@@ -682,18 +1289,14 @@ class Game:
             (450, 500), (600, 420), (750, 480), (900, 440), 
             (1000, 500), (1000, 550)
         ]
-        pygame.draw.polygon(screen, COLORS['hill_back'], hill_points)
+        pygame.draw.polygon(surface, COLORS['hill_back'], hill_points)
         
         # Foreground hills
         hill_points2 = [
             (0, 550), (150, 500), (300, 530), (500, 480), 
             (700, 520), (850, 490), (1000, 530), (1000, 550)
         ]
-        pygame.draw.polygon(screen, COLORS['hill_front'], hill_points2)
-        
-        # Draw clouds
-        for cloud in self.clouds:
-            cloud.draw(screen)
+        pygame.draw.polygon(surface, COLORS['hill_front'], hill_points2)
     
     def draw_ui(self):
         """Draw score and game info"""
@@ -771,72 +1374,38 @@ class Game:
     def handle_input(self):
         """Handle keyboard input"""
         keys = pygame.key.get_pressed()
+        self.latency.check_keys(keys)
         
         if self.game_over or self.game_won:
             if keys[pygame.K_r]:
                 self.reset_game()
+                # Nothing moves on the restart frame - held keys apply from the next one
+                self.keys = type(keys)((False,) * len(keys))
             return
         
-        # Movement
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.player.move_left()
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.player.move_right()
-        else:
-            self.player.stop()
-        
-        # Jumping
-        if keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.player.jump(self.sounds)
+        # Movement and jumping are handled by input_system during update()
+        self.keys = keys
     
     def update(self):
         """Update all game objects"""
+        # Particles keep flying after the game ends
+        self.particles.update()
+        
         if self.game_over or self.game_won:
             self.message_timer += 1
             return
         
-        # Update player
-        self.player.update(self.platforms)
-        
-        # Update coins
-        for coin in self.coins:
-            coin.update()
-            if not coin.collected and self.player.get_rect().colliderect(coin.get_rect()):
-                coin.collected = True
-                self.score += 1
-                self.sounds.play_coin()
-        
-        # Update enemies
-        for enemy in self.enemies:
-            enemy.update()
-            if self.player.get_rect().colliderect(enemy.get_rect()):
-                self.game_over = True
-                self.sounds.play_lose()
-        
-        # Update flag
-        self.flag.update()
-        if self.player.get_rect().colliderect(self.flag.get_rect()):
-            self.game_won = True
-            self.sounds.play_win()
-        
-        # Update clouds
-        for cloud in self.clouds:
-            cloud.update()
-        
-        # Check if player fell off screen
-        if self.player.y > SCREEN_HEIGHT:
-            self.game_over = True
-            self.sounds.play_lose()
+        # Input, physics, patrol AI, animation, collision and scoring
+        self.world.run(self)
     
     def draw(self):
         """Draw everything"""
-        # Background
-        self.draw_background()
-        
-        # Platforms
-        for platform in self.platforms:
-            platform.draw(screen)
+        # Cached layers: background, platforms and cloud bands
+        self.compositor.composite(screen)
         
+        # Per-frame layer: coins, enemies and the player move every frame, so
+        # they're drawn straight to the screen - a cached copy would be
+        # repainted every frame anyway
         # Coins
         for coin in self.coins:
             coin.draw(screen)
@@ -845,12 +1414,15 @@ class Game:
         for enemy in self.enemies:
             enemy.draw(screen)
         
-        # Flag
-        self.flag.draw(screen)
+        # Flag (cached slow layer) - over coins and enemies, under the player
+        self.slow_layer.draw(screen)
         
         # Player
         self.player.draw(screen)
         
+        # Particle effects
+        self.particles.draw(screen)
+        
         # UI
         self.draw_ui()
         
@@ -873,6 +1445,12 @@ class Game:
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
+                    elif event.key in LatencyTracker.GAME_KEYS:
+                        self.latency.input_seen()
+                elif event.type == pygame.KEYUP:
+                    if event.key in LatencyTracker.GAME_KEYS:
+                        self.latency.input_seen()
+            self.latency.polled()
             
             # Handle continuous input
             self.handle_input()
@@ -881,14 +1459,19 @@ class Game:
             self.update()
             
             # Draw everything
+            self.latency.begin_draw()
             self.draw()
             
             # Update display
+            self.latency.begin_flip()
             pygame.display.flip()
+            self.latency.end_flip()
             
             # Cap framerate
             clock.tick(FPS)
         
+        self.latency.report()
+        self.world.report()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,301 @@
+"""
+⚡ Super Prady Bros - Load Test ⚡
+Simulates N concurrent players opening the Streamlit app and measures what
+each one costs the server.
+
+Each simulated session loads the page over HTTP, opens Streamlit's websocket,
+asks for a script run and waits for the game payload (the components.v1.html
+or iframe element). While all N sessions are connected the server's RSS is
+sampled, then they disconnect and the next N starts.
+
+    python loadtest.py                           # starts streamlit run app.py itself
+    python loadtest.py --sessions 10,50,100,300
+    python loadtest.py --url http://localhost:8501 --pid 12345
+
+Reported per level of N:
+    RSS/session   growth in server memory divided by N
+    TTFB          first byte of the HTTP page load
+    payload       page load start -> websocket message carrying the game
+    first frame   payload plus, in iframe mode, fetching the game page and engine -
+                  everything the browser needs before it can draw (painting itself
+                  happens in the browser and isn't measured)
+    game KB       that websocket message plus, in iframe mode, the page and engine
+                  as sent over HTTP on a first visit
+    ws MB/s       websocket bytes received by all sessions / wall time of the level
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+import urllib.parse
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+# websockets ships with recent Streamlit releases; older ones need it installed
+WEBSOCKETS_AVAILABLE = False
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    websockets = None
+
+STARTUP_TIMEOUT = 60     # Seconds to wait for a spawned server to come up
+SESSION_TIMEOUT = 60     # Seconds a session may take to receive the game
+SETTLE_TIME = 1.0        # Seconds to let the server settle before sampling RSS
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def rss_bytes(pid):
+    """Resident memory of a process and its children, from /proc (Linux only)"""
+    total = 0
+    pids = [pid]
+    while pids:
+        current = pids.pop()
+        try:
+            with open(f'/proc/{current}/status') as f:
+                match = re.search(r'^VmRSS:\s+(\d+) kB', f.read(), re.M)
+            total += int(match.group(1)) * 1024 if match else 0
+            with open(f'/proc/{current}/task/{current}/children') as f:
+                pids.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            pass
+    return total
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_streamlit(port):
+    """Run the app in a child process and wait until it's healthy"""
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', 'app.py',
+         '--server.port', str(port), '--server.headless', 'true',
+         '--browser.gatherUsageStats', 'false'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + STARTUP_TIMEOUT
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.25)
+    process.kill()
+    raise RuntimeError("streamlit did not start - try running it by hand")
+
+
+async def http_get(url, accept_encoding='gzip, br'):
+    """GET a URL on a fresh connection, returning (time to first byte, headers, body)"""
+    parts = urllib.parse.urlsplit(url)
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    path = parts.path or '/'
+    writer.write(f'GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n'
+                 f'Accept-Encoding: {accept_encoding}\r\nConnection: close\r\n\r\n'.encode())
+    first = await reader.readexactly(1)
+    ttfb = time.perf_counter() - start
+    head, _, body = (first + await reader.read()).partition(b'\r\n\r\n')
+    writer.close()
+    headers = {}
+    for line in head.decode('latin-1').split('\r\n')[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return ttfb, headers, body
+
+
+def find_game(msg):
+    """The game element in a ForwardMsg - (srcdoc, src) or None"""
+    if msg.WhichOneof('type') != 'delta' or msg.delta.WhichOneof('type') != 'new_element':
+        return None
+    element = msg.delta.new_element
+    if element.WhichOneof('type') == 'iframe':
+        return element.iframe.srcdoc, element.iframe.src
+    return None
+
+
+class Session:
+    """One simulated player"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.ttfb = None
+        self.payload = None
+        self.first_frame = None
+        self.payload_bytes = 0
+        self.ws_bytes = 0
+        self.ws_messages = 0
+        self.error = None
+        self.connection = None
+
+    async def open(self):
+        """Load the page, connect and wait for the game to arrive"""
+        start = time.perf_counter()
+        self.ttfb, _, _ = await http_get(self.base_url + '/')
+
+        ws_url = re.sub(r'^http', 'ws', self.base_url) + '/_stcore/stream'
+        self.connection = await websockets.connect(
+            ws_url, subprotocols=['streamlit'], origin=self.base_url,
+            max_size=None, compression=None,
+        )
+        rerun = BackMsg()
+        rerun.rerun_script.query_string = ''
+        rerun.rerun_script.page_script_hash = ''
+        await self.connection.send(rerun.SerializeToString())
+
+        finished = False
+        while not finished:
+            data = await self.connection.recv()
+            self.ws_bytes += len(data)
+            self.ws_messages += 1
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            finished = msg.WhichOneof('type') == 'script_finished'
+
+            game = find_game(msg)
+            if game and self.payload is None:
+                self.payload = time.perf_counter() - start
+                self.payload_bytes = len(data)
+                srcdoc, src = game
+                if src and not srcdoc:
+                    await self.load_game(src)
+                self.first_frame = time.perf_counter() - start
+
+    async def load_game(self, src):
+        """Fetch the iframe page and the engine it loads, as the browser would"""
+        page_url = urllib.parse.urljoin(self.base_url + '/', src)
+        _, headers, page = await http_get(page_url, accept_encoding='gzip')
+        self.payload_bytes += len(page)
+        if headers.get('content-encoding') == 'gzip':
+            page = gzip.decompress(page)
+        # web/host.js loads the engine named by data-engine (see bundle.py)
+        scripts = re.findall(r'<script[^>]*\s(?:src|data-engine)="([^"]+)"', page.decode('utf-8', 'replace'))
+        for script in scripts:
+            _, _, body = await http_get(urllib.parse.urljoin(page_url, script))
+            self.payload_bytes += len(body)
+
+    async def close(self):
+        if self.connection is not None:
+            await self.connection.close()
+
+
+async def run_level(base_url, count, pid, ramp):
+    """Connect count sessions, sample memory while they're all open, disconnect"""
+    await asyncio.sleep(SETTLE_TIME)
+    baseline = rss_bytes(pid) if pid else 0
+    sessions = [Session(base_url) for _ in range(count)]
+
+    async def open_session(index, session):
+        await asyncio.sleep(index * ramp)
+        try:
+            await asyncio.wait_for(session.open(), SESSION_TIMEOUT)
+        except Exception as e:
+            session.error = f"{type(e).__name__}: {e}"
+
+    start = time.perf_counter()
+    await asyncio.gather(*(open_session(i, s) for i, s in enumerate(sessions)))
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(SETTLE_TIME)
+    loaded = rss_bytes(pid) if pid else 0
+    await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+    ok = [s for s in sessions if s.error is None and s.payload is not None]
+    errors = {}
+    for s in sessions:
+        if s.error:
+            errors[s.error] = errors.get(s.error, 0) + 1
+    ws_bytes = sum(s.ws_bytes for s in sessions)
+    return {
+        'sessions': count,
+        'ok': len(ok),
+        'rss_mb': loaded / 1e6,
+        'rss_per_session_kb': (loaded - baseline) / count / 1e3 if pid else float('nan'),
+        'ttfb': [s.ttfb * 1000 for s in ok],
+        'payload': [s.payload * 1000 for s in ok],
+        'first_frame': [s.first_frame * 1000 for s in ok],
+        'payload_kb': max((s.payload_bytes for s in ok), default=0) / 1e3,
+        'ws_messages': sum(s.ws_messages for s in sessions),
+        'ws_mb_per_s': ws_bytes / 1e6 / elapsed,
+        'ws_mb': ws_bytes / 1e6,
+        'errors': errors,
+    }
+
+
+def report(result):
+    ms = lambda values, pct: f"{percentile(values, pct):7.0f}"
+    print(f"{result['sessions']:>6} {result['ok']:>5} "
+          f"{result['rss_mb']:>8.0f} {result['rss_per_session_kb']:>9.0f} "
+          f"{ms(result['ttfb'], 50)} {ms(result['ttfb'], 95)} "
+          f"{ms(result['payload'], 50)} {ms(result['payload'], 95)} "
+          f"{ms(result['first_frame'], 50)} {ms(result['first_frame'], 95)} "
+          f"{result['payload_kb']:>8.1f} {result['ws_mb']:>7.1f} {result['ws_mb_per_s']:>7.2f}")
+    for error, count in result['errors'].items():
+        print(f"       {count} failed: {error}")
+
+
+HEADER = (f"{'N':>6} {'ok':>5} {'RSS MB':>8} {'KB/sess':>9} "
+          f"{'TTFB50':>7} {'TTFB95':>7} {'pay50':>7} {'pay95':>7} "
+          f"{'frame50':>7} {'frame95':>7} {'game KB':>8} {'ws MB':>7} {'ws MB/s':>7}")
+
+
+async def main_async(args):
+    levels = [int(n) for n in args.sessions.split(',')]
+    process = None
+    base_url, pid = args.url, args.pid
+    if base_url is None:
+        port = free_port()
+        print(f"Starting streamlit run app.py on port {port}...")
+        process = start_streamlit(port)
+        base_url, pid = f'http://127.0.0.1:{port}', process.pid
+
+    try:
+        # Warm up once so the first level doesn't pay for the app's first build
+        await run_level(base_url, 1, None, 0)
+        if not pid:
+            print("No --pid given, so server memory isn't reported")
+        print(f"Load test against {base_url} (times in ms)")
+        print(HEADER)
+        for count in levels:
+            report(await run_level(base_url, count, pid, args.ramp / 1000))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Streamlit app")
+    parser.add_argument('--sessions', default='1,10,50,100,200', help="comma separated session counts")
+    parser.add_argument('--url', help="test an already running app instead of starting one")
+    parser.add_argument('--pid', type=int, help="server process id for memory readings with --url")
+    parser.add_argument('--ramp', type=float, default=5, help="milliseconds between session starts")
+    args = parser.parse_args()
+
+    if not WEBSOCKETS_AVAILABLE:
+        print("loadtest.py needs the websockets package: pip install websockets")
+        return 1
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+⚡ Super Prady Bros - Game Server ⚡
+Serves the built browser game on its own, without a Streamlit session per
+player. One asyncio event loop handles every connection with HTTP/1.1
+keep-alive, precompressed assets and ETags.
+
+    python server.py                      # build and serve on port 8000
+    python server.py --port 8080 --no-build
+"""
+
+import argparse
+import asyncio
+import email.utils
+import sys
+import threading
+import time
+
+import bundle
+
+# uvloop is optional - the stdlib loop is plenty for static files
+UVLOOP_AVAILABLE = False
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+
+KEEP_ALIVE_TIMEOUT = 15      # Seconds an idle connection is kept open
+MAX_HEADER_BYTES = 16384     # Larger request heads are rejected
+LISTEN_BACKLOG = 4096
+
+REASONS = {
+    200: 'OK',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+}
+
+
+class HttpDate:
+    """Formats the Date header at most once per second"""
+
+    def __init__(self):
+        self.second = None
+        self.value = ''
+
+    def now(self):
+        second = int(time.time())
+        if second != self.second:
+            self.second = second
+            self.value = email.utils.formatdate(second, usegmt=True)
+        return self.value
+
+
+class GameServer:
+    """Serves in-memory game assets over keep-alive HTTP/1.1 connections"""
+
+    def __init__(self, assets):
+        self.assets = assets
+        self.date = HttpDate()
+        self.connections = 0
+        self.requests = 0
+
+    def respond(self, method, path, headers):
+        """Return (status, header lines, body) for one request"""
+        if method not in ('GET', 'HEAD'):
+            return 405, ['Allow: GET, HEAD'], b''
+        asset = self.assets.get(path.split('?')[0])
+        if asset is None:
+            return 404, [], b''
+
+        encoding = asset.negotiate(headers.get('accept-encoding', ''))
+        etag = f'"{asset.etag}-{encoding}"'
+        lines = [
+            f'Cache-Control: {asset.cache_control}',
+            f'ETag: {etag}',
+            'Vary: Accept-Encoding',
+        ]
+        # Exact matches only - a weak W/ tag or one that merely contains ours isn't this variant
+        if_none_match = {tag.strip() for tag in headers.get('if-none-match', '').split(',')}
+        if etag in if_none_match or '*' in if_none_match:
+            return 304, lines, b''
+
+        lines.append(f'Content-Type: {asset.content_type}')
+        if encoding != 'identity':
+            lines.append(f'Content-Encoding: {encoding}')
+        return 200, lines, asset.variants[encoding]
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or goes idle"""
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+
+                try:
+                    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                    method, path, version = request_line.split(' ')
+                except ValueError:
+                    self.write(writer, 400, [], b'', close=True)
+                    break
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(':')
+                    if value:
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                if version == 'HTTP/1.1':
+                    keep_alive = connection != 'close'
+                else:
+                    keep_alive = connection == 'keep-alive'
+                # Only GET and HEAD are served, so a request body means we can't reuse the connection
+                if headers.get('content-length', '0') != '0' or 'transfer-encoding' in headers:
+                    keep_alive = False
+
+                self.requests += 1
+                status, lines, body = self.respond(method, path, headers)
+                self.write(writer, status, lines, body, close=not keep_alive, headers_only=method == 'HEAD')
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    def write(self, writer, status, lines, body, close, headers_only=False):
+        """Write a complete response - HEAD gets the headers only"""
+        head = [
+            f'HTTP/1.1 {status} {REASONS[status]}',
+            f'Date: {self.date.now()}',
+            'Server: SuperPradyBros',
+            f'Content-Length: {len(body)}',
+            'Connection: close' if close else f'Keep-Alive: timeout={KEEP_ALIVE_TIMEOUT}',
+        ]
+        head.extend(lines)
+        data = ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1')
+        writer.write(data if headers_only else data + body)
+
+    async def start(self, host, port):
+        """Start listening and return the asyncio server"""
+        return await asyncio.start_server(
+            self.handle, host, port,
+            limit=MAX_HEADER_BYTES, backlog=LISTEN_BACKLOG, reuse_address=True,
+        )
+
+
+def raise_open_file_limit():
+    """Allow as many open connections as the OS will let us have"""
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if hard == resource.RLIM_INFINITY:
+            hard = 65536
+        if soft < hard:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def new_event_loop():
+    """Event loop for the server - uvloop when it's installed"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def serve_in_background(port, host='0.0.0.0', out_dir=bundle.DIST_DIR):
+    """Run the game server on its own thread and event loop, returning the GameServer"""
+    game_server = GameServer(bundle.load_assets(out_dir))
+    loop = new_event_loop()
+    server = loop.run_until_complete(game_server.start(host, port))
+    thread = threading.Thread(target=loop.run_until_complete, args=(server.serve_forever(),), daemon=True)
+    thread.start()
+    return game_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Super Prady Bros browser game")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--no-build', action='store_true', help="serve the existing web/dist/ build")
+    args = parser.parse_args()
+
+    if not args.no_build:
+        for name, filename in bundle.build().items():
+            print(f"{name} -> web/dist/{filename}")
+
+    raise_open_file_limit()
+    game_server = GameServer(bundle.load_assets())
+    loop = new_event_loop()
+    server = loop.run_until_complete(game_server.start(args.host, args.port))
+    print(f"⚡ Serving the game on http://localhost:{args.port}/ (Ctrl+C to stop)")
+    try:
+        loop.run_until_complete(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
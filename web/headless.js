@@ -0,0 +1,168 @@
+// ⚡ Headless runner - loads the engine into Node with stub canvases and steps the
+// simulation without drawing, so update() can be timed outside a browser
+//
+//     node web/headless.js <engine.js> [--frames 50000] [--warmup 20000] [--levels 1,2,3,4]
+//                                      [--seed 42] [--breakdown]
+//
+// Each level is stepped under the same scripted input and reloaded whenever the
+// player dies or finishes it. Prints one JSON object with steps per second and
+// per-step microseconds for each level. bench.py builds the engine and runs this.
+
+const fs = require('fs');
+const vm = require('vm');
+
+// The update functions behind each level, timed one by one with --breakdown
+const LEVEL_FUNCTIONS = {
+    1: ['updatePlayer', 'updateCoins', 'updateEnemies', 'checkFlag'],
+    2: ['updatePlayer', 'updateCoins', 'updateEnemies', 'updateDisc', 'updateNYCEnemies', 'updateEnemyDiscs'],
+    3: ['updateJet', 'updateMissiles', 'updateSpaceDrones'],
+    4: ['updateLightCycle', 'updateLaneEnemies', 'updateRecognizerMissiles'],
+};
+
+function parseArgs(argv) {
+    const options = { engine: null, frames: 50000, warmup: 20000, levels: [1, 2, 3, 4], seed: 42, breakdown: false };
+    for (let i = 0; i < argv.length; i++) {
+        const arg = argv[i];
+        if (arg === '--frames') options.frames = parseInt(argv[++i], 10);
+        else if (arg === '--warmup') options.warmup = parseInt(argv[++i], 10);
+        else if (arg === '--levels') options.levels = argv[++i].split(',').map(Number);
+        else if (arg === '--seed') options.seed = parseInt(argv[++i], 10);
+        else if (arg === '--breakdown') options.breakdown = true;
+        else options.engine = arg;
+    }
+    if (!options.engine) throw new Error('usage: node web/headless.js <engine.js> [options]');
+    return options;
+}
+
+// A 2D context that accepts every call and draws nothing
+function stubContext() {
+    const context = {
+        measureText: text => ({ width: String(text).length * 8 }),
+        createLinearGradient: () => ({ addColorStop() {} }),
+        createRadialGradient: () => ({ addColorStop() {} }),
+        createPattern: () => ({}),
+        getImageData: (x, y, width, height) => ({ data: new Uint8ClampedArray(width * height * 4) }),
+    };
+    return new Proxy(context, {
+        get: (target, name) => (name in target ? target[name] : (target[name] = () => {})),
+    });
+}
+
+function stubElement() {
+    const context = stubContext();
+    return {
+        width: 900,
+        height: 500,
+        style: {},
+        textContent: '',
+        innerHTML: '',
+        getContext: () => context,
+        getBoundingClientRect: () => ({ left: 0, top: 0, width: 900, height: 500 }),
+        addEventListener() {},
+        focus() {},
+    };
+}
+
+// Just enough of a page for the engine to load - the frame loop never gets a second frame
+function installPage() {
+    const elements = {};
+    globalThis.document = {
+        getElementById: id => elements[id] || (elements[id] = stubElement()),
+        createElement: () => stubElement(),
+        addEventListener() {},
+    };
+    globalThis.requestAnimationFrame = () => {};
+}
+
+// Load the engine as a plain script in this context - its globals become ours
+function loadEngine(file) {
+    installPage();
+    vm.runInThisContext(fs.readFileSync(file, 'utf8'), { filename: file });
+    return name => vm.runInThisContext(name);
+}
+
+// Same input every run: always running right, jumping and ducking in a rhythm, firing often
+function scriptInput(queueInput, tick) {
+    if (tick === 0) queueInput('keydown', 'ArrowRight');
+    if (tick % 40 === 0) queueInput('keydown', 'ArrowUp');
+    if (tick % 40 === 10) queueInput('keyup', 'ArrowUp');
+    if (tick % 60 === 30) queueInput('keydown', 'ArrowDown');
+    if (tick % 60 === 40) queueInput('keyup', 'ArrowDown');
+    if (tick % 8 === 0) queueInput('keydown', 'x');
+}
+
+// Wrap a global function so the time spent in it is added to totals[name]
+function timeFunction(name, totals) {
+    const original = globalThis[name];
+    totals[name] = 0;
+    globalThis[name] = function () {
+        const start = process.hrtime.bigint();
+        const result = original.apply(this, arguments);
+        totals[name] += Number(process.hrtime.bigint() - start);
+        return result;
+    };
+    return () => { globalThis[name] = original; };
+}
+
+function percentile(sorted, p) {
+    return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+function benchLevel(engine, level, options) {
+    const stepSimulation = engine('stepSimulation');
+    const queueInput = engine('queueInput');
+    const playing = engine(`() => gameState === 'playing' && currentLevel === ${level}`);
+    const restart = engine(`() => { loadLevel(${level}); gameState = 'playing'; }`);
+
+    engine('seedRandom')(options.seed);
+    engine('simTick = 0; simTime = 0');
+    engine('startGame')();
+    restart();
+
+    let restarts = 0;
+    const samples = new Float64Array(options.frames);
+    const totals = {};
+    let unwrap = [];
+    for (let tick = 0; tick < options.warmup + options.frames; tick++) {
+        if (tick === options.warmup && options.breakdown) {
+            unwrap = LEVEL_FUNCTIONS[level].map(name => timeFunction(name, totals));
+        }
+        if (!playing()) {
+            restart();
+            restarts++;
+        }
+        scriptInput(queueInput, tick);
+        const start = process.hrtime.bigint();
+        stepSimulation();
+        if (tick >= options.warmup) samples[tick - options.warmup] = Number(process.hrtime.bigint() - start);
+    }
+    unwrap.forEach(restore => restore());
+
+    const totalNs = samples.reduce((sum, ns) => sum + ns, 0);
+    const sorted = samples.slice().sort();
+    const result = {
+        level,
+        frames: options.frames,
+        steps_per_sec: Math.round(options.frames / (totalNs / 1e9)),
+        mean_us: totalNs / options.frames / 1000,
+        p50_us: percentile(sorted, 0.5) / 1000,
+        p99_us: percentile(sorted, 0.99) / 1000,
+        restarts,
+    };
+    if (options.breakdown) {
+        result.functions_us = {};
+        Object.keys(totals).forEach(name => {
+            result.functions_us[name] = totals[name] / options.frames / 1000;
+        });
+    }
+    return result;
+}
+
+function main() {
+    const options = parseArgs(process.argv.slice(2));
+    const engine = loadEngine(options.engine);
+    const levels = options.levels.map(level => benchLevel(engine, level, options));
+    process.stdout.write(JSON.stringify({ node: process.version, seed: options.seed, levels }) + '\n');
+}
+
+main();
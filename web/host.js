@@ -0,0 +1,126 @@
+// ⚡ Page host - starts the game engine on this page or in a Web Worker
+//
+// Worker mode hands the canvases to the worker with transferControlToOffscreen(),
+// so a busy page can't stall the game. It's opt-in (?worker=1, or the build's
+// data-worker="on") and falls back to running the engine here when the browser
+// can't draw to an OffscreenCanvas from a worker.
+(() => {
+    const host = document.currentScript;
+    const canvas = document.getElementById('gameCanvas');
+    // The world canvas plus the backdrop and HUD layers stacked with it
+    const LAYERS = ['gameCanvas', 'backdropCanvas', 'hudCanvas'];
+    const overlay = document.getElementById('overlay');
+    const params = new URLSearchParams(location.search);
+    const wanted = params.has('worker') ? params.get('worker') !== '0' : host.dataset.worker === 'on';
+
+    // Keys whose browser default (scrolling, back navigation, find-as-you-type) the game overrides
+    const GAME_KEYS = ['ArrowUp', 'ArrowDown', 'ArrowLeft', 'ArrowRight', ' ', 'Enter', 'Backspace', 'Escape', 'F3'];
+
+    // Bundle text for the single-file page, which carries the engine inline
+    function engineSource() {
+        return document.getElementById('gameEngine').textContent;
+    }
+
+    function workerSupported() {
+        if (typeof Worker === 'undefined' || typeof OffscreenCanvas === 'undefined') return false;
+        if (!('transferControlToOffscreen' in canvas)) return false;
+        try {
+            return !!new OffscreenCanvas(1, 1).getContext('2d');
+        } catch (e) {
+            return false;
+        }
+    }
+
+    // Run the engine on the page, exactly as a plain <script> would
+    function runOnPage() {
+        const script = document.createElement('script');
+        if (host.dataset.engine) {
+            script.src = host.dataset.engine;
+        } else {
+            script.textContent = engineSource();
+        }
+        document.body.appendChild(script);
+    }
+
+    function runInWorker() {
+        const engine = host.dataset.engine
+            ? new URL(host.dataset.engine, location.href).href
+            : URL.createObjectURL(new Blob([engineSource()], { type: 'text/javascript' }));
+        // Tiny bootstrap so the canvases are in place before the engine's first line runs
+        const boot = 'onmessage = (e) => { onmessage = null; Object.assign(self, e.data.globals); importScripts(e.data.engine); };';
+        const worker = new Worker(URL.createObjectURL(new Blob([boot], { type: 'text/javascript' })));
+        // Workers have no devicePixelRatio or page URL of their own, so the page's are passed along
+        const globals = { devicePixelRatio: window.devicePixelRatio || 1, pageSearch: location.search };
+        const canvases = LAYERS.map(id => {
+            globals[id] = document.getElementById(id).transferControlToOffscreen();
+            return globals[id];
+        });
+        worker.postMessage({ globals, engine }, canvases);
+
+        // Every page listener that forwards input, so a fallback can take them all off again
+        const listeners = [];
+        function listen(target, type, handler) {
+            target.addEventListener(type, handler);
+            listeners.push([target, type, handler]);
+        }
+
+        let started = false;
+        worker.onmessage = (e) => {
+            const message = e.data;
+            if (message.type === 'ready') {
+                started = true;
+            } else if (message.type === 'overlay') {
+                if (message.title === null) {
+                    overlay.style.display = 'none';
+                } else {
+                    document.getElementById('overlayTitle').textContent = message.title;
+                    document.getElementById('overlayScore').innerHTML = message.html;
+                    overlay.style.display = 'flex';
+                }
+            }
+        };
+        // The engine never started (e.g. a CSP blocked it) - give the page fresh canvases and run it here
+        worker.onerror = () => {
+            if (started) return;
+            worker.terminate();
+            listeners.forEach(([target, type, handler]) => target.removeEventListener(type, handler));
+            LAYERS.forEach(id => {
+                const transferred = document.getElementById(id);
+                transferred.replaceWith(transferred.cloneNode());
+            });
+            runOnPage();
+        };
+
+        listen(document, 'keydown', (e) => {
+            worker.postMessage({ type: 'keydown', key: e.key });
+            const typed = e.key.length === 1 && !e.ctrlKey && !e.metaKey && !e.altKey;
+            if (GAME_KEYS.includes(e.key) || typed) e.preventDefault();
+        });
+        listen(document, 'keyup', (e) => worker.postMessage({ type: 'keyup', key: e.key }));
+
+        // Mobile controls
+        [['btnLeft', 'left'], ['btnRight', 'right'], ['btnJump', 'jump']].forEach(([id, key]) => {
+            const button = document.getElementById(id);
+            listen(button, 'touchstart', (e) => {
+                e.preventDefault();
+                worker.postMessage({ type: 'touch', key, pressed: true });
+            });
+            listen(button, 'touchend', (e) => {
+                e.preventDefault();
+                worker.postMessage({ type: 'touch', key, pressed: false });
+            });
+        });
+
+        listen(canvas, 'click', (e) => {
+            const rect = canvas.getBoundingClientRect();
+            worker.postMessage({ type: 'click', x: e.clientX - rect.left, y: e.clientY - rect.top });
+            canvas.focus();
+        });
+    }
+
+    if (wanted && workerSupported()) {
+        runInWorker();
+    } else {
+        runOnPage();
+    }
+})();
@@ -0,0 +1,82 @@
+// ⚡ Broadphase - a uniform grid over the view, rebuilt each step, so a collision
+// check only tests the entities sharing its cells instead of every entity
+
+const GRID_CELL = 64;
+
+// Entries are kept in typed arrays as linked lists per cell, so rebuilding allocates nothing
+const broadphase = {
+    left: 0,
+    top: 0,
+    cols: 0,
+    rows: 0,
+    heads: new Int32Array(0),       // Cell -> its first entry, or -1
+    next: new Int32Array(256),      // Entry -> next entry in the same cell, or -1
+    firstCol: new Int32Array(256),  // Entry -> first column/row its entity covers
+    firstRow: new Int32Array(256),
+    items: [],                      // Entry -> entity
+    count: 0,
+};
+
+// Empty the grid and make it cover the given world rectangle
+function clearBroadphase(left, top, width, height) {
+    const grid = broadphase;
+    grid.left = left;
+    grid.top = top;
+    grid.cols = Math.ceil(width / GRID_CELL);
+    grid.rows = Math.ceil(height / GRID_CELL);
+    const cells = grid.cols * grid.rows;
+    if (grid.heads.length < cells) grid.heads = new Int32Array(cells);
+    grid.heads.fill(-1, 0, cells);
+    grid.items.length = 0;
+    grid.count = 0;
+}
+
+function growBroadphase() {
+    const grid = broadphase;
+    const size = grid.next.length * 2;
+    ['next', 'firstCol', 'firstRow'].forEach(name => {
+        const grown = new Int32Array(size);
+        grown.set(grid[name]);
+        grid[name] = grown;
+    });
+}
+
+// Add an entity with the given bounding box to every cell it touches
+function insertBroadphase(item, x, y, width, height) {
+    const grid = broadphase;
+    const c0 = Math.max(0, Math.floor((x - grid.left) / GRID_CELL));
+    const c1 = Math.min(grid.cols - 1, Math.floor((x + width - grid.left) / GRID_CELL));
+    const r0 = Math.max(0, Math.floor((y - grid.top) / GRID_CELL));
+    const r1 = Math.min(grid.rows - 1, Math.floor((y + height - grid.top) / GRID_CELL));
+    for (let r = r0; r <= r1; r++) {
+        for (let c = c0; c <= c1; c++) {
+            if (grid.count === grid.next.length) growBroadphase();
+            const entry = grid.count++;
+            const cell = r * grid.cols + c;
+            grid.items[entry] = item;
+            grid.firstCol[entry] = c0;
+            grid.firstRow[entry] = r0;
+            grid.next[entry] = grid.heads[cell];
+            grid.heads[cell] = entry;
+        }
+    }
+}
+
+// Call visit(item) once for each entity sharing a cell with the rectangle. The
+// caller still does the exact overlap test; returning true from visit stops the query
+function queryBroadphase(x, y, width, height, visit) {
+    const grid = broadphase;
+    const c0 = Math.max(0, Math.floor((x - grid.left) / GRID_CELL));
+    const c1 = Math.min(grid.cols - 1, Math.floor((x + width - grid.left) / GRID_CELL));
+    const r0 = Math.max(0, Math.floor((y - grid.top) / GRID_CELL));
+    const r1 = Math.min(grid.rows - 1, Math.floor((y + height - grid.top) / GRID_CELL));
+    for (let r = r0; r <= r1; r++) {
+        for (let c = c0; c <= c1; c++) {
+            for (let entry = grid.heads[r * grid.cols + c]; entry >= 0; entry = grid.next[entry]) {
+                // An entity in several of these cells is reported from the first one only
+                if (Math.max(grid.firstCol[entry], c0) !== c || Math.max(grid.firstRow[entry], r0) !== r) continue;
+                if (visit(grid.items[entry])) return;
+            }
+        }
+    }
+}
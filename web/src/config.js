@@ -0,0 +1,282 @@
+// ⚡ Canvas, tuning constants, colour palettes and shared game state
+
+// In worker mode the page hands over its canvas and keeps the overlay (see thread.js)
+const canvas = IN_WORKER ? self.gameCanvas : document.getElementById('gameCanvas');
+// Size of the view in game units - the canvases' pixel size follows the render scale (see resolution.js)
+const VIEW_WIDTH = canvas.width;
+const VIEW_HEIGHT = canvas.height;
+// The context draw functions paint into - the world canvas's, unless drawToLayer (layers.js) swaps it
+let ctx = canvas.getContext('2d');
+const overlay = IN_WORKER ? null : document.getElementById('overlay');
+const overlayTitle = IN_WORKER ? null : document.getElementById('overlayTitle');
+const overlayScore = IN_WORKER ? null : document.getElementById('overlayScore');
+
+// Game constants (tuned for comfortable gameplay - 60% speed)
+const GRAVITY = 0.35;
+const JUMP_STRENGTH = -10;
+const PLAYER_SPEED = 2.1;
+
+// World size (scrollable level)
+const WORLD_WIDTH = 3000;
+let cameraX = 0;
+
+// Colors - TRON aesthetic (Level 1)
+const COLORS_L1 = {
+    skyTop: '#000000',
+    skyBottom: '#0a0a1a',
+    ground: '#0a0a0a',
+    grass: '#00FFFF',
+    platform: '#111111',
+    platformTop: '#00FFFF',
+    neonCyan: '#00FFFF',
+    neonOrange: '#FF6600',
+    neonRed: '#FF0044',
+    gridLine: 'rgba(0, 255, 255, 0.15)'
+};
+
+// Colors - NYC Dimension (Level 2)
+const COLORS_L2 = {
+    skyTop: '#1a1a2e',
+    skyBottom: '#2d132c',
+    ground: '#1a1a1a',
+    grass: '#FFD700',
+    platform: '#2a2a2a',
+    platformTop: '#FFD700',
+    neonCyan: '#FFD700',
+    neonOrange: '#FF4500',
+    neonRed: '#FF1744',
+    gridLine: 'rgba(255, 215, 0, 0.1)'
+};
+
+// Colors - Space Dimension (Level 3)
+const COLORS_L3 = {
+    skyTop: '#000011',
+    skyBottom: '#000033',
+    ground: '#000000',
+    grass: '#00FFAA',
+    platform: '#111122',
+    platformTop: '#00FFAA',
+    neonCyan: '#00FFFF',
+    neonOrange: '#FF6600',
+    neonRed: '#FF0066',
+    gridLine: 'rgba(0, 255, 170, 0.1)'
+};
+
+// Colors - Light Cycle Arena (Level 4)
+const COLORS_L4 = {
+    skyTop: '#000005',
+    skyBottom: '#000020',
+    ground: '#000000',
+    grass: '#00DDFF',
+    platform: '#0a0a1a',
+    platformTop: '#00DDFF',
+    neonCyan: '#00FFFF',
+    neonOrange: '#FF8800',
+    neonRed: '#FF0044',
+    gridLine: 'rgba(0, 221, 255, 0.3)'
+};
+
+// Current colors (changes based on level)
+let COLORS = {
+    skyTop: '#000000',
+    skyBottom: '#0a0a1a',
+    ground: '#0a0a0a',
+    grass: '#00FFFF',
+    platform: '#111111',
+    platformTop: '#00FFFF',
+    player: '#00FFFF',
+    playerFace: '#000000',
+    coin: '#FF6600',
+    coinShine: '#FFAA44',
+    enemy: '#FF0044',
+    flagPole: '#333333',
+    flag: '#00FFFF',
+    cloud: 'rgba(0, 255, 255, 0.1)',
+    text: '#00FFFF',
+    textShadow: '#004444',
+    gridLine: 'rgba(0, 255, 255, 0.15)',
+    neonCyan: '#00FFFF',
+    neonOrange: '#FF6600',
+    neonRed: '#FF0044',
+    neonWhite: '#FFFFFF',
+    neonPurple: '#AA00FF'
+};
+
+// Update colors based on level
+function updateLevelColors() {
+    let src = COLORS_L1;
+    if (currentLevel === 2) src = COLORS_L2;
+    else if (currentLevel === 3) src = COLORS_L3;
+    else if (currentLevel === 4) src = COLORS_L4;
+    
+    COLORS.skyTop = src.skyTop;
+    COLORS.skyBottom = src.skyBottom;
+    COLORS.ground = src.ground;
+    COLORS.grass = src.grass;
+    COLORS.platform = src.platform;
+    COLORS.platformTop = src.platformTop;
+    COLORS.gridLine = src.gridLine;
+}
+
+// Game state
+let gameState = 'title'; // 'title', 'character', 'playing', 'won', 'lost', 'transition'
+let score = 0;
+let animationFrame = 0;
+let playerName = '';
+let nameInputActive = false;
+let selectedCharacter = 0;
+let currentLevel = 1;
+let totalScore = 0; // Accumulated score across levels
+
+// Identity Disc weapon
+let disc = {
+    active: false,
+    x: 0,
+    y: 0,
+    velX: 0,
+    velY: 0,
+    returning: false,
+    rotation: 0
+};
+const DISC_SPEED = 12;
+const DISC_SIZE = 15;
+
+// Player health (Level 2 only)
+const MAX_HEALTH_L2 = 50;
+const MAX_HEALTH_L3 = 100;
+let playerHealth = MAX_HEALTH_L2;
+let invincibilityTimer = 0;
+
+function getMaxHealth() {
+    if (currentLevel === 4) return MAX_HEALTH_L4;
+    if (currentLevel === 3) return MAX_HEALTH_L3;
+    return MAX_HEALTH_L2;
+}
+
+// Enemy discs (Level 2 - enemies shoot at player)
+const enemyDiscs = createProjectiles(256);
+const ENEMY_DISC_SPEED = 5;
+const ENEMY_DISC_SIZE = 10;
+
+// Level 3 - Space Shooter variables
+const missiles = createProjectiles(256); // Player missiles
+let spaceDrones = []; // Enemy drones
+let spaceDespawned = 0; // Level 3 shots and drones despawned off screen
+let spaceDronesDropped = 0; // Level 3 drones refused because MAX_LIVE_DRONES were already live
+const MAX_LIVE_DRONES = 64;
+// Drone shots cross the view in about 2 s (130 steps), so 64 slots per drone let
+// bullet-hell waves fire every couple of steps without dropping shots
+const DRONE_SHOTS_PER_DRONE = 64;
+const droneProjectiles = createProjectiles(MAX_LIVE_DRONES * DRONE_SHOTS_PER_DRONE); // Drone shots
+let stars = []; // Background stars
+const MISSILE_SPEED = 10;
+const JET_SPEED = 3;
+let jetY = 250; // Jet vertical position
+let jetVelY = 0; // Jet vertical velocity
+const JET_WIDTH = 60;
+const JET_HEIGHT = 30;
+
+// Level 4 - Light Cycle Runner variables
+const NUM_LANES = 5;
+const LANE_HEIGHT = 70;
+const ROAD_TOP = 120;
+let currentLane = 2; // Start in middle lane (0-4)
+let lightCycleX = 100;
+let laneEnemies = [];
+const recognizerMissiles = createProjectiles(256);
+let roadOffset = 0;
+const LIGHT_CYCLE_WIDTH = 60;
+const LIGHT_CYCLE_HEIGHT = 35;
+const MAX_HEALTH_L4 = 150;
+let recognizerY = 0;
+let recognizerPhase = 0;
+
+// Available characters - TRON inspired programs
+const characters = [
+    { 
+        name: 'ARES', 
+        circuitColor: '#FF0044',
+        secondaryColor: '#AA0022',
+        description: 'Elite Grid Warrior',
+        helmetStyle: 'visor',
+        circuitPattern: 'angular'
+    },
+    { 
+        name: 'SIREN', 
+        circuitColor: '#FF6600',
+        secondaryColor: '#FF3300',
+        description: 'Rogue Program',
+        helmetStyle: 'sleek',
+        circuitPattern: 'flowing'
+    },
+    { 
+        name: 'QUORRA', 
+        circuitColor: '#FFFFFF',
+        secondaryColor: '#88CCFF',
+        description: 'The Last ISO',
+        helmetStyle: 'open',
+        circuitPattern: 'organic'
+    },
+    { 
+        name: 'RINZLER', 
+        circuitColor: '#00FFFF',
+        secondaryColor: '#0088FF',
+        description: 'Repurposed Warrior',
+        helmetStyle: 'full',
+        circuitPattern: 'aggressive'
+    },
+    { 
+        name: 'GEM', 
+        circuitColor: '#AA00FF',
+        secondaryColor: '#FF00AA',
+        description: 'Siren Program',
+        helmetStyle: 'elegant',
+        circuitPattern: 'symmetric'
+    },
+    { 
+        name: 'CASTOR', 
+        circuitColor: '#FFFFFF',
+        secondaryColor: '#AAAAAA',
+        description: 'End of Line Club',
+        helmetStyle: 'stylish',
+        circuitPattern: 'flashy'
+    },
+    { 
+        name: 'FLYNN', 
+        circuitColor: '#00FFFF',
+        secondaryColor: '#00AAFF',
+        description: 'The Creator',
+        helmetStyle: 'classic',
+        circuitPattern: 'legacy'
+    },
+    { 
+        name: 'YORI', 
+        circuitColor: '#00FFFF',
+        secondaryColor: '#00FF88',
+        description: 'System Monitor',
+        helmetStyle: 'feminine',
+        circuitPattern: 'elegant'
+    }
+];
+
+// Input state
+const keys = {
+    left: false,
+    right: false,
+    jump: false,
+    down: false
+};
+
+// Player
+const player = {
+    x: 50,
+    y: 350,
+    width: 36,
+    height: 45,
+    velX: 0,
+    velY: 0,
+    onGround: false,
+    facingRight: true,
+    animFrame: 0,
+    animTimer: 0
+};
@@ -0,0 +1,115 @@
+// ⚡ Glow sprites - glowing shapes painted once with their blur baked in
+
+// Sprites keyed by shape, colour and animation state
+const glowSprites = new Map();
+const GLOW_SPRITE_LIMIT = 2048;   // Past this the cache starts over and repaints what it needs
+const GLOW_STEPS = 8;             // Pulsing glows snap to this many strengths
+
+// Snap an animated value to a few levels so pulsing shapes reuse their sprites
+function glowStep(value, steps = GLOW_STEPS) {
+    return Math.round(value * steps) / steps;
+}
+
+// Room around a shape for a shadowBlur of this size (the blur's sigma is half of it) -
+// none is needed when the quality tier bakes glows without blur
+function glowPad(blur) {
+    return quality.glow ? Math.ceil(blur * 1.5) + 4 : 4;
+}
+
+// The sprite for key, calling paint(g) to draw it the first time.
+// box is [left, top, width, height] of what paint draws around the origin, blur the largest shadowBlur it uses
+function glowSprite(key, box, blur, paint) {
+    let sprite = glowSprites.get(key);
+    if (!sprite) {
+        if (glowSprites.size >= GLOW_SPRITE_LIMIT) glowSprites.clear();
+        const [left, top, width, height] = box;
+        const pad = glowPad(blur);
+        const image = createOffscreen(Math.ceil(width) + pad * 2, Math.ceil(height) + pad * 2);
+        const g = image.getContext('2d');
+        g.translate(pad - left, pad - top);
+        paint(g);
+        sprite = { image, dx: left - pad, dy: top - pad };
+        glowSprites.set(key, sprite);
+    }
+    return sprite;
+}
+
+// Blit a sprite with its origin at (x, y)
+function blitGlow(sprite, x, y) {
+    drawOffscreen(sprite.image, Math.round(x + sprite.dx), Math.round(y + sprite.dy));
+}
+
+function drawGlowSprite(key, x, y, box, blur, paint) {
+    blitGlow(glowSprite(key, box, blur, paint), x, y);
+}
+
+// Glowing filled rectangle of any width - both ends come from one sprite and the middle is stretched
+function drawGlowBar(x, y, width, height, color, blur) {
+    width = Math.round(width);
+    if (width <= 0) return;
+    const pad = glowPad(blur);
+    // Short bars get a sprite each; longer ones share a bar one column wider than its two blurred
+    // ends, whose middle column is as bright as the middle of any long bar
+    const short = width <= pad * 2;
+    const core = short ? width : pad * 2 + 1;
+    const sprite = glowSprite(`bar:${core}:${height}:${color}:${blur}`, [0, 0, core, height], blur, g => {
+        g.shadowColor = color;
+        g.shadowBlur = blur;
+        g.fillStyle = color;
+        g.fillRect(0, 0, core, height);
+    });
+    if (short) {
+        blitGlow(sprite, x, y);
+        return;
+    }
+
+    const image = sprite.image;
+    const imageHeight = image.viewHeight;
+    const left = Math.round(x);
+    const top = Math.round(y) - pad;
+    const end = pad * 2;
+    drawOffscreenPart(image, 0, 0, end, imageHeight, left - pad, top, end, imageHeight);
+    drawOffscreenPart(image, end, 0, 1, imageHeight, left + pad, top, width - end, imageHeight);
+    drawOffscreenPart(image, end + 1, 0, end, imageHeight, left + width - pad, top, end, imageHeight);
+}
+
+// Glowing outline of a rectangle
+function drawGlowRect(x, y, width, height, color, blur, lineWidth) {
+    const key = `rect:${width}:${height}:${color}:${blur}:${lineWidth}`;
+    const edge = lineWidth / 2;
+    drawGlowSprite(key, x, y, [-edge, -edge, width + lineWidth, height + lineWidth], blur, g => {
+        g.shadowColor = color;
+        g.shadowBlur = blur;
+        g.strokeStyle = color;
+        g.lineWidth = lineWidth;
+        g.strokeRect(0, 0, width, height);
+    });
+}
+
+// Glowing text in the current font and alignment
+function drawGlowText(text, x, y, color, blur) {
+    const font = ctx.font;
+    const align = ctx.textAlign;
+    const key = `text:${font}:${align}:${color}:${blur}:${text}`;
+    let sprite = glowSprites.get(key);
+    if (!sprite) {
+        const match = /(\d+(\.\d+)?)px/.exec(font);
+        const size = match ? parseFloat(match[1]) : 16;
+        const width = ctx.measureText(text).width;
+        const left = align === 'center' ? -width / 2 : (align === 'right' || align === 'end') ? -width : 0;
+        sprite = glowSprite(key, [left, -size, width, size * 1.4], blur, g => {
+            g.font = font;
+            g.textAlign = align;
+            g.shadowColor = color;
+            g.shadowBlur = blur;
+            g.fillStyle = color;
+            g.fillText(text, 0, 0);
+        });
+    }
+    blitGlow(sprite, x, y);
+}
+
+// Forget every glow sprite - needed when the canvas resolution or quality tier changes
+function clearGlowSprites() {
+    glowSprites.clear();
+}
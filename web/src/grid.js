@@ -0,0 +1,935 @@
+// ⚡ Grid platformer - sky, platforms, player, disc, coins and enemies
+
+// Draw TRON grid background
+function drawSky() {
+    drawOffscreen(cachedLayer('sky', VIEW_WIDTH, VIEW_HEIGHT, paintSky), 0, 0);
+}
+
+// Paint the sky and perspective grid into a cached layer
+function paintSky(g) {
+    // Dark gradient background
+    const gradient = g.createLinearGradient(0, 0, 0, VIEW_HEIGHT);
+    gradient.addColorStop(0, '#000000');
+    gradient.addColorStop(0.5, '#050510');
+    gradient.addColorStop(1, '#0a0a1a');
+    g.fillStyle = gradient;
+    g.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    
+    // Draw perspective grid floor
+    g.strokeStyle = COLORS.gridLine;
+    g.lineWidth = 1;
+    
+    // Horizontal lines (perspective)
+    for (let y = 300; y < VIEW_HEIGHT; y += 20) {
+        const intensity = (y - 300) / 200;
+        g.strokeStyle = `rgba(0, 255, 255, ${0.05 + intensity * 0.15})`;
+        g.beginPath();
+        g.moveTo(0, y);
+        g.lineTo(VIEW_WIDTH, y);
+        g.stroke();
+    }
+    
+    // Vertical grid lines
+    const gridSpacing = 80;
+    for (let x = -gridSpacing; x < VIEW_WIDTH + gridSpacing; x += gridSpacing) {
+        g.strokeStyle = 'rgba(0, 255, 255, 0.1)';
+        g.beginPath();
+        g.moveTo(x, 300);
+        g.lineTo(x, VIEW_HEIGHT);
+        g.stroke();
+    }
+}
+
+// Draw distant city/structures (TRON style)
+function drawHills() {
+    drawOffscreen(cachedLayer('hills', VIEW_WIDTH, VIEW_HEIGHT, paintHills), 0, 0);
+}
+
+// Paint the skyline once per level - its random heights stay put, even when repainted
+function paintHills(g) {
+    const rand = paintRandom();
+    // Distant buildings/structures silhouette
+    g.fillStyle = '#0a0a15';
+    g.beginPath();
+    g.moveTo(0, 350);
+    // Create angular building shapes
+    for (let x = 0; x < VIEW_WIDTH; x += 60) {
+        const height = 280 + Math.sin(x * 0.05) * 40 + rand() * 20;
+        g.lineTo(x, height);
+        g.lineTo(x + 30, height - 20);
+        g.lineTo(x + 60, height + 10);
+    }
+    g.lineTo(VIEW_WIDTH, 350);
+    g.lineTo(VIEW_WIDTH, VIEW_HEIGHT);
+    g.lineTo(0, VIEW_HEIGHT);
+    g.closePath();
+    g.fill();
+    
+    // Glowing edges on buildings
+    g.strokeStyle = 'rgba(0, 255, 255, 0.3)';
+    g.lineWidth = 1;
+    g.stroke();
+}
+
+// Draw data streams (instead of clouds)
+function drawClouds() {
+    ctx.strokeStyle = COLORS.cloud;
+    ctx.lineWidth = 2;
+    clouds.forEach(cloud => {
+        const { x, y, size } = cloud;
+        // Draw data stream / light ribbon
+        ctx.beginPath();
+        ctx.moveTo(x, y);
+        ctx.lineTo(x + size * 2, y);
+        ctx.lineTo(x + size * 2.5, y + 3);
+        ctx.lineTo(x + size * 0.5, y + 3);
+        ctx.closePath();
+        ctx.strokeStyle = `rgba(0, 255, 255, ${0.2 + Math.sin(simTime / 500 + x) * 0.1})`;
+        ctx.stroke();
+    });
+}
+
+// Draw platform - TRON style
+function drawPlatform(p) {
+    if (currentLevel === 1) {
+        // Level 1: TRON Grid style
+        ctx.fillStyle = '#0a0a0a';
+        ctx.fillRect(p.x, p.y, p.width, p.height);
+        
+        drawGlowBar(p.x, p.y, p.width, 3, COLORS.grass, 10);
+        
+        ctx.strokeStyle = `${COLORS.grass}50`;
+        ctx.lineWidth = 1;
+        
+        for (let y = p.y + 8; y < p.y + p.height - 4; y += 8) {
+            ctx.beginPath();
+            ctx.moveTo(p.x + 4, y);
+            ctx.lineTo(p.x + p.width - 4, y);
+            ctx.stroke();
+        }
+        
+        ctx.strokeStyle = `${COLORS.grass}80`;
+        ctx.beginPath();
+        ctx.moveTo(p.x + 2, p.y + 3);
+        ctx.lineTo(p.x + 2, p.y + p.height);
+        ctx.stroke();
+        ctx.beginPath();
+        ctx.moveTo(p.x + p.width - 2, p.y + 3);
+        ctx.lineTo(p.x + p.width - 2, p.y + p.height);
+        ctx.stroke();
+        
+        ctx.fillStyle = COLORS.grass;
+        ctx.fillRect(p.x, p.y + p.height - 2, 6, 2);
+        ctx.fillRect(p.x + p.width - 6, p.y + p.height - 2, 6, 2);
+    } else {
+        // Level 2: NYC Rooftop/Fire escape style
+        // Building/rooftop base
+        ctx.fillStyle = '#1a1a1a';
+        ctx.fillRect(p.x, p.y, p.width, p.height);
+        
+        // Darker top edge (rooftop ledge)
+        ctx.fillStyle = '#2a2a2a';
+        ctx.fillRect(p.x, p.y, p.width, 4);
+        
+        // Yellow safety stripe on edge (fire escape/rooftop style)
+        drawGlowBar(p.x, p.y, p.width, 2, '#FFD700', 5);
+        
+        // Brick/metal texture
+        ctx.strokeStyle = 'rgba(255, 215, 0, 0.15)';
+        ctx.lineWidth = 1;
+        for (let brickY = p.y + 8; brickY < p.y + p.height - 4; brickY += 10) {
+            for (let brickX = p.x + 3; brickX < p.x + p.width - 6; brickX += 20) {
+                ctx.strokeRect(brickX, brickY, 16, 8);
+            }
+        }
+        
+        // Graffiti accent (random position)
+        if (p.width > 80) {
+            ctx.fillStyle = 'rgba(255, 69, 0, 0.4)';
+            ctx.fillRect(p.x + 20, p.y + 15, 30, 3);
+        }
+        
+        // Metal bolts at corners
+        ctx.fillStyle = '#444';
+        ctx.fillRect(p.x + 4, p.y + 6, 4, 4);
+        ctx.fillRect(p.x + p.width - 8, p.y + 6, 4, 4);
+    }
+}
+
+// Draw player - TRON 8-bit style with circuit patterns
+function drawPlayer() {
+    const { x, y, width, facingRight } = player;
+    const circuitColor = characters[selectedCharacter].circuitColor || '#00FFFF';
+    
+    // Flash when invincible (Level 2)
+    if (currentLevel === 2 && invincibilityTimer > 0) {
+        if (Math.floor(invincibilityTimer / 5) % 2 === 0) {
+            return; // Skip drawing every other 5 frames for flashing effect
+        }
+    }
+    
+    // Draw player name above character
+    if (playerName) {
+        ctx.font = 'bold 12px "Courier New", monospace';
+        const nameWidth = ctx.measureText(playerName).width + 20;
+        drawGlowSprite(`nametag:${playerName}:${circuitColor}`, x + width/2, y,
+            [-nameWidth/2, -28, nameWidth, 18], 8, g => paintNameTag(g, playerName, nameWidth, circuitColor));
+    }
+    
+    drawCharacterFrame(selectedCharacter, facingRight ? 'right' : 'left', x, y);
+}
+
+// Paint the name tag centred above (0, 0)
+function paintNameTag(g, name, nameWidth, circuitColor) {
+    g.font = 'bold 12px "Courier New", monospace';
+    g.textAlign = 'center';
+    
+    // Dark background with circuit border
+    g.fillStyle = 'rgba(0, 0, 0, 0.9)';
+    g.fillRect(-nameWidth/2, -28, nameWidth, 18);
+    
+    // Glowing border
+    g.shadowColor = circuitColor;
+    g.shadowBlur = 8;
+    g.strokeStyle = circuitColor;
+    g.lineWidth = 1;
+    g.strokeRect(-nameWidth/2, -28, nameWidth, 18);
+    g.shadowBlur = 0;
+    
+    // Name text with glow
+    g.shadowColor = circuitColor;
+    g.shadowBlur = 6;
+    g.fillStyle = circuitColor;
+    g.fillText(name.toUpperCase(), 0, -14);
+    g.shadowBlur = 0;
+}
+
+// Paint a character with the top-left corner of the player's hitbox at (0, 0) - baked into the character atlas
+function paintPlayer(g, char, width, height, facingRight) {
+    const circuitColor = char.circuitColor || '#00FFFF';
+    const secondaryColor = char.secondaryColor || '#0088FF';
+    
+    // Glow effect on ground
+    g.shadowColor = circuitColor;
+    g.shadowBlur = 15;
+    g.fillStyle = `rgba(${hexToRgb(circuitColor)}, 0.3)`;
+    g.beginPath();
+    g.ellipse(width/2, height + 2, 14, 4, 0, 0, Math.PI * 2);
+    g.fill();
+    g.shadowBlur = 0;
+    
+    // === 8-BIT TRON BODY ===
+    const px = 3; // pixel size for 8-bit look
+    
+    // Body base (dark suit)
+    g.fillStyle = '#0a0a0a';
+    
+    // Torso (blocky 8-bit)
+    g.fillRect(6, 14, 24, 28);
+    
+    // Head (blocky)
+    g.fillRect(8, 0, 20, 16);
+    
+    // Legs
+    g.fillRect(8, 42, 8, 12);
+    g.fillRect(20, 42, 8, 12);
+    
+    // === CIRCUIT LINES (glowing) ===
+    g.shadowColor = circuitColor;
+    g.shadowBlur = 8;
+    g.strokeStyle = circuitColor;
+    g.fillStyle = circuitColor;
+    g.lineWidth = 2;
+    
+    // Helmet visor
+    if (char.helmetStyle === 'full' || char.helmetStyle === 'visor') {
+        // T-shaped visor
+        g.fillRect(10, 6, 16, 3);
+        g.fillRect(16, 6, 4, 8);
+    } else if (char.helmetStyle === 'sleek' || char.helmetStyle === 'elegant') {
+        // Curved visor line
+        g.beginPath();
+        g.moveTo(10, 8);
+        g.lineTo(26, 8);
+        g.stroke();
+        // Eye dots
+        g.fillRect(12, 6, 3, 3);
+        g.fillRect(21, 6, 3, 3);
+    } else {
+        // Open face with eye line
+        g.fillRect(10, 5, 16, 2);
+    }
+    
+    // Torso circuits based on pattern
+    if (char.circuitPattern === 'angular' || char.circuitPattern === 'aggressive') {
+        // Angular circuit pattern
+        g.beginPath();
+        g.moveTo(18, 16);
+        g.lineTo(18, 24);
+        g.lineTo(10, 30);
+        g.lineTo(10, 38);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(18, 24);
+        g.lineTo(26, 30);
+        g.lineTo(26, 38);
+        g.stroke();
+    } else if (char.circuitPattern === 'flowing' || char.circuitPattern === 'organic') {
+        // Flowing pattern
+        g.beginPath();
+        g.moveTo(18, 16);
+        g.lineTo(18, 38);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(10, 22);
+        g.lineTo(26, 22);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(10, 32);
+        g.lineTo(26, 32);
+        g.stroke();
+    } else if (char.circuitPattern === 'symmetric' || char.circuitPattern === 'elegant') {
+        // Symmetric V pattern
+        g.beginPath();
+        g.moveTo(8, 18);
+        g.lineTo(18, 30);
+        g.lineTo(28, 18);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(18, 30);
+        g.lineTo(18, 40);
+        g.stroke();
+    } else {
+        // Default/legacy pattern
+        g.beginPath();
+        g.moveTo(18, 16);
+        g.lineTo(18, 40);
+        g.stroke();
+        g.fillRect(8, 26, 20, 2);
+    }
+    
+    // Shoulder accents
+    g.fillRect(4, 16, 4, 2);
+    g.fillRect(28, 16, 4, 2);
+    
+    // Arm circuits
+    g.fillRect(4, 20, 2, 16);
+    g.fillRect(30, 20, 2, 16);
+    
+    // Leg circuits
+    g.fillRect(10, 44, 2, 8);
+    g.fillRect(24, 44, 2, 8);
+    
+    // Boot tops
+    g.fillRect(8, 50, 8, 2);
+    g.fillRect(20, 50, 8, 2);
+    
+    // Identity disc on back (secondary color)
+    g.strokeStyle = secondaryColor;
+    g.shadowColor = secondaryColor;
+    g.beginPath();
+    if (facingRight) {
+        g.arc(6, 26, 5, 0, Math.PI * 2);
+    } else {
+        g.arc(30, 26, 5, 0, Math.PI * 2);
+    }
+    g.stroke();
+    
+    g.shadowBlur = 0;
+}
+
+// Helper to convert hex to rgb
+function hexToRgb(hex) {
+    const result = /^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i.exec(hex);
+    return result ? 
+        `${parseInt(result[1], 16)}, ${parseInt(result[2], 16)}, ${parseInt(result[3], 16)}` : 
+        '0, 255, 255';
+}
+
+// Draw triangular identity disc
+function drawDisc() {
+    if (!disc.active) return;
+    
+    const char = characters[selectedCharacter];
+    const discColor = char.circuitColor || '#00FFFF';
+    
+    ctx.save();
+    ctx.translate(disc.x, disc.y);
+    ctx.rotate(disc.rotation);
+    drawGlowSprite(`disc:${discColor}`, 0, 0, [-DISC_SIZE, -DISC_SIZE, DISC_SIZE * 2, DISC_SIZE * 2], 15,
+        g => paintDisc(g, discColor));
+    ctx.restore();
+}
+
+// Paint the disc centred on (0, 0)
+function paintDisc(g, discColor) {
+    // Glow
+    g.shadowColor = discColor;
+    g.shadowBlur = 15;
+    
+    // Triangular disc shape
+    g.fillStyle = discColor;
+    g.beginPath();
+    g.moveTo(0, -DISC_SIZE);
+    g.lineTo(DISC_SIZE * 0.866, DISC_SIZE * 0.5);
+    g.lineTo(-DISC_SIZE * 0.866, DISC_SIZE * 0.5);
+    g.closePath();
+    g.fill();
+    
+    // Inner triangle (darker)
+    g.fillStyle = '#000';
+    g.beginPath();
+    g.moveTo(0, -DISC_SIZE * 0.5);
+    g.lineTo(DISC_SIZE * 0.433, DISC_SIZE * 0.25);
+    g.lineTo(-DISC_SIZE * 0.433, DISC_SIZE * 0.25);
+    g.closePath();
+    g.fill();
+    
+    // Center energy core
+    g.fillStyle = discColor;
+    g.beginPath();
+    g.arc(0, 0, 3, 0, Math.PI * 2);
+    g.fill();
+}
+
+// Throw disc
+function throwDisc() {
+    if (disc.active) return; // Can only throw one at a time
+    
+    disc.active = true;
+    disc.x = player.x + player.width / 2;
+    disc.y = player.y + player.height / 2;
+    // Drawn from here on its first step, not slid over from where it was caught
+    disc.prevX = disc.x;
+    disc.prevY = disc.y;
+    disc.velX = player.facingRight ? DISC_SPEED : -DISC_SPEED;
+    disc.velY = 0;
+    disc.returning = false;
+    disc.rotation = 0;
+}
+
+// Update disc
+function updateDisc() {
+    if (!disc.active) return;
+    
+    disc.rotation += 0.3;
+    
+    if (!disc.returning) {
+        disc.x += disc.velX;
+        
+        // Check if disc should return (max distance or hit wall)
+        const distFromPlayer = Math.abs(disc.x - (player.x + player.width / 2));
+        if (distFromPlayer > 300 || disc.x < cameraX - 50 || disc.x > cameraX + VIEW_WIDTH + 50) {
+            disc.returning = true;
+        }
+    } else {
+        // Return to player
+        const targetX = player.x + player.width / 2;
+        const targetY = player.y + player.height / 2;
+        const dx = targetX - disc.x;
+        const dy = targetY - disc.y;
+        const dist = Math.sqrt(dx * dx + dy * dy);
+        
+        if (dist < 20) {
+            disc.active = false;
+        } else {
+            disc.x += (dx / dist) * DISC_SPEED * 1.2;
+            disc.y += (dy / dist) * DISC_SPEED * 1.2;
+        }
+    }
+    
+    // Check collision with enemies
+    checkDiscEnemyCollision();
+}
+
+// Check disc collision with enemies
+function checkDiscEnemyCollision() {
+    const discRect = { x: disc.x - DISC_SIZE, y: disc.y - DISC_SIZE, width: DISC_SIZE * 2, height: DISC_SIZE * 2 };
+    
+    // Check Level 1 enemies
+    for (let i = enemies.length - 1; i >= 0; i--) {
+        if (checkCollision(discRect, enemies[i])) {
+            enemies[i].health--;
+            if (enemies[i].health <= 0) {
+                enemies.splice(i, 1);
+                score += 10;
+            }
+            disc.returning = true;
+        }
+    }
+    
+    // Check turtles
+    for (let i = turtles.length - 1; i >= 0; i--) {
+        if (checkCollision(discRect, turtles[i])) {
+            turtles[i].health--;
+            if (turtles[i].health <= 0) {
+                turtles.splice(i, 1);
+                score += 15;
+            }
+            disc.returning = true;
+        }
+    }
+    
+    // Check NYC enemies (Level 2)
+    for (let i = nycEnemies.length - 1; i >= 0; i--) {
+        if (checkCollision(discRect, nycEnemies[i])) {
+            nycEnemies[i].health--;
+            if (nycEnemies[i].health <= 0) {
+                const bonus = nycEnemies[i].type === 'boss' ? 100 : 25;
+                score += bonus;
+                nycEnemies.splice(i, 1);
+            }
+            disc.returning = true;
+        }
+    }
+}
+
+// Draw energy bit (TRON style coin)
+function drawCoin(coin) {
+    if (coin.collected) return;
+    
+    const floatY = coin.y + Math.sin(simTime / 200 + coin.offset) * 3;
+    const pulse = glowStep(0.8 + Math.sin(simTime / 150 + coin.offset) * 0.2);
+    
+    drawGlowSprite(`coin:${pulse}`, coin.x, floatY, [0, 0, 22, 22], 15 * pulse, g => paintCoin(g, pulse));
+}
+
+// Paint an energy bit with its top-left corner at (0, 0)
+function paintCoin(g, pulse) {
+    // Outer glow
+    g.shadowColor = COLORS.neonOrange;
+    g.shadowBlur = 15 * pulse;
+    
+    // Diamond/bit shape (8-bit style)
+    g.fillStyle = COLORS.neonOrange;
+    g.beginPath();
+    g.moveTo(11, 0);
+    g.lineTo(22, 11);
+    g.lineTo(11, 22);
+    g.lineTo(0, 11);
+    g.closePath();
+    g.fill();
+    
+    // Inner diamond
+    g.fillStyle = '#000';
+    g.beginPath();
+    g.moveTo(11, 4);
+    g.lineTo(18, 11);
+    g.lineTo(11, 18);
+    g.lineTo(4, 11);
+    g.closePath();
+    g.fill();
+    
+    // Center dot
+    g.fillStyle = COLORS.neonOrange;
+    g.fillRect(9, 9, 4, 4);
+}
+
+// Draw enemy - TRON corrupted program / virus
+function drawEnemy(enemy) {
+    const { x, y, width, height, animFrame } = enemy;
+    const glitch = Math.round(Math.sin(simTime / 100) * 2);
+    const pulse = glowStep(0.7 + Math.sin(simTime / 150) * 0.3);
+    
+    drawGlowSprite(`enemy:${width}:${height}:${animFrame}:${glitch}:${pulse}`, x, y,
+        [-2, 0, width + 4, height + 6], 12, g => paintEnemy(g, width, height, animFrame, glitch, pulse));
+    
+    // Static/noise effect (random pixels)
+    for (let i = 0; i < 5; i++) {
+        const nx = x + 6 + Math.random() * (width - 12);
+        const ny = y + 6 + Math.random() * (height - 12);
+        drawGlowSprite(`enemy-noise:${pulse}`, nx, ny, [0, 0, 2, 2], 10 * pulse, g => {
+            g.shadowColor = COLORS.neonRed;
+            g.shadowBlur = 10 * pulse;
+            g.fillStyle = 'rgba(255, 0, 68, 0.5)';
+            g.fillRect(0, 0, 2, 2);
+        });
+    }
+}
+
+// Paint an enemy with its top-left corner at (0, 0)
+function paintEnemy(g, width, height, animFrame, glitch, pulse) {
+    // Ground glow
+    g.shadowColor = COLORS.neonRed;
+    g.shadowBlur = 12;
+    g.fillStyle = `rgba(255, 0, 68, 0.4)`;
+    g.beginPath();
+    g.ellipse(width/2, height + 2, width/2, 4, 0, 0, Math.PI * 2);
+    g.fill();
+    
+    // Body base (dark)
+    g.shadowBlur = 0;
+    g.fillStyle = '#0a0a0a';
+    g.fillRect(4, 4, width - 8, height - 8);
+    
+    // Corrupted circuit lines (red, glitchy)
+    g.shadowColor = COLORS.neonRed;
+    g.shadowBlur = 10 * pulse;
+    g.strokeStyle = COLORS.neonRed;
+    g.fillStyle = COLORS.neonRed;
+    g.lineWidth = 2;
+    
+    // Glitchy head pattern
+    g.fillRect(8 + glitch, 6, 22, 3);
+    g.fillRect(14, 6, 3, 10);
+    
+    // Body circuits (corrupted/broken pattern)
+    g.beginPath();
+    g.moveTo(6, 16);
+    g.lineTo(18 + glitch * 0.5, 20);
+    g.lineTo(6 + glitch, 30);
+    g.stroke();
+    
+    g.beginPath();
+    g.moveTo(width - 6, 16);
+    g.lineTo(width - 18 - glitch * 0.5, 20);
+    g.lineTo(width - 6 - glitch, 30);
+    g.stroke();
+    
+    // Center corruption symbol
+    g.fillRect(16, 18, 6, 6);
+    
+    // Glitchy legs
+    g.fillRect(8, height - 12, 3, 10);
+    g.fillRect(width - 11, height - 12 + (animFrame === 0 ? 2 : 0), 3, 10);
+    
+    // Error/corruption marks
+    g.fillRect(4, height - 4, 8, 2);
+    g.fillRect(width - 12, height - 4, 8, 2);
+}
+
+// Draw TRON tank/sentinel (replaces turtle)
+function drawTurtle(turtle) {
+    const { x, y, width, height, direction, animFrame, inShell } = turtle;
+    const hover = Math.sin(simTime / 200) * 2;
+    const pulse = glowStep(0.7 + Math.sin(simTime / 180) * 0.3);
+    
+    if (inShell) {
+        // Compact mode - just a spinning disc
+        drawGlowSprite(`turtle-shell:${width}:${height}`, x, y, [-2, -2, width + 4, height + 10], 12,
+            g => paintTurtleShell(g, width, height));
+        return;
+    }
+    
+    // Ground glow and treads stay put while the hull hovers above them
+    drawGlowSprite(`turtle-treads:${width}:${height}:${animFrame}`, x, y, [0, 0, width, height + 6], 12,
+        g => paintTurtleTreads(g, width, height, animFrame));
+    drawGlowSprite(`turtle-hull:${width}:${direction}:${pulse}`, x, y + hover, [0, 0, width, 38], 8 * pulse,
+        g => paintTurtleHull(g, width, direction, pulse));
+    
+    // Scanner/visor
+    const scannerWidth = Math.round(20 + Math.sin(simTime / 100) * 4);
+    drawGlowBar(x + (width - scannerWidth) / 2, y + 8 + hover, scannerWidth, 4, COLORS.neonPurple, 8 * pulse);
+    
+    // Tread accents
+    drawGlowSprite(`turtle-accents:${width}:${pulse}`, x, y + height - 6, [0, 0, width, 2], 8 * pulse, g => {
+        g.shadowColor = COLORS.neonPurple;
+        g.shadowBlur = 8 * pulse;
+        g.fillStyle = COLORS.neonPurple;
+        g.fillRect(2, 0, 6, 2);
+        g.fillRect(width - 8, 0, 6, 2);
+    });
+}
+
+// Ground glow under a tank
+function paintTurtleGlow(g, width, height) {
+    g.shadowColor = COLORS.neonPurple;
+    g.shadowBlur = 12;
+    g.fillStyle = `rgba(170, 0, 255, 0.4)`;
+    g.beginPath();
+    g.ellipse(width/2, height + 2, width/2, 4, 0, 0, Math.PI * 2);
+    g.fill();
+    g.shadowBlur = 0;
+}
+
+// Paint a tank in compact mode with its top-left corner at (0, 0)
+function paintTurtleShell(g, width, height) {
+    paintTurtleGlow(g, width, height);
+    g.fillStyle = '#0a0a0a';
+    g.beginPath();
+    g.ellipse(width/2, height/2, width/2, height/3, 0, 0, Math.PI * 2);
+    g.fill();
+    
+    g.shadowColor = COLORS.neonPurple;
+    g.shadowBlur = 10;
+    g.strokeStyle = COLORS.neonPurple;
+    g.lineWidth = 2;
+    g.stroke();
+}
+
+// Paint a tank's ground glow and treads with its top-left corner at (0, 0)
+function paintTurtleTreads(g, width, height, animFrame) {
+    paintTurtleGlow(g, width, height);
+    g.fillStyle = '#0a0a0a';
+    g.fillRect(0, height - 8, 10, 8);
+    g.fillRect(width - 10, height - 8 + (animFrame === 0 ? 2 : 0), 10, 8);
+}
+
+// Paint a tank's hull and circuits with its top-left corner at (0, 0)
+function paintTurtleHull(g, width, direction, pulse) {
+    // Main body (tank/recognizer shape)
+    g.fillStyle = '#0a0a0a';
+    
+    // Upper hull
+    g.beginPath();
+    g.moveTo(5, 15);
+    g.lineTo(width - 5, 15);
+    g.lineTo(width - 2, 25);
+    g.lineTo(2, 25);
+    g.closePath();
+    g.fill();
+    
+    // Lower hull
+    g.fillRect(4, 25, width - 8, 12);
+    
+    // Circuit lines
+    g.shadowColor = COLORS.neonPurple;
+    g.shadowBlur = 8 * pulse;
+    g.strokeStyle = COLORS.neonPurple;
+    g.fillStyle = COLORS.neonPurple;
+    g.lineWidth = 2;
+    
+    // Hull accent lines
+    g.beginPath();
+    g.moveTo(8, 18);
+    g.lineTo(width - 8, 18);
+    g.stroke();
+    
+    g.beginPath();
+    g.moveTo(6, 28);
+    g.lineTo(width - 6, 28);
+    g.stroke();
+    
+    // Direction indicator
+    const indX = direction > 0 ? width - 8 : 8;
+    g.fillRect(indX - 2, 20, 4, 8);
+    
+    // Energy core
+    g.beginPath();
+    g.arc(width / 2, 22, 4, 0, Math.PI * 2);
+    g.stroke();
+}
+
+// Draw exit portal (TRON style)
+function drawFlag() {
+    const { x, y, poleHeight, animTimer } = portal;
+    const pulse = glowStep(0.6 + Math.sin(animTimer / 8) * 0.4);
+    
+    drawGlowSprite(`portal:${poleHeight}:${pulse}`, x, y, [-15, 0, 80, poleHeight + 10], 30 * pulse,
+        g => paintPortal(g, poleHeight, pulse));
+    
+    // Scanning lines
+    for (let i = 0; i < 4; i++) {
+        const lineY = y + 40 + i * 25;
+        if (lineY < y + poleHeight - 10) {
+            const scanPulse = glowStep(Math.sin(animTimer / 5 + i) * 0.5 + 0.5);
+            drawGlowSprite(`portal-scan:${pulse}:${scanPulse}`, x + 16, lineY, [0, -1, 18, 2], 15 * pulse, g => {
+                g.shadowColor = COLORS.neonCyan;
+                g.shadowBlur = 15 * pulse;
+                g.strokeStyle = `rgba(0, 255, 255, ${scanPulse})`;
+                g.lineWidth = 1;
+                g.beginPath();
+                g.moveTo(0, 0);
+                g.lineTo(18, 0);
+                g.stroke();
+            });
+        }
+    }
+}
+
+// Paint the portal frame with its top-left corner at (0, 0)
+function paintPortal(g, poleHeight, pulse) {
+    // Portal glow on ground
+    g.shadowColor = COLORS.neonCyan;
+    g.shadowBlur = 30 * pulse;
+    g.fillStyle = `rgba(0, 255, 255, ${0.3 * pulse})`;
+    g.beginPath();
+    g.ellipse(25, poleHeight, 40, 10, 0, 0, Math.PI * 2);
+    g.fill();
+    
+    // Portal frame (angular)
+    g.fillStyle = '#0a0a0a';
+    g.beginPath();
+    g.moveTo(0, poleHeight);
+    g.lineTo(10, 0);
+    g.lineTo(40, 0);
+    g.lineTo(50, poleHeight);
+    g.closePath();
+    g.fill();
+    
+    // Portal circuits
+    g.shadowColor = COLORS.neonCyan;
+    g.shadowBlur = 15 * pulse;
+    g.strokeStyle = COLORS.neonCyan;
+    g.lineWidth = 3;
+    
+    // Outer frame
+    g.beginPath();
+    g.moveTo(2, poleHeight - 5);
+    g.lineTo(12, 5);
+    g.lineTo(38, 5);
+    g.lineTo(48, poleHeight - 5);
+    g.stroke();
+    
+    // Inner portal energy
+    g.fillStyle = `rgba(0, 255, 255, ${0.2 + pulse * 0.3})`;
+    g.beginPath();
+    g.moveTo(15, poleHeight - 20);
+    g.lineTo(18, 25);
+    g.lineTo(32, 25);
+    g.lineTo(35, poleHeight - 20);
+    g.closePath();
+    g.fill();
+    
+    // EXIT text - the scanning lines are drawn live on top, which looks
+    // the same since they're all one colour
+    g.fillStyle = COLORS.neonCyan;
+    g.font = 'bold 10px "Courier New", monospace';
+    g.textAlign = 'center';
+    g.fillText('EXIT', 25, 18);
+    
+    // Top accent
+    g.fillRect(20, 2, 10, 3);
+}
+
+// Collision detection
+function checkCollision(rect1, rect2) {
+    return rect1.x < rect2.x + rect2.width &&
+           rect1.x + rect1.width > rect2.x &&
+           rect1.y < rect2.y + rect2.height &&
+           rect1.y + rect1.height > rect2.y;
+}
+
+// Update player
+function updatePlayer() {
+    // Apply input
+    if (keys.left) {
+        player.velX = -PLAYER_SPEED;
+        player.facingRight = false;
+    } else if (keys.right) {
+        player.velX = PLAYER_SPEED;
+        player.facingRight = true;
+    } else {
+        player.velX = 0;
+    }
+    
+    if (keys.jump && player.onGround) {
+        player.velY = JUMP_STRENGTH;
+        player.onGround = false;
+    }
+    
+    // Apply gravity
+    player.velY += GRAVITY;
+    if (player.velY > 12) player.velY = 12;
+    
+    // Move horizontally
+    player.x += player.velX;
+    
+    // Check horizontal collisions - only platforms near the player (a push out of
+    // one platform can't carry it further than its own width)
+    forEachInRange(platforms, player.x - player.width, player.x + player.width * 2, p => {
+        if (checkCollision(player, p)) {
+            if (player.velX > 0) {
+                player.x = p.x - player.width;
+            } else if (player.velX < 0) {
+                player.x = p.x + p.width;
+            }
+        }
+    });
+    
+    // Move vertically
+    player.y += player.velY;
+    
+    // Check vertical collisions
+    player.onGround = false;
+    forEachInRange(platforms, player.x, player.x + player.width, p => {
+        if (checkCollision(player, p)) {
+            if (player.velY > 0) {
+                player.y = p.y - player.height;
+                player.velY = 0;
+                player.onGround = true;
+            } else if (player.velY < 0) {
+                player.y = p.y + p.height;
+                player.velY = 0;
+            }
+        }
+    });
+    
+    // World boundaries (extended level)
+    if (player.x < 0) player.x = 0;
+    if (player.x > WORLD_WIDTH - player.width) {
+        player.x = WORLD_WIDTH - player.width;
+    }
+    
+    // Update camera to follow player
+    const targetCameraX = player.x - VIEW_WIDTH / 3;
+    cameraX += (targetCameraX - cameraX) * 0.1; // Smooth camera follow
+    
+    // Clamp camera to world bounds
+    if (cameraX < 0) cameraX = 0;
+    if (cameraX > WORLD_WIDTH - VIEW_WIDTH) cameraX = WORLD_WIDTH - VIEW_WIDTH;
+    
+    // Fell off screen
+    if (player.y > VIEW_HEIGHT) {
+        gameOver();
+    }
+}
+
+// Update coins
+function updateCoins() {
+    // Coins are 22px wide but have no width of their own
+    forEachInRange(coins, player.x - 22, player.x + player.width, coin => {
+        if (!coin.collected) {
+            coin.frame = (coin.frame + 0.15) % 8;
+            
+            const coinRect = { x: coin.x, y: coin.y, width: 22, height: 22 };
+            if (checkCollision(player, coinRect)) {
+                coin.collected = true;
+                score++;
+            }
+        }
+    });
+}
+
+// Update enemies
+function updateEnemies() {
+    enemies.forEach(enemy => {
+        enemy.x += 0.8 * enemy.direction;  // Slower enemy movement
+        
+        if (enemy.x <= enemy.patrolLeft) enemy.direction = 1;
+        if (enemy.x >= enemy.patrolRight) enemy.direction = -1;
+        
+        enemy.animFrame = Math.floor(simTime / 200) % 2;
+    });
+    
+    // Update turtles
+    turtles.forEach(turtle => {
+        if (!turtle.inShell) {
+            turtle.x += 0.6 * turtle.direction;  // Turtles move slower
+            
+            if (turtle.x <= turtle.patrolLeft) turtle.direction = 1;
+            if (turtle.x >= turtle.patrolRight) turtle.direction = -1;
+        }
+        
+        turtle.animFrame = Math.floor(simTime / 200) % 2;
+    });
+    
+    // Patrols reorder them a little - keep both lists sorted, then collide with the ones nearby
+    sortByX(enemies);
+    sortByX(turtles);
+    const hitPlayer = enemy => {
+        if (checkCollision(player, enemy)) {
+            gameOver();
+        }
+    };
+    forEachInRange(enemies, player.x, player.x + player.width, hitPlayer);
+    forEachInRange(turtles, player.x, player.x + player.width, hitPlayer);
+}
+
+// Check flag
+function checkFlag() {
+    const portalRect = { x: portal.x - 10, y: portal.y, width: 60, height: portal.poleHeight };
+    if (checkCollision(player, portalRect)) {
+        goToNextLevel();
+    }
+}
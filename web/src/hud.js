@@ -0,0 +1,158 @@
+// ⚡ Score, level, health and progress display
+
+// Draw health bar (Level 2 and 3)
+function drawHealthBar() {
+    if (currentLevel < 2) return;
+    
+    const barWidth = 150;
+    const barHeight = 12;
+    const barX = VIEW_WIDTH - barWidth - 20;
+    const barY = 50;
+    
+    // Background
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.8)';
+    ctx.fillRect(barX - 5, barY - 5, barWidth + 10, barHeight + 10);
+    
+    // Border
+    ctx.strokeStyle = '#FF0044';
+    ctx.lineWidth = 1;
+    ctx.strokeRect(barX - 5, barY - 5, barWidth + 10, barHeight + 10);
+    
+    // Health bar fill
+    const maxHP = getMaxHealth();
+    const healthPercent = playerHealth / maxHP;
+    const healthWidth = barWidth * healthPercent;
+    
+    // Color based on health
+    let healthColor = '#00FF00';
+    if (healthPercent < 0.3) healthColor = '#FF0044';
+    else if (healthPercent < 0.6) healthColor = '#FFAA00';
+    
+    drawGlowBar(barX, barY, healthWidth, barHeight, healthColor, 8);
+    
+    // Health text
+    ctx.fillStyle = '#FFFFFF';
+    ctx.font = '10px "Courier New", monospace';
+    ctx.fillText(`HP: ${playerHealth}/${maxHP}`, barX + 5, barY + 9);
+}
+
+// Draw UI - TRON style
+function drawUI() {
+    // Energy bit counter background
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.8)';
+    ctx.fillRect(15, 12, 120, 30);
+    
+    // Border
+    ctx.strokeStyle = COLORS.neonOrange;
+    ctx.lineWidth = 1;
+    ctx.strokeRect(15, 12, 120, 30);
+    
+    // Energy icon (diamond)
+    drawGlowSprite('hud-bit', 0, 0, [20, 18, 20, 18], 8, g => {
+        g.shadowColor = COLORS.neonOrange;
+        g.shadowBlur = 8;
+        g.fillStyle = COLORS.neonOrange;
+        g.beginPath();
+        g.moveTo(30, 18);
+        g.lineTo(40, 27);
+        g.lineTo(30, 36);
+        g.lineTo(20, 27);
+        g.closePath();
+        g.fill();
+    });
+    
+    // Inner diamond
+    ctx.fillStyle = '#000';
+    ctx.beginPath();
+    ctx.moveTo(30, 22);
+    ctx.lineTo(36, 27);
+    ctx.lineTo(30, 32);
+    ctx.lineTo(24, 27);
+    ctx.closePath();
+    ctx.fill();
+    
+    // Score text
+    ctx.fillStyle = COLORS.neonOrange;
+    ctx.font = 'bold 16px "Courier New", monospace';
+    ctx.fillText(`${score + totalScore} / ${coins.length}`, 50, 32);
+    
+    // Level indicator
+    let levelText, levelColor;
+    if (currentLevel === 1) { levelText = 'THE GRID'; levelColor = '#00FFFF'; }
+    else if (currentLevel === 2) { levelText = 'NYC'; levelColor = '#FFD700'; }
+    else if (currentLevel === 3) { levelText = 'SPACE'; levelColor = '#00FFAA'; }
+    else { levelText = 'CYCLE'; levelColor = '#00DDFF'; }
+    
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.8)';
+    ctx.fillRect(VIEW_WIDTH - 120, 12, 105, 30);
+    ctx.strokeStyle = levelColor;
+    ctx.strokeRect(VIEW_WIDTH - 120, 12, 105, 30);
+    ctx.font = 'bold 14px "Courier New", monospace';
+    drawGlowText(`LVL ${currentLevel}: ${levelText}`, VIEW_WIDTH - 115, 32, levelColor, 8);
+    
+    // Weapon indicator (Level 2: Disc, Level 3: Missile)
+    if (currentLevel === 2 || currentLevel === 3) {
+        ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
+        ctx.fillRect(15, 48, 95, 22);
+        const weaponColor = characters[selectedCharacter].circuitColor;
+        ctx.fillStyle = currentLevel === 2 && disc.active ? '#555' : weaponColor;
+        ctx.font = '12px "Courier New", monospace';
+        ctx.fillText(currentLevel === 2 ? '[X] DISC' : '[X] MISSILE', 22, 63);
+    }
+    
+    // Level 4 controls hint
+    if (currentLevel === 4) {
+        ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
+        ctx.fillRect(15, 48, 130, 22);
+        ctx.fillStyle = '#00DDFF';
+        ctx.font = '11px "Courier New", monospace';
+        ctx.fillText('[↑/↓] SWITCH LANES', 22, 63);
+    }
+}
+
+const PROGRESS_BAR_WIDTH = 200;
+
+// How far through the level the player is, from 0 to 1
+function levelProgress() {
+    // Level 3 and 4 use camera position for progress
+    let worldWidth = WORLD_WIDTH;
+    if (currentLevel === 3) worldWidth = 3500;
+    else if (currentLevel === 4) worldWidth = 6000;
+    return (currentLevel === 3 || currentLevel === 4) ? cameraX / worldWidth : player.x / worldWidth;
+}
+
+// Draw level progress bar - TRON style
+function drawProgressBar() {
+    const progress = levelProgress();
+    const barWidth = PROGRESS_BAR_WIDTH;
+    const barHeight = 6;
+    const barX = VIEW_WIDTH - barWidth - 20;
+    const barY = 20;
+    
+    // Background
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.8)';
+    ctx.fillRect(barX - 3, barY - 3, barWidth + 6, barHeight + 6);
+    
+    // Border
+    ctx.strokeStyle = 'rgba(0, 255, 255, 0.5)';
+    ctx.lineWidth = 1;
+    ctx.strokeRect(barX - 3, barY - 3, barWidth + 6, barHeight + 6);
+    
+    // Progress track
+    ctx.fillStyle = '#111';
+    ctx.fillRect(barX, barY, barWidth, barHeight);
+    
+    // Progress fill with glow
+    drawGlowBar(barX, barY, barWidth * progress, barHeight, COLORS.neonCyan, 10);
+    
+    // Exit portal indicator
+    ctx.fillStyle = COLORS.neonCyan;
+    ctx.font = '10px "Courier New", monospace';
+    ctx.fillText('EXIT', barX + barWidth + 8, barY + 6);
+    
+    // Sector markers
+    ctx.fillStyle = 'rgba(0, 255, 255, 0.3)';
+    for (let i = 1; i < 4; i++) {
+        ctx.fillRect(barX + (barWidth / 4) * i, barY, 1, barHeight);
+    }
+}
@@ -0,0 +1,266 @@
+// ⚡ Keyboard, touch and mouse input
+
+// Input waits here for the next simulation step, which applies and records it
+// (see replay.js) - so a run replays the same whatever the frame timing was
+const pendingInput = [];
+
+// Queue an input event: ['keydown', key], ['keyup', key], ['touch', key, pressed] or ['click', x, y]
+function queueInput(type, a, b) {
+    pendingInput.push([type, a, b]);
+}
+
+function applyInput([type, a, b]) {
+    if (type === 'keydown') onKeyDown(a);
+    else if (type === 'keyup') onKeyUp(a);
+    else if (type === 'touch') keys[a] = b;
+    else if (type === 'click') onCanvasClick(a, b);
+}
+
+// Whether the game takes this key press over from the browser (scrolling, back navigation)
+function capturesKey(key) {
+    if (key === 'F3') return true;
+    if (gameState === 'title') return nameInputActive;
+    if (gameState === 'character') return true;
+    return ['ArrowUp', 'ArrowDown', ' '].includes(key);
+}
+
+// Keys that only change what's shown (perf HUD, quality tier), not the run -
+// they're applied but left out of replays (see replay.js)
+function isInterfaceInput([type, key]) {
+    if (type !== 'keydown' && type !== 'keyup') return false;
+    if (key === 'F3') return true;
+    // On the title screen Q is a letter of the player's name
+    return (key === 'q' || key === 'Q') && !(gameState === 'title' && nameInputActive);
+}
+
+// Key pressed
+function onKeyDown(key) {
+    // Performance HUD, on every screen (see perfhud.js)
+    if (key === 'F3') {
+        togglePerfHUD();
+        return;
+    }
+    
+    // Title screen input
+    if (gameState === 'title') {
+        if (nameInputActive) {
+            if (key === 'Backspace') {
+                playerName = playerName.slice(0, -1);
+            } else if (key === 'Enter' && playerName.length >= 1) {
+                goToCharacterSelect();
+            } else if (key.length === 1 && playerName.length < 12) {
+                // Only allow letters, numbers, and some symbols
+                if (/^[a-zA-Z0-9_\- ]$/.test(key)) {
+                    playerName += key;
+                }
+            }
+            return;
+        }
+        
+        if (key === 'Enter' && playerName.length >= 1) {
+            goToCharacterSelect();
+        }
+        return;
+    }
+    
+    // Cycle the quality tier - auto, low, medium, high (see quality.js)
+    if (key === 'q' || key === 'Q') cycleQuality();
+    
+    // Character selection input
+    if (gameState === 'character') {
+        if (key === 'ArrowLeft' || key === 'a' || key === 'A') {
+            selectedCharacter = (selectedCharacter - 1 + characters.length) % characters.length;
+        }
+        if (key === 'ArrowRight' || key === 'd' || key === 'D') {
+            selectedCharacter = (selectedCharacter + 1) % characters.length;
+        }
+        if (key === 'Enter' || key === ' ') {
+            startGame();
+        }
+        if (key === 'Escape' || key === 'Backspace') {
+            gameState = 'title';
+        }
+        return;
+    }
+    
+    if (key === 'ArrowLeft' || key === 'a' || key === 'A') keys.left = true;
+    if (key === 'ArrowRight' || key === 'd' || key === 'D') keys.right = true;
+    if (key === 'ArrowUp' || key === 'w' || key === 'W' || key === ' ') keys.jump = true;
+    if (key === 'ArrowDown' || key === 's' || key === 'S') keys.down = true;
+    
+    // Throw disc (Level 2) or shoot missile (Level 3)
+    if ((key === 'x' || key === 'X' || key === 'k' || key === 'K') && gameState === 'playing') {
+        if (currentLevel === 2) {
+            throwDisc();
+        } else if (currentLevel === 3) {
+            shootMissile();
+        }
+    }
+    
+    if ((key === 'r' || key === 'R') && (gameState === 'won' || gameState === 'lost')) {
+        if (gameState === 'lost') {
+            // Restart from checkpoint (current level)
+            resetGame();
+        } else {
+            // Won - go back to beginning for a new game
+            restartFromBeginning();
+        }
+    }
+}
+
+// Key released
+function onKeyUp(key) {
+    if (key === 'ArrowLeft' || key === 'a' || key === 'A') keys.left = false;
+    if (key === 'ArrowRight' || key === 'd' || key === 'D') keys.right = false;
+    if (key === 'ArrowUp' || key === 'w' || key === 'W' || key === ' ') keys.jump = false;
+    if (key === 'ArrowDown' || key === 's' || key === 'S') keys.down = false;
+}
+
+// Go to character selection from title
+function goToCharacterSelect() {
+    gameState = 'character';
+    nameInputActive = false;
+}
+
+// Start game from character selection
+function startGame() {
+    gameState = 'playing';
+    nameInputActive = false;
+    resetGame();
+}
+
+// Reset game (keep the player name)
+function resetGame() {
+    // Restart at current checkpoint level
+    score = 0;
+    disc.active = false;
+    gameState = 'playing';
+    cameraX = 0;
+    
+    // Reset health for Level 2 and 3
+    if (currentLevel >= 2) {
+        playerHealth = getMaxHealth();
+    }
+    invincibilityTimer = 0;
+    clearProjectiles(enemyDiscs);
+    clearProjectiles(missiles);
+    clearProjectiles(droneProjectiles);
+    
+    if (currentLevel === 3) {
+        // Space shooter mode reset
+        jetY = VIEW_HEIGHT / 2 - JET_HEIGHT / 2;
+        jetVelY = 0;
+        player.width = JET_WIDTH;
+        player.height = JET_HEIGHT;
+        initSpaceDrones();
+        initStars();
+    } else {
+        // Platformer mode reset
+        player.x = 50;
+        player.y = 350;
+        player.velX = 0;
+        player.velY = 0;
+        player.onGround = false;
+        player.facingRight = true;
+        player.width = 36;
+        player.height = 48;
+        loadLevelPlatforms();
+    }
+    
+    // Keep totalScore from previous levels
+    initCoins();
+    initEnemies();
+    hideOverlay();
+}
+
+// Restart from beginning (after winning or returning to character select)
+function restartFromBeginning() {
+    currentLevel = 1;
+    totalScore = 0;
+    updateLevelColors();
+    loadLevel(1);
+    gameState = 'character';
+    hideOverlay();
+}
+
+// Click on the canvas, in canvas coordinates
+function onCanvasClick(clickX, clickY) {
+    if (gameState === 'title') {
+        // Check if clicked on name input box
+        const boxX = VIEW_WIDTH / 2 - 150;
+        const boxY = 300;
+        if (clickX >= boxX && clickX <= boxX + 300 && clickY >= boxY && clickY <= boxY + 50) {
+            nameInputActive = true;
+        } else {
+            nameInputActive = false;
+        }
+        
+        // Check if clicked on start button
+        const btnY = 400;
+        const btnWidth = 280;
+        if (playerName.length >= 1 && clickX >= VIEW_WIDTH / 2 - btnWidth / 2 && clickX <= VIEW_WIDTH / 2 + btnWidth / 2 && clickY >= btnY && clickY <= btnY + 50) {
+            goToCharacterSelect();
+        }
+    }
+    
+    if (gameState === 'character') {
+        // Check if clicked on left arrow
+        if (clickX >= 20 && clickX <= 80 && clickY >= 180 && clickY <= 280) {
+            selectedCharacter = (selectedCharacter - 1 + characters.length) % characters.length;
+        }
+        
+        // Check if clicked on right arrow
+        if (clickX >= VIEW_WIDTH - 80 && clickX <= VIEW_WIDTH - 20 && clickY >= 180 && clickY <= 280) {
+            selectedCharacter = (selectedCharacter + 1) % characters.length;
+        }
+        
+        // Check if clicked on left character card
+        const centerX = VIEW_WIDTH / 2;
+        if (clickX >= centerX - 270 && clickX <= centerX - 90 && clickY >= 140 && clickY <= 340) {
+            selectedCharacter = (selectedCharacter - 1 + characters.length) % characters.length;
+        }
+        
+        // Check if clicked on right character card
+        if (clickX >= centerX + 90 && clickX <= centerX + 270 && clickY >= 140 && clickY <= 340) {
+            selectedCharacter = (selectedCharacter + 1) % characters.length;
+        }
+        
+        // Check if clicked on play button
+        const btnY = 420;
+        if (clickX >= VIEW_WIDTH / 2 - 120 && clickX <= VIEW_WIDTH / 2 + 120 && clickY >= btnY && clickY <= btnY + 50) {
+            startGame();
+        }
+    }
+    
+    // Throw disc (Level 2) or shoot missile (Level 3) on click
+    if (gameState === 'playing') {
+        if (currentLevel === 2) {
+            throwDisc();
+        } else if (currentLevel === 3) {
+            shootMissile();
+        }
+    }
+}
+
+// In worker mode the page forwards these events instead (see host.js)
+if (!IN_WORKER) {
+    document.addEventListener('keydown', (e) => {
+        if (capturesKey(e.key)) e.preventDefault();
+        queueInput('keydown', e.key);
+    });
+    document.addEventListener('keyup', (e) => queueInput('keyup', e.key));
+    
+    // Mobile controls
+    [['btnLeft', 'left'], ['btnRight', 'right'], ['btnJump', 'jump']].forEach(([id, key]) => {
+        const button = document.getElementById(id);
+        button.addEventListener('touchstart', (e) => { e.preventDefault(); queueInput('touch', key, true); });
+        button.addEventListener('touchend', (e) => { e.preventDefault(); queueInput('touch', key, false); });
+    });
+    
+    // Click handler for title screen and focus
+    canvas.addEventListener('click', (e) => {
+        const rect = canvas.getBoundingClientRect();
+        queueInput('click', e.clientX - rect.left, e.clientY - rect.top);
+        canvas.focus();
+    });
+}
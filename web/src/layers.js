@@ -0,0 +1,74 @@
+// ⚡ Canvas layers - a backdrop canvas under the world canvas and a HUD canvas over it
+//
+// During play the world canvas is cleared and redrawn every frame, but the level's
+// static sky and the HUD sit on their own canvases and are only repainted when
+// what they show changes. Title, selection and transition screens are drawn on
+// the world canvas alone, over whatever the backdrop holds.
+
+// In worker mode the page hands these over along with the world canvas (see host.js)
+const backdropCanvas = IN_WORKER ? self.backdropCanvas : document.getElementById('backdropCanvas');
+const hudCanvas = IN_WORKER ? self.hudCanvas : document.getElementById('hudCanvas');
+const backdropCtx = backdropCanvas.getContext('2d');
+const hudCtx = hudCanvas.getContext('2d');
+
+// What each layer shows now - the cached backdrop image and a summary of the HUD's values
+let backdropShown = null;
+let hudShown = null;
+
+// Run paint() with every draw function pointed at another layer's context
+function drawToLayer(layerCtx, paint) {
+    const worldCtx = ctx;
+    ctx = layerCtx;
+    try {
+        paint();
+    } finally {
+        ctx = worldCtx;
+    }
+}
+
+// The current level's static sky, painted once into a cached layer
+function levelBackdrop() {
+    if (currentLevel === 1) return cachedLayer('sky', VIEW_WIDTH, VIEW_HEIGHT, paintSky);
+    if (currentLevel === 2) return cachedLayer('nycSky', VIEW_WIDTH, VIEW_HEIGHT, paintNYCSky);
+    if (currentLevel === 3) return cachedLayer('spaceSky', VIEW_WIDTH, VIEW_HEIGHT, paintSpaceSky);
+    return cachedLayer('road', VIEW_WIDTH, VIEW_HEIGHT, paintRoad);
+}
+
+// Put the level's sky on the backdrop canvas if it isn't there already
+function updateBackdrop() {
+    const image = levelBackdrop();
+    if (image === backdropShown) return;
+    backdropShown = image;
+    backdropCtx.clearRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    backdropCtx.drawImage(image, 0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+}
+
+// Everything the HUD draws from - when none of it changes the HUD canvas is left alone
+function hudSummary() {
+    const progress = Math.round(levelProgress() * PROGRESS_BAR_WIDTH);
+    const weaponReady = currentLevel === 2 && disc.active ? 0 : 1;
+    return `${currentLevel}:${score + totalScore}/${coins.length}:${playerHealth}/${getMaxHealth()}:` +
+           `${progress}:${selectedCharacter}:${weaponReady}:${transitionAlpha}`;
+}
+
+// Repaint the HUD canvas when the values it shows have changed
+function updateHUD() {
+    const summary = hudSummary();
+    if (summary === hudShown) return;
+    hudShown = summary;
+    hudCtx.clearRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    drawToLayer(hudCtx, () => {
+        drawUI();
+        drawHealthBar();
+        drawProgressBar();
+        // The level fade covers the HUD too
+        drawTransition();
+    });
+}
+
+// Empty the HUD canvas for screens that have no HUD
+function hideHUD() {
+    if (hudShown === null) return;
+    hudShown = null;
+    hudCtx.clearRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+}
@@ -0,0 +1,508 @@
+// ⚡ Level data, level loading and transitions
+
+// Platforms - Dynamic based on level
+let platforms = [];
+
+// Level 1 platforms (The Grid)
+const platforms_L1 = [
+    { x: 0, y: 450, width: 400, height: 50, isGround: true },
+    { x: 180, y: 370, width: 100, height: 25, isGround: false },
+    { x: 350, y: 310, width: 90, height: 25, isGround: false },
+    { x: 500, y: 450, width: 200, height: 50, isGround: true },
+    { x: 550, y: 350, width: 100, height: 25, isGround: false },
+    { x: 450, y: 250, width: 90, height: 25, isGround: false },
+    { x: 800, y: 450, width: 150, height: 50, isGround: true },
+    { x: 750, y: 350, width: 80, height: 25, isGround: false },
+    { x: 880, y: 280, width: 100, height: 25, isGround: false },
+    { x: 1000, y: 350, width: 80, height: 25, isGround: false },
+    { x: 1050, y: 450, width: 250, height: 50, isGround: true },
+    { x: 1100, y: 350, width: 100, height: 25, isGround: false },
+    { x: 1250, y: 280, width: 90, height: 25, isGround: false },
+    { x: 1400, y: 450, width: 120, height: 50, isGround: true },
+    { x: 1380, y: 350, width: 80, height: 25, isGround: false },
+    { x: 1500, y: 380, width: 70, height: 25, isGround: false },
+    { x: 1600, y: 320, width: 80, height: 25, isGround: false },
+    { x: 1700, y: 450, width: 200, height: 50, isGround: true },
+    { x: 1750, y: 350, width: 100, height: 25, isGround: false },
+    { x: 1650, y: 250, width: 90, height: 25, isGround: false },
+    { x: 1850, y: 280, width: 100, height: 25, isGround: false },
+    { x: 2000, y: 450, width: 150, height: 50, isGround: true },
+    { x: 2050, y: 350, width: 80, height: 25, isGround: false },
+    { x: 2180, y: 400, width: 100, height: 25, isGround: false },
+    { x: 2300, y: 450, width: 200, height: 50, isGround: true },
+    { x: 2350, y: 350, width: 100, height: 25, isGround: false },
+    { x: 2500, y: 300, width: 90, height: 25, isGround: false },
+    { x: 2650, y: 450, width: 350, height: 50, isGround: true },
+];
+
+// Level 2 platforms (NYC Streets) - Rooftops and fire escapes
+const platforms_L2 = [
+    // Starting rooftop
+    { x: 0, y: 450, width: 300, height: 50, isGround: true },
+    { x: 150, y: 380, width: 60, height: 15, isGround: false },
+    // Gap with fire escape
+    { x: 380, y: 420, width: 50, height: 15, isGround: false },
+    { x: 450, y: 380, width: 50, height: 15, isGround: false },
+    { x: 520, y: 340, width: 50, height: 15, isGround: false },
+    // Building 2
+    { x: 600, y: 450, width: 200, height: 50, isGround: true },
+    { x: 650, y: 370, width: 80, height: 20, isGround: false },
+    { x: 750, y: 300, width: 80, height: 20, isGround: false },
+    // Crane section
+    { x: 900, y: 380, width: 40, height: 15, isGround: false },
+    { x: 970, y: 350, width: 40, height: 15, isGround: false },
+    { x: 1040, y: 320, width: 40, height: 15, isGround: false },
+    // Building 3
+    { x: 1120, y: 450, width: 180, height: 50, isGround: true },
+    { x: 1150, y: 380, width: 60, height: 15, isGround: false },
+    { x: 1220, y: 320, width: 60, height: 15, isGround: false },
+    // Water tower section
+    { x: 1350, y: 400, width: 60, height: 15, isGround: false },
+    { x: 1430, y: 360, width: 60, height: 15, isGround: false },
+    { x: 1510, y: 320, width: 60, height: 15, isGround: false },
+    // Building 4
+    { x: 1600, y: 450, width: 200, height: 50, isGround: true },
+    { x: 1680, y: 370, width: 80, height: 20, isGround: false },
+    // Billboard section
+    { x: 1850, y: 380, width: 100, height: 20, isGround: false },
+    { x: 1980, y: 340, width: 80, height: 15, isGround: false },
+    // Building 5 - Times Square
+    { x: 2100, y: 450, width: 250, height: 50, isGround: true },
+    { x: 2150, y: 380, width: 60, height: 15, isGround: false },
+    { x: 2250, y: 320, width: 60, height: 15, isGround: false },
+    // Final stretch
+    { x: 2400, y: 400, width: 50, height: 15, isGround: false },
+    { x: 2480, y: 360, width: 50, height: 15, isGround: false },
+    { x: 2560, y: 320, width: 50, height: 15, isGround: false },
+    // Final rooftop
+    { x: 2650, y: 450, width: 350, height: 50, isGround: true },
+];
+
+function loadLevelPlatforms() {
+    platforms = indexByX(currentLevel === 1 ? [...platforms_L1] : [...platforms_L2]);
+}
+
+// Coins - Dynamic based on level
+let coins = [];
+
+function initCoins() {
+    if (currentLevel === 1) {
+        coins = [
+            { x: 200, y: 330, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 250, y: 330, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 375, y: 270, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 580, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 475, y: 210, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 780, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 910, y: 240, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1130, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1280, y: 240, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1410, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1530, y: 340, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1630, y: 280, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1780, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1680, y: 210, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1880, y: 240, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2080, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2210, y: 360, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2380, y: 310, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2530, y: 260, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2750, y: 410, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+        ];
+    } else {
+        // Level 2 coins - NYC rooftops
+        coins = [
+            { x: 100, y: 410, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 170, y: 340, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 400, y: 380, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 540, y: 300, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 680, y: 330, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 780, y: 260, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 920, y: 340, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1060, y: 280, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1180, y: 340, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1240, y: 280, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1380, y: 360, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1530, y: 280, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1700, y: 330, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 1880, y: 340, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2000, y: 300, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2180, y: 340, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2280, y: 280, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2500, y: 320, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2580, y: 280, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+            { x: 2750, y: 410, collected: false, frame: 0, offset: random() * Math.PI * 2 },
+        ];
+    }
+    indexByX(coins);
+}
+
+// Enemies - Dynamic based on level
+let enemies = [];
+let turtles = [];
+let nycEnemies = []; // NYC specific harder enemies
+
+function initEnemies() {
+    if (currentLevel === 1) {
+        // Level 1: Standard enemies
+        enemies = [
+            { x: 200, y: 412, width: 38, height: 38, patrolLeft: 150, patrolRight: 350, direction: 1, animFrame: 0, health: 1 },
+            { x: 550, y: 412, width: 38, height: 38, patrolLeft: 500, patrolRight: 680, direction: 1, animFrame: 0, health: 1 },
+            { x: 850, y: 412, width: 38, height: 38, patrolLeft: 800, patrolRight: 930, direction: 1, animFrame: 0, health: 1 },
+            { x: 1100, y: 412, width: 38, height: 38, patrolLeft: 1050, patrolRight: 1280, direction: 1, animFrame: 0, health: 1 },
+            { x: 1420, y: 412, width: 38, height: 38, patrolLeft: 1400, patrolRight: 1500, direction: 1, animFrame: 0, health: 1 },
+            { x: 1750, y: 412, width: 38, height: 38, patrolLeft: 1700, patrolRight: 1880, direction: 1, animFrame: 0, health: 1 },
+            { x: 2050, y: 412, width: 38, height: 38, patrolLeft: 2000, patrolRight: 2130, direction: 1, animFrame: 0, health: 1 },
+            { x: 2700, y: 412, width: 38, height: 38, patrolLeft: 2650, patrolRight: 2850, direction: 1, animFrame: 0, health: 1 },
+        ];
+        turtles = [
+            { x: 280, y: 410, width: 40, height: 40, patrolLeft: 150, patrolRight: 350, direction: -1, animFrame: 0, inShell: false, health: 1 },
+            { x: 620, y: 410, width: 40, height: 40, patrolLeft: 500, patrolRight: 680, direction: -1, animFrame: 0, inShell: false, health: 1 },
+            { x: 910, y: 240, width: 40, height: 40, patrolLeft: 880, patrolRight: 960, direction: -1, animFrame: 0, inShell: false, health: 1 },
+            { x: 1200, y: 410, width: 40, height: 40, patrolLeft: 1050, patrolRight: 1280, direction: -1, animFrame: 0, inShell: false, health: 1 },
+            { x: 1630, y: 282, width: 40, height: 40, patrolLeft: 1600, patrolRight: 1680, direction: 1, animFrame: 0, inShell: false, health: 1 },
+            { x: 1880, y: 240, width: 40, height: 40, patrolLeft: 1850, patrolRight: 1930, direction: -1, animFrame: 0, inShell: false, health: 1 },
+            { x: 2210, y: 360, width: 40, height: 40, patrolLeft: 2180, patrolRight: 2260, direction: 1, animFrame: 0, inShell: false, health: 1 },
+            { x: 2400, y: 410, width: 40, height: 40, patrolLeft: 2300, patrolRight: 2480, direction: -1, animFrame: 0, inShell: false, health: 1 },
+            { x: 2800, y: 410, width: 40, height: 40, patrolLeft: 2650, patrolRight: 2950, direction: -1, animFrame: 0, inShell: false, health: 1 },
+        ];
+        nycEnemies = [];
+    } else {
+        // Level 2: Harder NYC enemies - thugs, drones, jumpers
+        enemies = []; // No basic enemies in L2
+        turtles = []; // No turtles in L2
+        nycEnemies = [
+            // Thug type - aggressive, requires 2 hits, shoots discs
+            { x: 200, y: 412, width: 42, height: 45, patrolLeft: 150, patrolRight: 280, direction: 1, type: 'thug', speed: 0.9, health: 2, shootTimer: 0, shootCooldown: 120 },
+            { x: 650, y: 412, width: 42, height: 45, patrolLeft: 600, patrolRight: 780, direction: -1, type: 'thug', speed: 0.8, health: 2, shootTimer: 0, shootCooldown: 100 },
+            // Drone type - flies, shoots discs
+            { x: 400, y: 320, width: 35, height: 35, patrolLeft: 350, patrolRight: 550, direction: 1, type: 'drone', speed: 0.7, health: 1, floatOffset: 0, shootTimer: 0, shootCooldown: 90 },
+            { x: 1000, y: 280, width: 35, height: 35, patrolLeft: 900, patrolRight: 1100, direction: -1, type: 'drone', speed: 0.8, health: 1, floatOffset: Math.PI, shootTimer: 0, shootCooldown: 110 },
+            { x: 1900, y: 300, width: 35, height: 35, patrolLeft: 1830, patrolRight: 2020, direction: 1, type: 'drone', speed: 0.7, health: 1, floatOffset: Math.PI/2, shootTimer: 0, shootCooldown: 100 },
+            // Jumper type - jumps at player
+            { x: 1200, y: 412, width: 40, height: 40, patrolLeft: 1120, patrolRight: 1280, direction: 1, type: 'jumper', speed: 0.8, health: 1, velY: 0, onGround: true, jumpCooldown: 0 },
+            { x: 1700, y: 412, width: 40, height: 40, patrolLeft: 1600, patrolRight: 1780, direction: -1, type: 'jumper', speed: 0.7, health: 1, velY: 0, onGround: true, jumpCooldown: 0 },
+            { x: 2200, y: 412, width: 40, height: 40, patrolLeft: 2100, patrolRight: 2330, direction: 1, type: 'jumper', speed: 0.8, health: 1, velY: 0, onGround: true, jumpCooldown: 0 },
+            // Boss - slow but shoots frequently
+            { x: 2750, y: 405, width: 50, height: 55, patrolLeft: 2680, patrolRight: 2920, direction: 1, type: 'boss', speed: 0.5, health: 4, shootTimer: 0, shootCooldown: 60 },
+        ];
+    }
+    indexByX(enemies);
+    indexByX(turtles);
+    indexByX(nycEnemies);
+    
+    // Level 3 - Space Drones
+    if (currentLevel === 3) {
+        initSpaceDrones();
+        initStars();
+    }
+    
+    // Level 4 - Light Cycle Runner
+    if (currentLevel === 4) {
+        initLightCycleLevel();
+    }
+}
+
+// Initialize space drones for Level 3
+function initSpaceDrones() {
+    spaceDrones = [];
+    spaceDespawned = 0;
+    spaceDronesDropped = 0;
+    missiles.dropped = 0;
+    droneProjectiles.dropped = 0;
+    // Wave 1 - Basic drones
+    for (let i = 0; i < 5; i++) {
+        spawnSpaceDrone({
+            x: 900 + i * 200,
+            y: 100 + random() * 300,
+            width: 40,
+            height: 25,
+            type: 'basic',
+            speed: 1.5,
+            health: 1,
+            shootTimer: random() * 120,
+            shootCooldown: 180, // ~3 seconds between shots
+            waveOffset: random() * Math.PI * 2
+        });
+    }
+    // Wave 2 - Fast drones
+    for (let i = 0; i < 4; i++) {
+        spawnSpaceDrone({
+            x: 1800 + i * 250,
+            y: 80 + random() * 340,
+            width: 35,
+            height: 20,
+            type: 'fast',
+            speed: 2.5,
+            health: 1,
+            shootTimer: random() * 100,
+            shootCooldown: 150, // ~2.5 seconds between shots
+            waveOffset: random() * Math.PI * 2
+        });
+    }
+    // Wave 3 - Heavy drones
+    for (let i = 0; i < 3; i++) {
+        spawnSpaceDrone({
+            x: 2500 + i * 300,
+            y: 120 + random() * 260,
+            width: 55,
+            height: 35,
+            type: 'heavy',
+            speed: 1.0,
+            health: 3,
+            shootTimer: random() * 80,
+            shootCooldown: 120, // ~2 seconds between shots
+            waveOffset: random() * Math.PI * 2
+        });
+    }
+    // Boss drone at the end
+    spawnSpaceDrone({
+        x: 3200,
+        y: 200,
+        width: 80,
+        height: 50,
+        type: 'boss',
+        speed: 0.8,
+        health: 8,
+        shootTimer: 0,
+        shootCooldown: 90, // ~1.5 seconds between shots
+        waveOffset: 0
+    });
+}
+
+// Initialize stars for space background
+function initStars() {
+    stars = [];
+    for (let i = 0; i < 100; i++) {
+        stars.push({
+            x: random() * 4000,
+            y: random() * VIEW_HEIGHT,
+            size: random() * 2 + 1,
+            speed: random() * 2 + 0.5,
+            brightness: random()
+        });
+    }
+}
+
+// Initialize Level 4 - Light Cycle Runner
+function initLightCycleLevel() {
+    currentLane = 2; // Start in middle lane
+    lightCycleX = 100;
+    laneEnemies = [];
+    clearProjectiles(recognizerMissiles);
+    roadOffset = 0;
+    recognizerY = -100;
+    recognizerPhase = 0;
+    
+    // Spawn initial enemies in lanes
+    spawnLaneEnemies();
+}
+
+// Spawn enemies in lanes at intervals
+function spawnLaneEnemies() {
+    // Clear and respawn
+    laneEnemies = [];
+    
+    // Spawn waves of enemies
+    for (let wave = 0; wave < 15; wave++) {
+        const xPos = 900 + wave * 400;
+        
+        // Random lanes for each wave (1-3 enemies per wave)
+        const numEnemies = 1 + Math.floor(random() * 3);
+        const usedLanes = [];
+        
+        for (let i = 0; i < numEnemies; i++) {
+            let lane;
+            do {
+                lane = Math.floor(random() * NUM_LANES);
+            } while (usedLanes.includes(lane));
+            usedLanes.push(lane);
+            
+            const types = ['cycle', 'barrier', 'sentry'];
+            const type = types[Math.floor(random() * types.length)];
+            
+            laneEnemies.push({
+                x: xPos + random() * 100,
+                lane: lane,
+                type: type,
+                width: type === 'barrier' ? 80 : 50,
+                height: type === 'barrier' ? LANE_HEIGHT - 10 : 30,
+                health: type === 'sentry' ? 2 : 1,
+                active: true
+            });
+        }
+    }
+}
+
+// Portal - At the end of each level
+let portal = {
+    x: 2920,
+    y: 300,
+    poleHeight: 150,
+    animTimer: 0
+};
+
+// Transition effect
+let transitionAlpha = 0;
+let transitionDirection = 0; // 0 = none, 1 = fading out, -1 = fading in
+
+// Clouds
+const clouds = [
+    { x: 100, y: 60, size: 25 },
+    { x: 300, y: 40, size: 20 },
+    { x: 500, y: 80, size: 30 },
+    { x: 700, y: 50, size: 22 },
+    { x: 850, y: 70, size: 28 },
+];
+
+// Initialize game (called once at start)
+function initGame() {
+    player.x = 50;
+    player.y = 350;
+    player.velX = 0;
+    player.velY = 0;
+    player.onGround = false;
+    player.facingRight = true;
+    score = 0;
+    totalScore = 0;
+    currentLevel = 1;
+    gameState = 'title';
+    cameraX = 0;
+    playerName = '';
+    nameInputActive = false;
+    disc.active = false;
+    transitionAlpha = 0;
+    transitionDirection = 0;
+    loadLevel(1);
+    hideOverlay();
+}
+
+// Load a specific level
+function loadLevel(levelNum) {
+    currentLevel = levelNum;
+    cameraX = 0;
+    clearLayerCache();
+    disc.active = false;
+    invincibilityTimer = 0;
+    clearProjectiles(enemyDiscs);
+    clearProjectiles(missiles);
+    clearProjectiles(droneProjectiles);
+    clearProjectiles(recognizerMissiles);
+    laneEnemies = [];
+    
+    // Reset health based on level
+    if (levelNum >= 2) {
+        if (levelNum === 4) playerHealth = MAX_HEALTH_L4;
+        else if (levelNum === 3) playerHealth = MAX_HEALTH_L3;
+        else playerHealth = MAX_HEALTH_L2;
+    }
+    
+    if (levelNum === 4) {
+        // Light Cycle Runner mode
+        currentLane = 2;
+        lightCycleX = 100;
+        roadOffset = 0;
+        recognizerY = 0;
+        recognizerPhase = 0;
+        player.width = LIGHT_CYCLE_WIDTH;
+        player.height = LIGHT_CYCLE_HEIGHT;
+    } else if (levelNum === 3) {
+        // Space shooter mode
+        jetY = VIEW_HEIGHT / 2 - JET_HEIGHT / 2;
+        jetVelY = 0;
+        player.width = JET_WIDTH;
+        player.height = JET_HEIGHT;
+    } else {
+        // Platformer mode
+        player.x = 50;
+        player.y = 350;
+        player.velX = 0;
+        player.velY = 0;
+        player.onGround = false;
+        player.width = 36;
+        player.height = 48;
+    }
+    
+    updateLevelColors();
+    if (levelNum !== 3 && levelNum !== 4) {
+        loadLevelPlatforms();
+    }
+    initCoins();
+    initEnemies();
+}
+
+// Transition to next level
+function goToNextLevel() {
+    totalScore += score;
+    score = 0;
+    
+    if (currentLevel === 1) {
+        // Go to Level 2 (NYC)
+        gameState = 'transition';
+        transitionDirection = 1;
+    } else if (currentLevel === 2) {
+        // Go to Level 3 (Space)
+        gameState = 'transition';
+        transitionDirection = 1;
+    } else if (currentLevel === 3) {
+        // Go to Level 4 (Light Cycle)
+        gameState = 'transition';
+        transitionDirection = 1;
+    } else {
+        // Won the game after Level 4!
+        gameWon();
+    }
+}
+
+// Handle transition animation
+function updateTransition() {
+    if (transitionDirection === 1) {
+        transitionAlpha += 0.02;
+        if (transitionAlpha >= 1) {
+            loadLevel(currentLevel + 1);
+            transitionDirection = -1; // Start fade in
+        }
+    } else if (transitionDirection === -1) {
+        transitionAlpha -= 0.02;
+        if (transitionAlpha <= 0) {
+            transitionAlpha = 0;
+            transitionDirection = 0;
+            gameState = 'playing';
+        }
+    }
+}
+
+// Draw transition effect
+function drawTransition() {
+    if (transitionAlpha > 0) {
+        ctx.fillStyle = `rgba(0, 0, 0, ${transitionAlpha})`;
+        ctx.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+        
+        if (transitionDirection === 1 && transitionAlpha > 0.5) {
+            let titleText = 'ENTERING NYC DIMENSION';
+            let titleColor = 'rgba(255, 215, 0, ';
+            let subText = '[ USE IDENTITY DISC ]';
+            
+            if (currentLevel === 2) {
+                titleText = 'ENTERING SPACE DIMENSION';
+                titleColor = 'rgba(0, 255, 170, ';
+                subText = '[ PILOT YOUR JET - FIRE MISSILES ]';
+            } else if (currentLevel === 3) {
+                titleText = 'ENTERING LIGHT CYCLE ARENA';
+                titleColor = 'rgba(0, 221, 255, ';
+                subText = '[ DODGE OBSTACLES - SURVIVE THE GRID ]';
+            }
+            
+            ctx.fillStyle = titleColor + `${(transitionAlpha - 0.5) * 2})`;
+            ctx.font = 'bold 32px "Courier New", monospace';
+            ctx.textAlign = 'center';
+            ctx.fillText(titleText, VIEW_WIDTH / 2, VIEW_HEIGHT / 2);
+            ctx.font = '16px "Courier New", monospace';
+            ctx.fillText('[ CHECKPOINT SAVED ]', VIEW_WIDTH / 2, VIEW_HEIGHT / 2 + 35);
+            ctx.font = '14px "Courier New", monospace';
+            ctx.fillStyle = `rgba(255, 255, 255, ${(transitionAlpha - 0.5) * 1.5})`;
+            ctx.fillText(subText, VIEW_WIDTH / 2, VIEW_HEIGHT / 2 + 60);
+            ctx.textAlign = 'left';
+        }
+    }
+}
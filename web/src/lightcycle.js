@@ -0,0 +1,406 @@
+// ⚡ Light Cycle level - lanes, riders and the Recognizer
+
+// ========== LEVEL 4 - LIGHT CYCLE RUNNER FUNCTIONS ==========
+
+// Draw the Light Cycle road with grid
+function drawLightCycleRoad() {
+    // The road itself is on the backdrop (see layers.js). Vertical grid lines scroll, so one pre-painted strip is slid along
+    if (quality.roadGrid) {
+        const gridSpacing = 100;
+        const offset = roadOffset % gridSpacing;
+        const grid = cachedLayer('roadGrid', VIEW_WIDTH + gridSpacing * 2, VIEW_HEIGHT, g => paintRoadGrid(g, gridSpacing));
+        drawOffscreen(grid, -offset, 0);
+    }
+    
+    // Edge glow sits on top of the scrolling lines
+    drawOffscreen(cachedLayer('roadEdges', VIEW_WIDTH, VIEW_HEIGHT, paintRoadEdges), 0, 0);
+}
+
+// Paint the sky, road surface and lane dividers into a cached layer
+function paintRoad(g) {
+    // Sky gradient
+    const gradient = g.createLinearGradient(0, 0, 0, VIEW_HEIGHT);
+    gradient.addColorStop(0, '#000005');
+    gradient.addColorStop(0.3, '#000015');
+    gradient.addColorStop(1, '#000025');
+    g.fillStyle = gradient;
+    g.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    
+    // Road surface
+    g.fillStyle = '#0a0a15';
+    g.fillRect(0, ROAD_TOP, VIEW_WIDTH, NUM_LANES * LANE_HEIGHT + 20);
+    
+    g.strokeStyle = COLORS_L4.gridLine;
+    g.lineWidth = 1;
+    
+    // Horizontal lane dividers
+    for (let i = 0; i <= NUM_LANES; i++) {
+        const y = ROAD_TOP + i * LANE_HEIGHT;
+        g.beginPath();
+        g.moveTo(0, y);
+        g.lineTo(VIEW_WIDTH, y);
+        g.stroke();
+        
+        // Glow on lane edges
+        if (i > 0 && i < NUM_LANES) {
+            g.shadowColor = '#00DDFF';
+            g.shadowBlur = 3;
+            g.stroke();
+            g.shadowBlur = 0;
+        }
+    }
+}
+
+// Paint evenly spaced vertical road lines into a transparent strip
+function paintRoadGrid(g, gridSpacing) {
+    g.strokeStyle = 'rgba(0, 221, 255, 0.15)';
+    g.lineWidth = 1;
+    for (let x = 0; x < VIEW_WIDTH + gridSpacing * 2; x += gridSpacing) {
+        g.beginPath();
+        g.moveTo(x, ROAD_TOP);
+        g.lineTo(x, ROAD_TOP + NUM_LANES * LANE_HEIGHT);
+        g.stroke();
+    }
+}
+
+// Paint the glowing road edges into a transparent cached layer
+function paintRoadEdges(g) {
+    g.shadowColor = '#00DDFF';
+    g.shadowBlur = 15;
+    g.strokeStyle = '#00DDFF';
+    g.lineWidth = 3;
+    g.beginPath();
+    g.moveTo(0, ROAD_TOP);
+    g.lineTo(VIEW_WIDTH, ROAD_TOP);
+    g.stroke();
+    g.beginPath();
+    g.moveTo(0, ROAD_TOP + NUM_LANES * LANE_HEIGHT);
+    g.lineTo(VIEW_WIDTH, ROAD_TOP + NUM_LANES * LANE_HEIGHT);
+    g.stroke();
+}
+
+// Draw the Recognizer (big enemy ship in background)
+function drawRecognizer() {
+    const recX = VIEW_WIDTH - 150;
+    const recY = 30 + Math.sin(recognizerPhase) * 20;
+    const pulse = glowStep(0.7 + Math.sin(simTime / 200) * 0.3);
+    
+    drawGlowSprite(`recognizer:${pulse}`, recX, recY, [-22, 38, 144, 84], 15 * pulse,
+        g => paintRecognizer(g, pulse));
+}
+
+// Paint the Recognizer with its origin at (0, 0)
+function paintRecognizer(g, pulse) {
+    // Main body
+    g.fillStyle = '#0a0a0a';
+    g.beginPath();
+    g.moveTo(0, 40);
+    g.lineTo(100, 40);
+    g.lineTo(120, 60);
+    g.lineTo(100, 80);
+    g.lineTo(0, 80);
+    g.lineTo(-20, 60);
+    g.closePath();
+    g.fill();
+    
+    // Orange circuit lines
+    g.strokeStyle = '#FF8800';
+    g.shadowColor = '#FF8800';
+    g.shadowBlur = 10 * pulse;
+    g.lineWidth = 2;
+    g.stroke();
+    
+    // Legs
+    g.fillStyle = '#0a0a0a';
+    g.fillRect(10, 80, 15, 40);
+    g.fillRect(75, 80, 15, 40);
+    g.strokeStyle = '#FF8800';
+    g.strokeRect(10, 80, 15, 40);
+    g.strokeRect(75, 80, 15, 40);
+    
+    // Eye/Scanner
+    g.fillStyle = '#FF0044';
+    g.shadowColor = '#FF0044';
+    g.shadowBlur = 15 * pulse;
+    g.beginPath();
+    g.ellipse(50, 60, 20, 8, 0, 0, Math.PI * 2);
+    g.fill();
+}
+
+// Draw player Light Cycle
+function drawLightCycle() {
+    const char = characters[selectedCharacter];
+    const mainColor = char.circuitColor || '#00FFFF';
+    const laneY = ROAD_TOP + currentLane * LANE_HEIGHT + LANE_HEIGHT / 2;
+    const x = lightCycleX;
+    const y = laneY - LIGHT_CYCLE_HEIGHT / 2;
+    
+    drawGlowSprite(`lightcycle:${mainColor}`, x, y, [-52, -9, LIGHT_CYCLE_WIDTH + 53, LIGHT_CYCLE_HEIGHT + 10], 20,
+        g => paintLightCycle(g, mainColor));
+    
+    // Player name
+    if (playerName) {
+        ctx.font = 'bold 10px "Courier New", monospace';
+        ctx.textAlign = 'center';
+        drawGlowText(playerName.toUpperCase(), x + LIGHT_CYCLE_WIDTH / 2, y - 15, mainColor, 5);
+        ctx.textAlign = 'left';
+    }
+}
+
+// Paint the light cycle and its trail with the cycle's top-left corner at (0, 0)
+function paintLightCycle(g, mainColor) {
+    // Trail effect
+    g.shadowColor = mainColor;
+    g.shadowBlur = 20;
+    g.strokeStyle = mainColor;
+    g.lineWidth = 3;
+    g.beginPath();
+    g.moveTo(-50, LIGHT_CYCLE_HEIGHT / 2);
+    g.lineTo(0, LIGHT_CYCLE_HEIGHT / 2);
+    g.stroke();
+    g.shadowBlur = 0;
+    
+    // Cycle body
+    g.fillStyle = '#000000';
+    g.beginPath();
+    g.moveTo(LIGHT_CYCLE_WIDTH, LIGHT_CYCLE_HEIGHT / 2);
+    g.lineTo(LIGHT_CYCLE_WIDTH - 15, 0);
+    g.lineTo(10, 0);
+    g.lineTo(0, 10);
+    g.lineTo(0, LIGHT_CYCLE_HEIGHT - 10);
+    g.lineTo(10, LIGHT_CYCLE_HEIGHT);
+    g.lineTo(LIGHT_CYCLE_WIDTH - 15, LIGHT_CYCLE_HEIGHT);
+    g.closePath();
+    g.fill();
+    
+    // Circuit outline
+    g.strokeStyle = mainColor;
+    g.shadowColor = mainColor;
+    g.shadowBlur = 8;
+    g.lineWidth = 2;
+    g.stroke();
+    
+    // Wheel
+    g.fillStyle = mainColor;
+    g.beginPath();
+    g.arc(LIGHT_CYCLE_WIDTH - 10, LIGHT_CYCLE_HEIGHT / 2, 8, 0, Math.PI * 2);
+    g.fill();
+    
+    // Rider silhouette
+    g.fillStyle = '#000';
+    g.fillRect(20, -8, 20, 12);
+    g.strokeStyle = mainColor;
+    g.lineWidth = 1;
+    g.strokeRect(20, -8, 20, 12);
+    
+    g.shadowBlur = 0;
+}
+
+// Draw lane enemy
+function drawLaneEnemy(enemy) {
+    if (!enemy.active) return;
+    
+    const laneY = ROAD_TOP + enemy.lane * LANE_HEIGHT + LANE_HEIGHT / 2;
+    const x = enemy.x - cameraX;
+    const y = laneY - enemy.height / 2;
+    const pulse = glowStep(0.7 + Math.sin(simTime / 150) * 0.3);
+    
+    // Skip if off screen
+    if (x < -100 || x > VIEW_WIDTH + 100) return;
+    
+    const key = `lane:${enemy.type}:${enemy.width}:${enemy.height}:${enemy.health > 1}:${pulse}`;
+    drawGlowSprite(key, x, y, [-2, -10, enemy.width + 4, enemy.height + 12], 10 * pulse,
+        g => paintLaneEnemy(g, enemy, pulse));
+}
+
+// Paint a lane enemy with its top-left corner at (0, 0)
+function paintLaneEnemy(g, enemy, pulse) {
+    if (enemy.type === 'cycle') {
+        // Enemy light cycle - red
+        g.fillStyle = '#000';
+        g.beginPath();
+        g.moveTo(enemy.width, enemy.height / 2);
+        g.lineTo(enemy.width - 10, 0);
+        g.lineTo(5, 0);
+        g.lineTo(0, enemy.height / 2);
+        g.lineTo(5, enemy.height);
+        g.lineTo(enemy.width - 10, enemy.height);
+        g.closePath();
+        g.fill();
+        
+        g.strokeStyle = '#FF0044';
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 8 * pulse;
+        g.lineWidth = 2;
+        g.stroke();
+        
+    } else if (enemy.type === 'barrier') {
+        // Digital barrier
+        g.fillStyle = '#000';
+        g.fillRect(0, 0, enemy.width, enemy.height);
+        
+        g.strokeStyle = '#FF8800';
+        g.shadowColor = '#FF8800';
+        g.shadowBlur = 10 * pulse;
+        g.lineWidth = 3;
+        g.strokeRect(0, 0, enemy.width, enemy.height);
+        
+        // Warning pattern
+        g.fillStyle = '#FF8800';
+        for (let i = 0; i < enemy.width; i += 20) {
+            g.fillRect(i, 0, 10, 5);
+            g.fillRect(i + 10, enemy.height - 5, 10, 5);
+        }
+        
+    } else if (enemy.type === 'sentry') {
+        // Sentry drone
+        g.fillStyle = '#000';
+        g.beginPath();
+        g.arc(enemy.width/2, enemy.height/2, enemy.width/2, 0, Math.PI * 2);
+        g.fill();
+        
+        g.strokeStyle = '#FF0066';
+        g.shadowColor = '#FF0066';
+        g.shadowBlur = 10 * pulse;
+        g.lineWidth = 2;
+        g.stroke();
+        
+        // Eye
+        g.fillStyle = '#FF0066';
+        g.beginPath();
+        g.arc(enemy.width/2, enemy.height/2, 5, 0, Math.PI * 2);
+        g.fill();
+        
+        // Health indicator
+        if (enemy.health > 1) {
+            g.fillRect(enemy.width/2 - 10, -8, 20, 4);
+        }
+    }
+}
+
+// Draw recognizer missile
+function drawRecognizerMissile(x, y) {
+    const pulse = glowStep(0.8 + Math.sin(simTime / 100) * 0.2);
+    
+    drawGlowSprite(`recognizer-missile:${pulse}`, x, y, [0, 0, 25, 20], 12 * pulse, g => {
+        g.shadowColor = '#FF8800';
+        g.shadowBlur = 12 * pulse;
+        
+        // Missile body
+        g.fillStyle = '#FF8800';
+        g.beginPath();
+        g.moveTo(0, 0);
+        g.lineTo(25, 6);
+        g.lineTo(25, 14);
+        g.lineTo(0, 20);
+        g.lineTo(10, 10);
+        g.closePath();
+        g.fill();
+        
+        // Black center
+        g.fillStyle = '#000';
+        g.fillRect(8, 6, 12, 8);
+    });
+}
+
+// Update Light Cycle
+function updateLightCycle() {
+    // Lane switching
+    if (keys.jump && currentLane > 0) {
+        currentLane--;
+        keys.jump = false; // Prevent holding
+    }
+    if (keys.down && currentLane < NUM_LANES - 1) {
+        currentLane++;
+        keys.down = false;
+    }
+    
+    // Auto-scroll
+    cameraX += 4;
+    roadOffset += 4;
+    
+    // Update recognizer
+    recognizerPhase += 0.02;
+    
+    // Spawn recognizer missiles
+    if (random() < 0.015) { // ~1% chance per frame
+        const targetLane = Math.floor(random() * NUM_LANES);
+        const slot = spawnProjectile(recognizerMissiles, VIEW_WIDTH + 50,
+            ROAD_TOP + targetLane * LANE_HEIGHT + LANE_HEIGHT / 2 - 10, -8, 0);
+        if (slot >= 0) recognizerMissiles.lane[slot] = targetLane;
+    }
+    
+    // Check if reached end (after ~6000 distance)
+    if (cameraX > 6000) {
+        gameWon();
+    }
+    
+    // Update player collision box
+    player.x = lightCycleX;
+    player.y = ROAD_TOP + currentLane * LANE_HEIGHT + LANE_HEIGHT / 2 - LIGHT_CYCLE_HEIGHT / 2;
+    player.width = LIGHT_CYCLE_WIDTH;
+    player.height = LIGHT_CYCLE_HEIGHT;
+}
+
+// Update lane enemies
+function updateLaneEnemies() {
+    const playerLaneY = ROAD_TOP + currentLane * LANE_HEIGHT;
+    
+    laneEnemies.forEach(enemy => {
+        if (!enemy.active) return;
+        
+        const screenX = enemy.x - cameraX;
+        
+        // Check collision with player
+        if (enemy.lane === currentLane && 
+            screenX < lightCycleX + LIGHT_CYCLE_WIDTH &&
+            screenX + enemy.width > lightCycleX) {
+            
+            if (invincibilityTimer <= 0) {
+                const damage = enemy.type === 'barrier' ? 20 : 15;
+                playerHealth -= damage;
+                invincibilityTimer = 45;
+                enemy.active = false;
+                
+                if (playerHealth <= 0) {
+                    gameOver();
+                }
+            }
+        }
+        
+        // Deactivate if passed
+        if (screenX < -100) {
+            enemy.active = false;
+            score += 5; // Points for passing obstacles
+        }
+    });
+}
+
+// Update recognizer missiles
+function updateRecognizerMissiles() {
+    moveProjectiles(recognizerMissiles);
+    for (let i = recognizerMissiles.count - 1; i >= 0; i--) {
+        const x = recognizerMissiles.x[i];
+        
+        // Remove if off screen
+        if (x < -50) {
+            removeProjectile(recognizerMissiles, i);
+            continue;
+        }
+        
+        // Check collision with player
+        if (recognizerMissiles.lane[i] === currentLane &&
+            x < lightCycleX + LIGHT_CYCLE_WIDTH &&
+            x + 25 > lightCycleX &&
+            invincibilityTimer <= 0) {
+            
+            playerHealth -= 10;
+            invincibilityTimer = 30;
+            removeProjectile(recognizerMissiles, i);
+            
+            if (playerHealth <= 0) {
+                gameOver();
+            }
+        }
+    }
+}
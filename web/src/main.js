@@ -0,0 +1,326 @@
+// ⚡ Game loop - update, draw and startup
+
+// Game over
+function gameOver() {
+    gameState = 'lost';
+    const levelName = currentLevel === 1 ? 'THE GRID' : 'NYC';
+    showOverlay('⚠ DEREZZED ⚠', `${playerName.toUpperCase()} was derezzed in ${levelName}<br>
+        <span style="color: #888; font-size: 14px;">Checkpoint: Level ${currentLevel} | Total: ${score + totalScore} bits</span><br>
+        <span style="color: #00FFFF; font-size: 12px;">Press R to restart from checkpoint</span>`);
+}
+
+// Game won - both levels complete!
+function gameWon() {
+    const finalScore = score + totalScore;
+    gameState = 'won';
+    showOverlay('⚡ MISSION COMPLETE ⚡', `${playerName.toUpperCase()} conquered all dimensions!<br>
+        <span style="color: #FFD700; font-size: 18px;">TOTAL SCORE: ${finalScore} energy bits</span><br>
+        <span style="color: #00DDFF; font-size: 14px;">Grid ✓ NYC ✓ Space ✓ Light Cycle ✓</span><br>
+        <span style="color: #00FFFF; font-size: 12px;">Press R to play again</span>`);
+}
+
+// Fixed timestep - the game always advances in 60 Hz steps (every speed is tuned
+// per step), whatever the display's refresh rate; drawing interpolates in between
+const STEP_MS = 1000 / 60;
+const MAX_STEPS_PER_FRAME = 5;      // After a long stall, drop the backlog rather than fast-forward
+const STEP_SLACK = 0.5;             // ms - frame timestamps jitter, so a 60 Hz display still gets one step a frame
+const INTERPOLATE_LIMIT = 60;       // Bigger jumps (respawns, level loads) snap instead of sliding
+let lastFrameTime = null;
+let stepAccumulator = 0;
+
+// Positions drawn between the previous step and the current one, as [get, set] pairs
+const INTERPOLATED = [
+    [() => cameraX, value => { cameraX = value; }],
+    [() => player.x, value => { player.x = value; }],
+    [() => player.y, value => { player.y = value; }],
+    [() => jetY, value => { jetY = value; }],
+    [() => roadOffset, value => { roadOffset = value; }],
+    [() => simTime, value => { simTime = value; }],
+];
+const previousPositions = new Float64Array(INTERPOLATED.length);
+const currentPositions = new Float64Array(INTERPOLATED.length);
+
+// Entity lists whose members move every step - each entity keeps its position
+// from the start of the step in prevX/prevY (new ones draw where they are)
+const discs = [disc];
+const INTERPOLATED_ENTITIES = [() => enemies, () => turtles, () => nycEnemies, () => spaceDrones, () => discs];
+const INTERPOLATED_POOLS = [enemyDiscs, missiles, droneProjectiles, recognizerMissiles];
+const entityPositions = [];
+
+// Remember where everything is before a step moves it
+function saveStepPositions() {
+    INTERPOLATED.forEach(([get], i) => { previousPositions[i] = get(); });
+    INTERPOLATED_ENTITIES.forEach(list => {
+        for (const entity of list()) {
+            entity.prevX = entity.x;
+            entity.prevY = entity.y;
+        }
+    });
+    INTERPOLATED_POOLS.forEach(saveProjectilePositions);
+}
+
+// One fixed step: apply the input that arrived since the last one, then advance the game and clock
+function stepSimulation() {
+    applyPendingInput();
+    update();
+    simTick++;
+    simTime = simTick * STEP_MS;
+}
+
+// Update game
+function update() {
+    // Fade between levels
+    if (gameState === 'transition') {
+        updateTransition();
+        return;
+    }
+    
+    if (gameState !== 'playing') return;
+    
+    animationFrame++;
+    portal.animTimer++;
+    
+    // Update invincibility timer
+    if (invincibilityTimer > 0) {
+        invincibilityTimer--;
+    }
+    
+    // Level 3 - Space shooter mode
+    if (currentLevel === 3) {
+        updateJet();
+        updateMissiles();
+        updateSpaceDrones();
+        return; // Skip platformer updates
+    }
+    
+    // Level 4 - Light Cycle Runner mode
+    if (currentLevel === 4) {
+        updateLightCycle();
+        updateLaneEnemies();
+        updateRecognizerMissiles();
+        return; // Skip platformer updates
+    }
+    
+    updatePlayer();
+    updateCoins();
+    updateEnemies();
+    
+    // Update player disc (Level 2 only)
+    if (currentLevel === 2) {
+        updateDisc();
+    }
+    
+    // Update NYC enemies for Level 2
+    if (currentLevel === 2) {
+        updateNYCEnemies();
+        updateEnemyDiscs();
+    }
+    
+    checkFlag();
+    
+    // Move clouds (gentle drift) - Level 1 only
+    if (currentLevel === 1) {
+        clouds.forEach(cloud => {
+            cloud.x -= 0.15;
+            if (cloud.x < -60) cloud.x = VIEW_WIDTH + 30;
+        });
+    }
+}
+
+// Draw game with camera offset
+function draw() {
+    // Show title screen
+    if (gameState === 'title') {
+        hideHUD();
+        drawTitleScreen();
+        return;
+    }
+    
+    // Show character selection
+    if (gameState === 'character') {
+        hideHUD();
+        drawCharacterSelect();
+        return;
+    }
+    
+    // Handle transition
+    if (gameState === 'transition') {
+        hideHUD();
+        drawSky();
+        drawTransition();
+        return;
+    }
+    
+    // The level's sky and the HUD live on their own canvases (see layers.js) and
+    // only repaint when they change - the world canvas is redrawn from clear
+    updateBackdrop();
+    updateHUD();
+    ctx.clearRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    
+    // Level 3 - Space Shooter drawing
+    if (currentLevel === 3) {
+        drawSpaceBackground();
+        
+        // Draw space elements (with camera offset for scrolling)
+        ctx.save();
+        ctx.translate(-cameraX, 0);
+        
+        // Draw missiles
+        drawProjectiles(missiles, drawMissile);
+        
+        // Draw drones
+        spaceDrones.forEach(drawSpaceDrone);
+        
+        // Draw drone projectiles
+        drawProjectiles(droneProjectiles, drawDroneProjectile);
+        
+        // Draw portal at end
+        drawSpacePortal();
+        
+        ctx.restore();
+        
+        // Draw jet (fixed position on screen)
+        // Flash when invincible
+        if (invincibilityTimer <= 0 || Math.floor(invincibilityTimer / 5) % 2 === 1) {
+            drawJet();
+        }
+        
+        return;
+    }
+    
+    // Level 4 - Light Cycle Runner drawing
+    if (currentLevel === 4) {
+        drawLightCycleRoad();
+        drawRecognizer();
+        
+        // Draw lane enemies
+        laneEnemies.forEach(drawLaneEnemy);
+        
+        // Draw recognizer missiles
+        drawProjectiles(recognizerMissiles, drawRecognizerMissile);
+        
+        // Draw player light cycle (flash when invincible)
+        if (invincibilityTimer <= 0 || Math.floor(invincibilityTimer / 5) % 2 === 1) {
+            drawLightCycle();
+        }
+        
+        return;
+    }
+    
+    // Draw level-specific background
+    if (currentLevel === 2) {
+        drawNYCSky();
+        drawNYCBuildings();
+    }
+    
+    // Save context and apply camera transform
+    ctx.save();
+    ctx.translate(-cameraX, 0);
+    
+    // Draw background elements (parallax - slower), skipped on the low quality tier
+    if (currentLevel === 1 && quality.parallax) {
+        ctx.save();
+        ctx.translate(cameraX * 0.5, 0);
+        drawHills();
+        ctx.restore();
+    }
+    
+    // Draw clouds with parallax (Level 1 only)
+    if (currentLevel === 1 && quality.parallax) {
+        ctx.save();
+        ctx.translate(cameraX * 0.7, 0);
+        drawClouds();
+        ctx.restore();
+    }
+    
+    // Draw game objects - only the ones in view (see spatial.js)
+    forEachVisible(platforms, drawPlatform);
+    forEachVisible(coins, drawCoin);
+    
+    // Level 1 enemies
+    forEachVisible(enemies, drawEnemy);
+    forEachVisible(turtles, drawTurtle);
+    
+    // Level 2 enemies
+    forEachVisible(nycEnemies, drawNYCEnemy);
+    
+    // Enemy discs (Level 2)
+    drawProjectiles(enemyDiscs, drawEnemyDisc);
+    
+    drawFlag();
+    drawPlayer();
+    
+    // Player disc (Level 2 only)
+    if (currentLevel === 2) {
+        drawDisc();
+    }
+    
+    ctx.restore();
+}
+
+// Draw the world alpha of the way from the previous step to the current one
+function drawInterpolated(alpha) {
+    INTERPOLATED.forEach(([get, set], i) => {
+        const current = get();
+        const previous = previousPositions[i];
+        currentPositions[i] = current;
+        if (Math.abs(current - previous) < INTERPOLATE_LIMIT) {
+            set(previous + (current - previous) * alpha);
+        }
+    });
+    entityPositions.length = 0;
+    INTERPOLATED_ENTITIES.forEach(list => {
+        for (const entity of list()) {
+            const { x, y, prevX, prevY } = entity;
+            entityPositions.push(x, y);
+            if (Math.abs(x - prevX) < INTERPOLATE_LIMIT && Math.abs(y - prevY) < INTERPOLATE_LIMIT) {
+                entity.x = prevX + (x - prevX) * alpha;
+                entity.y = prevY + (y - prevY) * alpha;
+            }
+        }
+    });
+    drawAlpha = alpha;
+    draw();
+    drawAlpha = 1;
+    INTERPOLATED.forEach(([, set], i) => set(currentPositions[i]));
+    let next = 0;
+    INTERPOLATED_ENTITIES.forEach(list => {
+        for (const entity of list()) {
+            entity.x = entityPositions[next++];
+            entity.y = entityPositions[next++];
+        }
+    });
+}
+
+// Game loop - time is the frame timestamp from requestAnimationFrame
+function gameLoop(time) {
+    if (time === undefined) time = performance.now();
+    if (lastFrameTime === null) lastFrameTime = time;
+    const frameMs = time - lastFrameTime;
+    const workStart = performance.now();
+    stepAccumulator += frameMs;
+    lastFrameTime = time;
+    
+    let steps = 0;
+    while (stepAccumulator > STEP_MS - STEP_SLACK && steps < MAX_STEPS_PER_FRAME) {
+        saveStepPositions();
+        stepSimulation();
+        stepAccumulator -= STEP_MS;
+        steps++;
+    }
+    if (stepAccumulator > STEP_MS - STEP_SLACK) stepAccumulator = 0;
+    
+    const drawStart = performance.now();
+    drawInterpolated(Math.max(0, stepAccumulator / STEP_MS));
+    const drawEnd = performance.now();
+    recordPerfFrame(frameMs, drawStart - workStart, drawEnd - drawStart);
+    governResolution(frameMs, drawEnd - workStart);
+    governQuality(frameMs);
+    if (perfHUD.visible) drawPerfHUD();
+    nextFrame(gameLoop);
+}
+
+// Start game
+initGame();
+gameLoop();
+if (IN_WORKER) postMessage({ type: 'ready' });
@@ -0,0 +1,416 @@
+// ⚡ Title screen and character select
+
+// Draw title screen - TRON style
+function drawTitleScreen() {
+    const time = simTime / 1000;
+    
+    drawOffscreen(cachedLayer('title', VIEW_WIDTH, VIEW_HEIGHT, paintTitleBackground), 0, 0);
+    
+    // Animated data streams
+    ctx.strokeStyle = 'rgba(255, 0, 68, 0.3)';
+    ctx.lineWidth = 2;
+    for (let i = 0; i < 8; i++) {
+        const streamX = (i * 120 + time * 50) % (VIEW_WIDTH + 100) - 50;
+        const streamY = 50 + i * 20;
+        ctx.beginPath();
+        ctx.moveTo(streamX, streamY);
+        ctx.lineTo(streamX + 40 + Math.sin(time + i) * 10, streamY);
+        ctx.stroke();
+    }
+    
+    // Title with neon glow - RED only
+    ctx.font = 'bold 44px "Courier New", monospace';
+    ctx.textAlign = 'center';
+    drawGlowText('SUPER PRADY BROS', VIEW_WIDTH / 2, 100, '#FF0044', 30);
+    
+    // Subtitle
+    ctx.font = '20px "Courier New", monospace';
+    drawGlowText('[ ENTER THE GRID ]', VIEW_WIDTH / 2, 140, COLORS.neonOrange, 15);
+    
+    // Draw preview program
+    const previewX = VIEW_WIDTH / 2 - 18;
+    const previewY = 180 + Math.sin(time * 2) * 5;
+    drawCharacterPreview(previewX, previewY, characters[0]);
+    
+    // Name input box (angular TRON style)
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.8)';
+    const boxX = VIEW_WIDTH / 2 - 150;
+    const boxY = 290;
+    ctx.fillRect(boxX, boxY, 300, 45);
+    
+    // Glowing border
+    drawGlowRect(boxX, boxY, 300, 45, nameInputActive ? COLORS.neonOrange : '#FF0044', nameInputActive ? 15 : 8, 2);
+    
+    // Label
+    ctx.fillStyle = '#FF0044';
+    ctx.font = '14px "Courier New", monospace';
+    ctx.fillText('ENTER PROGRAM ID:', VIEW_WIDTH / 2, boxY - 10);
+    
+    // Name text or placeholder
+    ctx.font = 'bold 20px "Courier New", monospace';
+    if (playerName) {
+        drawGlowText(playerName.toUpperCase(), VIEW_WIDTH / 2, boxY + 28, '#FF0044', 10);
+    } else {
+        ctx.fillStyle = 'rgba(255, 0, 68, 0.3)';
+        ctx.fillText('_', VIEW_WIDTH / 2, boxY + 28);
+    }
+    
+    // Cursor blink
+    if (nameInputActive && Math.floor(time * 3) % 2 === 0) {
+        const textWidth = ctx.measureText(playerName.toUpperCase()).width;
+        ctx.fillStyle = COLORS.neonOrange;
+        ctx.fillRect(VIEW_WIDTH / 2 + textWidth / 2 + 5, boxY + 10, 3, 25);
+    }
+    
+    // Start button
+    const canStart = playerName.length >= 1;
+    const btnY = 380;
+    const pulse = glowStep(0.8 + Math.sin(time * 4) * 0.2);
+    const btnText = canStart ? '[ SELECT PROGRAM ]' : '[ ENTER ID FIRST ]';
+    
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.8)';
+    ctx.fillRect(VIEW_WIDTH / 2 - 130, btnY, 260, 45);
+    
+    if (canStart) {
+        drawGlowRect(VIEW_WIDTH / 2 - 130, btnY, 260, 45, '#FF0044', 15 * pulse, 2);
+    } else {
+        ctx.strokeStyle = 'rgba(255, 0, 68, 0.3)';
+        ctx.lineWidth = 2;
+        ctx.strokeRect(VIEW_WIDTH / 2 - 130, btnY, 260, 45);
+    }
+    
+    ctx.fillStyle = canStart ? '#FF0044' : 'rgba(255, 0, 68, 0.4)';
+    ctx.font = 'bold 18px "Courier New", monospace';
+    ctx.fillText(btnText, VIEW_WIDTH / 2, btnY + 28);
+    
+    // Instructions
+    ctx.fillStyle = 'rgba(255, 0, 68, 0.5)';
+    ctx.font = '12px "Courier New", monospace';
+    ctx.fillText('PRESS ENTER TO CONTINUE', VIEW_WIDTH / 2, 470);
+    
+    ctx.textAlign = 'left';
+}
+
+// Paint the title screen's backdrop and grid floor into a cached layer
+function paintTitleBackground(g) {
+    // Dark gradient background
+    const gradient = g.createLinearGradient(0, 0, 0, VIEW_HEIGHT);
+    gradient.addColorStop(0, '#000000');
+    gradient.addColorStop(0.5, '#050510');
+    gradient.addColorStop(1, '#0a0a1a');
+    g.fillStyle = gradient;
+    g.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    
+    // Grid floor
+    g.strokeStyle = 'rgba(255, 0, 68, 0.1)';
+    g.lineWidth = 1;
+    for (let y = 350; y < VIEW_HEIGHT; y += 15) {
+        g.beginPath();
+        g.moveTo(0, y);
+        g.lineTo(VIEW_WIDTH, y);
+        g.stroke();
+    }
+    for (let x = 0; x < VIEW_WIDTH; x += 60) {
+        g.beginPath();
+        g.moveTo(x, 350);
+        g.lineTo(x, VIEW_HEIGHT);
+        g.stroke();
+    }
+}
+
+// Draw character selection screen - TRON style carousel
+function drawCharacterSelect() {
+    const time = simTime / 1000;
+    
+    drawOffscreen(cachedLayer('select', VIEW_WIDTH, VIEW_HEIGHT, paintSelectBackground), 0, 0);
+    
+    // Title
+    ctx.font = 'bold 36px "Courier New", monospace';
+    ctx.textAlign = 'center';
+    drawGlowText('[ SELECT PROGRAM ]', VIEW_WIDTH / 2, 50, COLORS.neonCyan, 25);
+    
+    // Player ID display
+    ctx.fillStyle = COLORS.neonOrange;
+    ctx.font = '16px "Courier New", monospace';
+    ctx.fillText(`ID: ${playerName.toUpperCase()}`, VIEW_WIDTH / 2, 75);
+    
+    // Carousel settings
+    const cardWidth = 140;
+    const cardHeight = 200;
+    const cardY = 100;
+    const centerX = VIEW_WIDTH / 2;
+    const cardSpacing = 160;
+    
+    // Navigation arrows
+    ctx.font = 'bold 40px "Courier New", monospace';
+    drawGlowText('<', 50, cardY + cardHeight / 2 + 15, COLORS.neonCyan, 10);
+    drawGlowText('>', VIEW_WIDTH - 50, cardY + cardHeight / 2 + 15, COLORS.neonCyan, 10);
+    
+    // Draw character cards
+    for (let offset = -2; offset <= 2; offset++) {
+        let charIndex = (selectedCharacter + offset + characters.length) % characters.length;
+        const char = characters[charIndex];
+        const isSelected = offset === 0;
+        
+        const cardX = centerX + offset * cardSpacing - cardWidth / 2;
+        const scale = isSelected ? 1.0 : 0.7;
+        const opacity = isSelected ? 1.0 : 0.5;
+        const yOffset = isSelected ? 0 : 25;
+        const pulse = isSelected ? glowStep(0.8 + Math.sin(time * 4) * 0.2) : 1;
+        
+        if (cardX < -cardWidth || cardX > VIEW_WIDTH + cardWidth) continue;
+        
+        ctx.save();
+        ctx.globalAlpha = opacity;
+        
+        const scaledWidth = cardWidth * scale;
+        const scaledHeight = cardHeight * scale;
+        const scaledX = cardX + (cardWidth - scaledWidth) / 2;
+        const scaledY = cardY + yOffset + (cardHeight - scaledHeight) / 2;
+        
+        // Card background (angular TRON style)
+        ctx.fillStyle = 'rgba(0, 0, 0, 0.9)';
+        ctx.fillRect(scaledX, scaledY, scaledWidth, scaledHeight);
+        
+        // Card border with glow
+        if (isSelected) {
+            drawGlowRect(scaledX, scaledY, scaledWidth, scaledHeight, char.circuitColor, 20 * pulse, 3);
+        } else {
+            ctx.strokeStyle = 'rgba(0, 255, 255, 0.3)';
+            ctx.lineWidth = 1;
+            ctx.strokeRect(scaledX, scaledY, scaledWidth, scaledHeight);
+        }
+        
+        // Corner accents
+        if (isSelected) {
+            ctx.fillStyle = char.circuitColor;
+            ctx.fillRect(scaledX, scaledY, 15, 3);
+            ctx.fillRect(scaledX, scaledY, 3, 15);
+            ctx.fillRect(scaledX + scaledWidth - 15, scaledY, 15, 3);
+            ctx.fillRect(scaledX + scaledWidth - 3, scaledY, 3, 15);
+            ctx.fillRect(scaledX, scaledY + scaledHeight - 3, 15, 3);
+            ctx.fillRect(scaledX, scaledY + scaledHeight - 15, 3, 15);
+            ctx.fillRect(scaledX + scaledWidth - 15, scaledY + scaledHeight - 3, 15, 3);
+            ctx.fillRect(scaledX + scaledWidth - 3, scaledY + scaledHeight - 15, 3, 15);
+        }
+        
+        // Character preview
+        ctx.save();
+        ctx.translate(scaledX + scaledWidth / 2, scaledY + scaledHeight / 2 - 20);
+        ctx.scale(scale * 1.2, scale * 1.2);
+        ctx.translate(-18, -30);
+        drawCharacterPreview(0, 0, char);
+        ctx.restore();
+        
+        // Character name
+        ctx.font = `bold ${Math.floor(14 * scale)}px "Courier New", monospace`;
+        if (isSelected) {
+            drawGlowText(char.name, scaledX + scaledWidth / 2, scaledY + scaledHeight - 35 * scale, char.circuitColor, 10);
+        } else {
+            ctx.fillStyle = 'rgba(255, 255, 255, 0.7)';
+            ctx.fillText(char.name, scaledX + scaledWidth / 2, scaledY + scaledHeight - 35 * scale);
+        }
+        
+        // Description
+        ctx.fillStyle = 'rgba(255, 255, 255, 0.5)';
+        ctx.font = `${Math.floor(10 * scale)}px "Courier New", monospace`;
+        ctx.fillText(char.description, scaledX + scaledWidth / 2, scaledY + scaledHeight - 18 * scale);
+        
+        ctx.restore();
+    }
+    
+    // Program counter
+    ctx.fillStyle = 'rgba(0, 255, 255, 0.7)';
+    ctx.font = '14px "Courier New", monospace';
+    ctx.fillText(`[ ${selectedCharacter + 1} / ${characters.length} ]`, VIEW_WIDTH / 2, 340);
+    
+    // Navigation hints
+    ctx.fillStyle = 'rgba(0, 255, 255, 0.5)';
+    ctx.font = '12px "Courier New", monospace';
+    ctx.fillText('< > SELECT  |  ENTER INITIALIZE', VIEW_WIDTH / 2, 365);
+    
+    // Initialize button
+    const btnY = 395;
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.9)';
+    ctx.fillRect(VIEW_WIDTH / 2 - 120, btnY, 240, 45);
+    
+    const selectedChar = characters[selectedCharacter];
+    drawGlowRect(VIEW_WIDTH / 2 - 120, btnY, 240, 45, selectedChar.circuitColor, 15, 2);
+    
+    ctx.fillStyle = selectedChar.circuitColor;
+    ctx.font = 'bold 16px "Courier New", monospace';
+    ctx.fillText(`[ INITIALIZE ${selectedChar.name} ]`, VIEW_WIDTH / 2, btnY + 28);
+    
+    // Back hint
+    ctx.fillStyle = 'rgba(255, 255, 255, 0.3)';
+    ctx.font = '11px "Courier New", monospace';
+    ctx.fillText('ESC: RETURN', VIEW_WIDTH / 2, 475);
+    
+    ctx.textAlign = 'left';
+}
+
+// Paint the character select backdrop into a cached layer
+function paintSelectBackground(g) {
+    // Dark background with grid
+    const gradient = g.createLinearGradient(0, 0, 0, VIEW_HEIGHT);
+    gradient.addColorStop(0, '#000000');
+    gradient.addColorStop(1, '#0a0a15');
+    g.fillStyle = gradient;
+    g.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+    
+    // Grid lines
+    g.strokeStyle = 'rgba(0, 255, 255, 0.08)';
+    g.lineWidth = 1;
+    for (let x = 0; x < VIEW_WIDTH; x += 40) {
+        g.beginPath();
+        g.moveTo(x, 0);
+        g.lineTo(x, VIEW_HEIGHT);
+        g.stroke();
+    }
+    for (let y = 0; y < VIEW_HEIGHT; y += 40) {
+        g.beginPath();
+        g.moveTo(0, y);
+        g.lineTo(VIEW_WIDTH, y);
+        g.stroke();
+    }
+}
+
+// Draw character preview - TRON 8-bit style
+function drawCharacterPreview(x, y, char) {
+    const floatY = y + Math.sin(simTime / 300) * 3;
+    const pulse = glowStep(0.7 + Math.sin(simTime / 200) * 0.3);
+    const charIndex = characters.indexOf(char);
+    
+    drawCharacterFrame(charIndex, `preview-glow:${pulse}`, x, y);
+    drawCharacterFrame(charIndex, `preview:${pulse}`, x, floatY);
+}
+
+// Paint the ground glow under a preview
+function paintPreviewGlow(g, circuitColor, pulse) {
+    g.shadowColor = circuitColor;
+    g.shadowBlur = 12 * pulse;
+    g.fillStyle = `rgba(${hexToRgb(circuitColor)}, 0.3)`;
+    g.beginPath();
+    g.ellipse(18, 58, 12, 3, 0, 0, Math.PI * 2);
+    g.fill();
+}
+
+// Paint a character's body with its top-left corner at (0, 0)
+function paintCharacterPreview(g, char, pulse) {
+    const circuitColor = char.circuitColor || '#00FFFF';
+    const secondaryColor = char.secondaryColor || '#0088FF';
+    
+    // === 8-BIT TRON BODY ===
+    
+    // Body base (dark suit)
+    g.fillStyle = '#0a0a0a';
+    
+    // Torso
+    g.fillRect(6, 14, 24, 28);
+    
+    // Head
+    g.fillRect(8, 0, 20, 16);
+    
+    // Legs
+    g.fillRect(8, 42, 8, 12);
+    g.fillRect(20, 42, 8, 12);
+    
+    // === CIRCUIT LINES ===
+    g.shadowColor = circuitColor;
+    g.shadowBlur = 8 * pulse;
+    g.strokeStyle = circuitColor;
+    g.fillStyle = circuitColor;
+    g.lineWidth = 2;
+    
+    // Helmet/visor based on style
+    if (char.helmetStyle === 'full' || char.helmetStyle === 'visor') {
+        g.fillRect(10, 6, 16, 3);
+        g.fillRect(16, 6, 4, 8);
+    } else if (char.helmetStyle === 'sleek' || char.helmetStyle === 'elegant' || char.helmetStyle === 'feminine') {
+        g.beginPath();
+        g.moveTo(10, 8);
+        g.lineTo(26, 8);
+        g.stroke();
+        g.fillRect(12, 6, 3, 3);
+        g.fillRect(21, 6, 3, 3);
+    } else if (char.helmetStyle === 'stylish') {
+        g.fillRect(8, 4, 20, 2);
+        g.fillRect(10, 8, 16, 2);
+    } else {
+        g.fillRect(10, 5, 16, 2);
+    }
+    
+    // Torso circuit pattern
+    if (char.circuitPattern === 'angular' || char.circuitPattern === 'aggressive') {
+        g.beginPath();
+        g.moveTo(18, 16);
+        g.lineTo(18, 24);
+        g.lineTo(10, 30);
+        g.lineTo(10, 38);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(18, 24);
+        g.lineTo(26, 30);
+        g.lineTo(26, 38);
+        g.stroke();
+    } else if (char.circuitPattern === 'flowing' || char.circuitPattern === 'organic') {
+        g.beginPath();
+        g.moveTo(18, 16);
+        g.lineTo(18, 38);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(10, 22);
+        g.lineTo(26, 22);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(10, 32);
+        g.lineTo(26, 32);
+        g.stroke();
+    } else if (char.circuitPattern === 'symmetric' || char.circuitPattern === 'elegant') {
+        g.beginPath();
+        g.moveTo(8, 18);
+        g.lineTo(18, 30);
+        g.lineTo(28, 18);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(18, 30);
+        g.lineTo(18, 40);
+        g.stroke();
+    } else if (char.circuitPattern === 'flashy') {
+        g.fillRect(8, 18, 20, 2);
+        g.fillRect(8, 26, 20, 2);
+        g.fillRect(8, 34, 20, 2);
+        g.fillRect(16, 16, 4, 24);
+    } else {
+        g.beginPath();
+        g.moveTo(18, 16);
+        g.lineTo(18, 40);
+        g.stroke();
+        g.fillRect(8, 26, 20, 2);
+    }
+    
+    // Shoulder accents
+    g.fillRect(4, 16, 4, 2);
+    g.fillRect(28, 16, 4, 2);
+    
+    // Arm circuits
+    g.fillRect(4, 20, 2, 16);
+    g.fillRect(30, 20, 2, 16);
+    
+    // Leg circuits
+    g.fillRect(10, 44, 2, 8);
+    g.fillRect(24, 44, 2, 8);
+    
+    // Boot tops
+    g.fillRect(8, 50, 8, 2);
+    g.fillRect(20, 50, 8, 2);
+    
+    // Identity disc (secondary color)
+    g.strokeStyle = secondaryColor;
+    g.shadowColor = secondaryColor;
+    g.beginPath();
+    g.arc(30, 26, 5, 0, Math.PI * 2);
+    g.stroke();
+    
+    g.shadowBlur = 0;
+}
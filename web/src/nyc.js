@@ -0,0 +1,379 @@
+// ⚡ NYC level - sky, skyline and disc-throwing enemies
+
+// Draw NYC enemy types - Digital Tron style (black body with red circuit outlines)
+function drawNYCEnemy(enemy) {
+    const { x, y, width, height, type, health } = enemy;
+    const pulse = glowStep(0.7 + Math.sin(simTime / 200) * 0.3);
+    
+    // Ground glow
+    drawGlowSprite(`nyc-glow:${width}:${height}:${pulse}`, x, y, [0, height - 2, width, 8], 8 * pulse, g => {
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 8 * pulse;
+        g.fillStyle = 'rgba(255, 0, 68, 0.3)';
+        g.beginPath();
+        g.ellipse(width/2, height + 2, width/2.5, 3, 0, 0, Math.PI * 2);
+        g.fill();
+    });
+    
+    // Drones bob up and down; jumpers squash while airborne
+    const floatY = type === 'drone' ? y + Math.sin(simTime / 120 + enemy.floatOffset) * 6 : y;
+    const squash = enemy.onGround ? 1 : 0.85;
+    const state = type === 'boss' ? health : type === 'jumper' ? squash : 0;
+    const box = [0, -10, Math.max(width, health * 12 + 8), height + 10];
+    drawGlowSprite(`nyc:${type}:${width}:${height}:${state}:${pulse}`, x, floatY, box, 8 * pulse,
+        g => paintNYCEnemy(g, type, width, height, health, squash, pulse));
+}
+
+// Paint an NYC enemy's body with its top-left corner at (0, 0)
+function paintNYCEnemy(g, type, width, height, health, squash, pulse) {
+    if (type === 'thug' || type === 'boss') {
+        // Digital Thug/Boss - 8-bit style, black with red circuit outlines
+        
+        // Solid black body
+        g.fillStyle = '#000000';
+        g.fillRect(6, 14, width - 12, height - 18);
+        g.fillRect(12, 2, width - 24, 14);
+        g.fillRect(10, height - 10, 8, 10);
+        g.fillRect(width - 18, height - 10, 8, 10);
+        
+        // Red circuit outlines
+        g.strokeStyle = '#FF0044';
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 6 * pulse;
+        g.lineWidth = 2;
+        
+        // Head outline
+        g.strokeRect(12, 2, width - 24, 14);
+        // Body outline
+        g.strokeRect(6, 14, width - 12, height - 18);
+        // Leg outlines
+        g.strokeRect(10, height - 10, 8, 10);
+        g.strokeRect(width - 18, height - 10, 8, 10);
+        
+        // Eyes - glowing red pixels
+        g.fillStyle = '#FF0044';
+        g.fillRect(16, 6, 4, 4);
+        g.fillRect(width - 20, 6, 4, 4);
+        
+        // Circuit pattern on body
+        g.beginPath();
+        g.moveTo(width/2, 16);
+        g.lineTo(width/2, height - 12);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(10, 24);
+        g.lineTo(width - 10, 24);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(10, 34);
+        g.lineTo(width - 10, 34);
+        g.stroke();
+        
+        // Health indicator for boss
+        if (type === 'boss' && health > 1) {
+            for (let i = 0; i < health; i++) {
+                g.fillRect(8 + i * 12, -8, 10, 5);
+            }
+        }
+        g.shadowBlur = 0;
+        
+    } else if (type === 'drone') {
+        // Digital Drone - 8-bit flying disc
+        
+        // Black body
+        g.fillStyle = '#000000';
+        g.beginPath();
+        g.ellipse(width/2, height/2, width/2 - 2, height/3, 0, 0, Math.PI * 2);
+        g.fill();
+        
+        // Red outline
+        g.strokeStyle = '#FF0044';
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 8 * pulse;
+        g.lineWidth = 2;
+        g.beginPath();
+        g.ellipse(width/2, height/2, width/2 - 2, height/3, 0, 0, Math.PI * 2);
+        g.stroke();
+        
+        // Center scanner eye
+        g.fillStyle = '#FF0044';
+        g.beginPath();
+        g.arc(width/2, height/2, 5, 0, Math.PI * 2);
+        g.fill();
+        
+        // Side circuit lines
+        g.lineWidth = 1;
+        g.beginPath();
+        g.moveTo(4, height/2);
+        g.lineTo(width/2 - 8, height/2);
+        g.stroke();
+        g.beginPath();
+        g.moveTo(width/2 + 8, height/2);
+        g.lineTo(width - 4, height/2);
+        g.stroke();
+        
+        g.shadowBlur = 0;
+        
+    } else if (type === 'jumper') {
+        // Digital Jumper - compact 8-bit style
+        
+        // Black body
+        g.fillStyle = '#000000';
+        g.fillRect(6, 8 * squash, width - 12, (height - 12) * squash);
+        g.fillRect(10, height - 8, 6, 8);
+        g.fillRect(width - 16, height - 8, 6, 8);
+        
+        // Red outlines
+        g.strokeStyle = '#FF0044';
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 6 * pulse;
+        g.lineWidth = 2;
+        g.strokeRect(6, 8 * squash, width - 12, (height - 12) * squash);
+        g.strokeRect(10, height - 8, 6, 8);
+        g.strokeRect(width - 16, height - 8, 6, 8);
+        
+        // Eyes
+        g.fillStyle = '#FF0044';
+        g.fillRect(12, 14 * squash, 5, 5);
+        g.fillRect(width - 17, 14 * squash, 5, 5);
+        
+        // Circuit lines
+        g.lineWidth = 1;
+        g.beginPath();
+        g.moveTo(width/2, 10 * squash);
+        g.lineTo(width/2, (height - 14) * squash);
+        g.stroke();
+        
+        g.shadowBlur = 0;
+    }
+}
+
+// Draw enemy disc (red triangular)
+function drawEnemyDisc(x, y, rotation) {
+    ctx.save();
+    ctx.translate(x, y);
+    ctx.rotate(rotation);
+    drawGlowSprite('enemy-disc', 0, 0, [-ENEMY_DISC_SIZE, -ENEMY_DISC_SIZE, ENEMY_DISC_SIZE * 2, ENEMY_DISC_SIZE * 2], 10, g => {
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 10;
+        
+        // Red triangular disc
+        g.fillStyle = '#FF0044';
+        g.beginPath();
+        g.moveTo(0, -ENEMY_DISC_SIZE);
+        g.lineTo(ENEMY_DISC_SIZE * 0.866, ENEMY_DISC_SIZE * 0.5);
+        g.lineTo(-ENEMY_DISC_SIZE * 0.866, ENEMY_DISC_SIZE * 0.5);
+        g.closePath();
+        g.fill();
+        
+        // Black center
+        g.fillStyle = '#000';
+        g.beginPath();
+        g.arc(0, 0, 3, 0, Math.PI * 2);
+        g.fill();
+    });
+    ctx.restore();
+}
+
+// Update NYC enemies (harder AI with disc shooting)
+function updateNYCEnemies() {
+    const playerCenterX = player.x + player.width / 2;
+    const playerCenterY = player.y + player.height / 2;
+    
+    nycEnemies.forEach(enemy => {
+        const distToPlayer = Math.abs(enemy.x + enemy.width/2 - playerCenterX);
+        const enemyCenterX = enemy.x + enemy.width / 2;
+        const enemyCenterY = enemy.y + enemy.height / 2;
+        
+        if (enemy.type === 'thug' || enemy.type === 'boss') {
+            // Patrol at constant speed
+            enemy.x += enemy.speed * enemy.direction;
+            
+            if (enemy.x <= enemy.patrolLeft) enemy.direction = 1;
+            if (enemy.x + enemy.width >= enemy.patrolRight) enemy.direction = -1;
+            
+            // Shoot disc at player when in range
+            if (enemy.shootTimer !== undefined) {
+                enemy.shootTimer++;
+                if (enemy.shootTimer >= enemy.shootCooldown && distToPlayer < 350) {
+                    shootEnemyDisc(enemyCenterX, enemyCenterY, playerCenterX, playerCenterY);
+                    enemy.shootTimer = 0;
+                }
+            }
+            
+        } else if (enemy.type === 'drone') {
+            // Float and move
+            enemy.x += enemy.speed * enemy.direction;
+            
+            if (enemy.x <= enemy.patrolLeft) enemy.direction = 1;
+            if (enemy.x + enemy.width >= enemy.patrolRight) enemy.direction = -1;
+            
+            // Shoot disc at player
+            if (enemy.shootTimer !== undefined) {
+                enemy.shootTimer++;
+                const floatY = enemy.y + Math.sin(simTime / 120 + enemy.floatOffset) * 6;
+                if (enemy.shootTimer >= enemy.shootCooldown && distToPlayer < 300) {
+                    shootEnemyDisc(enemyCenterX, floatY + enemy.height/2, playerCenterX, playerCenterY);
+                    enemy.shootTimer = 0;
+                }
+            }
+            
+        } else if (enemy.type === 'jumper') {
+            // Move and jump at player
+            enemy.x += enemy.speed * enemy.direction;
+            
+            if (enemy.x <= enemy.patrolLeft) enemy.direction = 1;
+            if (enemy.x + enemy.width >= enemy.patrolRight) enemy.direction = -1;
+            
+            // Jump when player is close
+            enemy.jumpCooldown--;
+            if (distToPlayer < 120 && enemy.onGround && enemy.jumpCooldown <= 0) {
+                enemy.velY = -10;
+                enemy.onGround = false;
+                enemy.jumpCooldown = 100;
+            }
+            
+            // Apply gravity
+            if (!enemy.onGround) {
+                enemy.velY += 0.5;
+                enemy.y += enemy.velY;
+                
+                forEachInRange(platforms, enemy.x, enemy.x + enemy.width, p => {
+                    if (enemy.y + enemy.height >= p.y && 
+                        enemy.y + enemy.height <= p.y + 20 &&
+                        enemy.x + enemy.width > p.x && 
+                        enemy.x < p.x + p.width) {
+                        enemy.y = p.y - enemy.height;
+                        enemy.velY = 0;
+                        enemy.onGround = true;
+                    }
+                });
+            }
+        }
+    });
+    
+    // Check collision with player (damage instead of instant death in L2) - only the enemies nearby
+    sortByX(nycEnemies);
+    forEachInRange(nycEnemies, player.x, player.x + player.width, enemy => {
+        if (checkCollision(player, enemy) && invincibilityTimer <= 0) {
+            playerHealth -= 5;
+            invincibilityTimer = 60; // 1 second invincibility
+            if (playerHealth <= 0) {
+                gameOver();
+            }
+        }
+    });
+}
+
+// Shoot an enemy disc towards the player
+function shootEnemyDisc(fromX, fromY, toX, toY) {
+    const dx = toX - fromX;
+    const dy = toY - fromY;
+    const dist = Math.sqrt(dx * dx + dy * dy);
+    
+    if (dist > 0) {
+        spawnProjectile(enemyDiscs, fromX, fromY, (dx / dist) * ENEMY_DISC_SPEED, (dy / dist) * ENEMY_DISC_SPEED);
+    }
+}
+
+// Update enemy discs
+function updateEnemyDiscs() {
+    moveProjectiles(enemyDiscs, 0.2);
+    for (let i = enemyDiscs.count - 1; i >= 0; i--) {
+        const discX = enemyDiscs.x[i];
+        const discY = enemyDiscs.y[i];
+        
+        // Remove if off screen
+        if (discX < cameraX - 50 || discX > cameraX + VIEW_WIDTH + 50 ||
+            discY < -50 || discY > VIEW_HEIGHT + 50) {
+            removeProjectile(enemyDiscs, i);
+            continue;
+        }
+        
+        // Check collision with player
+        if (player.x < discX + ENEMY_DISC_SIZE && player.x + player.width > discX - ENEMY_DISC_SIZE &&
+            player.y < discY + ENEMY_DISC_SIZE && player.y + player.height > discY - ENEMY_DISC_SIZE &&
+            invincibilityTimer <= 0) {
+            playerHealth -= 3;
+            invincibilityTimer = 45; // Brief invincibility
+            removeProjectile(enemyDiscs, i);
+            if (playerHealth <= 0) {
+                gameOver();
+            }
+        }
+    }
+}
+
+// Draw NYC background
+function drawNYCSky() {
+    // Stars drift and twinkle, so they're drawn live over the backdrop (see layers.js)
+    // Lower quality tiers keep them at their average brightness
+    ctx.fillStyle = '#FFF';
+    ctx.globalAlpha = 0.3;
+    for (let i = 0; i < 30; i++) {
+        const starX = (i * 73 + simTime / 100) % VIEW_WIDTH;
+        const starY = (i * 37) % 150;
+        if (quality.twinkle) {
+            const twinkle = Math.sin(simTime / 300 + i) * 0.5 + 0.5;
+            ctx.globalAlpha = twinkle * 0.6;
+        }
+        ctx.fillRect(starX, starY, 2, 2);
+    }
+    ctx.globalAlpha = 1;
+}
+
+// Paint the night sky gradient into a cached layer
+function paintNYCSky(g) {
+    // Night sky gradient
+    const gradient = g.createLinearGradient(0, 0, 0, VIEW_HEIGHT);
+    gradient.addColorStop(0, '#0a0a1a');
+    gradient.addColorStop(0.4, '#1a1a2e');
+    gradient.addColorStop(1, '#2d132c');
+    g.fillStyle = gradient;
+    g.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+}
+
+// Draw NYC buildings background
+function drawNYCBuildings() {
+    drawOffscreen(cachedLayer('nycBuildings', VIEW_WIDTH, VIEW_HEIGHT, paintNYCBuildings), 0, 0);
+}
+
+// Paint the skyline once per level - lit windows are picked once, not every frame,
+// and the same ones come back when it's repainted
+function paintNYCBuildings(g) {
+    const rand = paintRandom();
+    // Far buildings silhouette
+    g.fillStyle = '#0f0f1a';
+    for (let x = 0; x < VIEW_WIDTH; x += 80) {
+        const height = 150 + Math.sin(x * 0.02) * 80;
+        g.fillRect(x, VIEW_HEIGHT - height - 50, 70, height);
+        
+        // Windows
+        g.fillStyle = 'rgba(255, 215, 0, 0.3)';
+        for (let wy = VIEW_HEIGHT - height - 40; wy < VIEW_HEIGHT - 60; wy += 20) {
+            for (let wx = x + 5; wx < x + 65; wx += 15) {
+                if (rand() > 0.3) {
+                    g.fillRect(wx, wy, 8, 12);
+                }
+            }
+        }
+        g.fillStyle = '#0f0f1a';
+    }
+    
+    // Near buildings
+    g.fillStyle = '#1a1a2a';
+    for (let x = 0; x < VIEW_WIDTH; x += 120) {
+        const height = 80 + Math.sin(x * 0.03 + 1) * 50;
+        g.fillRect(x - 20, VIEW_HEIGHT - height - 50, 100, height);
+    }
+    
+    // Billboard glow
+    g.shadowColor = '#FFD700';
+    g.shadowBlur = 20;
+    g.fillStyle = '#FFD700';
+    g.fillRect(400, 200, 100, 40);
+    g.shadowBlur = 0;
+    g.fillStyle = '#000';
+    g.font = 'bold 16px Arial';
+    g.fillText('NYC', 425, 225);
+}
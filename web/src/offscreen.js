@@ -0,0 +1,55 @@
+// ⚡ Offscreen canvases - backgrounds painted once and blitted every frame
+
+// Painted layers for the current level, keyed by name
+const layerCache = {};
+
+// Blank canvas that never appears on the page, width x height view units at the
+// current render scale - its context is pre-scaled so painting works in view units
+function createOffscreen(width, height) {
+    const pixelWidth = Math.max(1, Math.ceil(width * renderScale));
+    const pixelHeight = Math.max(1, Math.ceil(height * renderScale));
+    let offscreen;
+    if (typeof OffscreenCanvas !== 'undefined') {
+        offscreen = new OffscreenCanvas(pixelWidth, pixelHeight);
+    } else {
+        offscreen = document.createElement('canvas');
+        offscreen.width = pixelWidth;
+        offscreen.height = pixelHeight;
+    }
+    const g = offscreen.getContext('2d');
+    g.scale(renderScale, renderScale);
+    // Low quality bakes glows without their blur - the shapes stay, the halo goes
+    if (!quality.glow) Object.defineProperty(g, 'shadowBlur', { get: () => 0, set: () => {} });
+    offscreen.viewWidth = width;
+    offscreen.viewHeight = height;
+    return offscreen;
+}
+
+// Draw an offscreen canvas at (x, y) at its size in view units
+function drawOffscreen(image, x, y) {
+    ctx.drawImage(image, x, y, image.viewWidth, image.viewHeight);
+}
+
+// Draw part of an offscreen canvas, with the source rectangle in view units too
+function drawOffscreenPart(image, sx, sy, sw, sh, dx, dy, dw, dh) {
+    const s = renderScale;
+    ctx.drawImage(image, sx * s, sy * s, sw * s, sh * s, dx, dy, dw, dh);
+}
+
+// Return the named layer, calling paint(context) to draw it the first time
+function cachedLayer(key, width, height, paint) {
+    let layer = layerCache[key];
+    if (!layer) {
+        layer = createOffscreen(width, height);
+        paint(layer.getContext('2d'));
+        layerCache[key] = layer;
+    }
+    return layer;
+}
+
+// Forget every painted layer - the next frame repaints what it needs
+function clearLayerCache() {
+    for (const key in layerCache) {
+        delete layerCache[key];
+    }
+}
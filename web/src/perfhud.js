@@ -0,0 +1,163 @@
+// ⚡ Performance HUD - frame rate, frame-time graph, update/draw split per level
+// mode, live entity counts and draw calls, toggled with F3 (or ?perf=1 on load)
+
+const PERF_HISTORY = 120;           // Frames shown in the graph
+const PERF_SMOOTHING = 0.05;        // Weight of each new frame in the per-mode averages
+const PERF_GRAPH_MS = 50;           // Frame time at the top of the graph
+const PERF_MODES = ['PLATFORMER', 'NYC', 'SPACE', 'LIGHT CYCLE', 'MENU'];
+
+// Context calls counted as draw calls while the HUD is showing
+const COUNTED_CALLS = ['drawImage', 'fillRect', 'strokeRect', 'clearRect', 'fill', 'stroke', 'fillText', 'strokeText'];
+
+const perfHUD = {
+    visible: false,
+    frameTimes: new Float64Array(PERF_HISTORY),
+    next: 0,            // Slot the next frame time goes in
+    modes: {},          // Mode -> smoothed { update, draw } ms
+    drawCalls: 0,       // Counted so far this frame
+    lastDrawCalls: 0,   // Total for the last finished frame
+};
+PERF_MODES.forEach(mode => {
+    perfHUD.modes[mode] = { update: 0, draw: 0 };
+});
+
+// Which level mode the frame belongs to
+function perfMode() {
+    if (gameState === 'title' || gameState === 'character' || gameState === 'transition') return 'MENU';
+    return PERF_MODES[currentLevel - 1];
+}
+
+// Wrap (or unwrap) every canvas context's draw methods with a counter
+function countDrawCalls(on) {
+    [canvas.getContext('2d'), backdropCtx, hudCtx].forEach(context => {
+        COUNTED_CALLS.forEach(name => {
+            if (!on) {
+                delete context[name];
+                return;
+            }
+            const original = context[name];
+            context[name] = function () {
+                perfHUD.drawCalls++;
+                return original.apply(this, arguments);
+            };
+        });
+    });
+}
+
+function togglePerfHUD() {
+    perfHUD.visible = !perfHUD.visible;
+    perfHUD.drawCalls = 0;
+    countDrawCalls(perfHUD.visible);
+}
+
+// Log one frame - always kept, so the graph is full as soon as the HUD is opened
+function recordPerfFrame(frameMs, updateMs, drawMs) {
+    const p = perfHUD;
+    if (frameMs > 0) {
+        p.frameTimes[p.next] = frameMs;
+        p.next = (p.next + 1) % PERF_HISTORY;
+    }
+    const mode = p.modes[perfMode()];
+    if (updateMs > 0) mode.update += (updateMs - mode.update) * PERF_SMOOTHING;
+    mode.draw += (drawMs - mode.draw) * PERF_SMOOTHING;
+    p.lastDrawCalls = p.drawCalls;
+    p.drawCalls = 0;
+}
+
+// Live entity counts, named as in the code - Level 3's come from its lifetime manager
+function perfEntityCounts() {
+    const space = spaceEntityCounts();
+    return [
+        ['coins', coins.length],
+        ['enemies', enemies.length],
+        ['nycEnemies', nycEnemies.length],
+        ['laneEnemies', laneEnemies.length],
+        ['spaceDrones', space.drones],
+        ['missiles', space.missiles],
+        ['droneShots', space.droneShots],
+        ['despawned', space.despawned],
+        ['dropped', space.dropped],
+    ];
+}
+
+// Draw the panel in the bottom-left corner of the world canvas, clear of the HUD
+function drawPerfHUD() {
+    const p = perfHUD;
+    const width = 300;
+    const height = 254;
+    const x = 10;
+    const y = VIEW_HEIGHT - height - 10;
+
+    let total = 0;
+    let worst = 0;
+    let frames = 0;
+    p.frameTimes.forEach(ms => {
+        if (ms <= 0) return;
+        total += ms;
+        worst = Math.max(worst, ms);
+        frames++;
+    });
+    const average = frames ? total / frames : 0;
+
+    ctx.save();
+    ctx.fillStyle = 'rgba(0, 0, 0, 0.75)';
+    ctx.fillRect(x, y, width, height);
+    ctx.strokeStyle = 'rgba(0, 255, 255, 0.5)';
+    ctx.lineWidth = 1;
+    ctx.strokeRect(x, y, width, height);
+
+    ctx.font = '11px "Courier New", monospace';
+    ctx.textAlign = 'left';
+    ctx.fillStyle = COLORS.neonCyan;
+    ctx.fillText(`FPS ${average ? (1000 / average).toFixed(1) : '--'}  avg ${average.toFixed(1)} ms  max ${worst.toFixed(1)} ms`,
+        x + 8, y + 16);
+    ctx.fillText(`QUALITY ${quality.name}${qualityOverride === null ? ' (AUTO)' : ''}  SCALE ${renderScale.toFixed(2)}x  DRAWS ${p.lastDrawCalls}`,
+        x + 8, y + 30);
+
+    // Frame-time graph, oldest on the left, with the 60 FPS budget marked
+    const graphX = x + 8;
+    const graphY = y + 38;
+    const graphWidth = width - 16;
+    const graphHeight = 50;
+    const barWidth = graphWidth / PERF_HISTORY;
+    ctx.fillStyle = 'rgba(255, 255, 255, 0.08)';
+    ctx.fillRect(graphX, graphY, graphWidth, graphHeight);
+    for (let i = 0; i < PERF_HISTORY; i++) {
+        const ms = p.frameTimes[(p.next + i) % PERF_HISTORY];
+        if (ms <= 0) continue;
+        const barHeight = Math.min(graphHeight, ms / PERF_GRAPH_MS * graphHeight);
+        ctx.fillStyle = ms > 1000 / 50 ? '#FF0044' : (ms > 1000 / 58 ? '#FFAA00' : '#00FF88');
+        ctx.fillRect(graphX + i * barWidth, graphY + graphHeight - barHeight, Math.max(1, barWidth - 0.5), barHeight);
+    }
+    const budgetY = graphY + graphHeight - (1000 / 60) / PERF_GRAPH_MS * graphHeight;
+    ctx.fillStyle = 'rgba(0, 255, 255, 0.6)';
+    ctx.fillRect(graphX, budgetY, graphWidth, 1);
+
+    // Update and draw time for each level mode
+    let rowY = graphY + graphHeight + 16;
+    ctx.fillStyle = '#FFFFFF';
+    ctx.fillText('MODE         UPDATE ms  DRAW ms', x + 8, rowY);
+    const current = perfMode();
+    PERF_MODES.forEach(mode => {
+        rowY += 13;
+        const times = p.modes[mode];
+        ctx.fillStyle = mode === current ? COLORS.neonOrange : 'rgba(255, 255, 255, 0.6)';
+        ctx.fillText(`${mode.padEnd(12)} ${times.update.toFixed(2).padStart(9)} ${times.draw.toFixed(2).padStart(8)}`,
+            x + 8, rowY);
+    });
+
+    // Entity counts, two to a line
+    rowY += 6;
+    ctx.fillStyle = COLORS.neonCyan;
+    perfEntityCounts().forEach(([name, count], i) => {
+        if (i % 2 === 0) rowY += 13;
+        ctx.fillText(`${name} ${count}`, x + 8 + (i % 2) * 145, rowY);
+    });
+    ctx.restore();
+
+    // The panel itself isn't part of the frame being measured
+    p.drawCalls = 0;
+}
+
+// ?perf=1 on the page URL opens the HUD on load (pageSearch is from quality.js)
+if (/[?&]perf=1\b/.test(pageSearch || '')) togglePerfHUD();
@@ -0,0 +1,85 @@
+// ⚡ Projectiles - shots stored in preallocated typed arrays
+//
+// A pool never allocates after it's created: spawning fills the next free slot
+// and removing swaps the last live shot into the gap. Loop over a pool from
+// count - 1 down to 0 when removing, so the shot swapped in was already handled.
+// prevX/prevY hold each shot's position at the start of the step, so drawing
+// can place it between steps (see main.js).
+
+// How far drawing is from the previous step to the current one (set by main.js)
+let drawAlpha = 1;
+
+function createProjectiles(capacity) {
+    return {
+        count: 0,
+        capacity,
+        dropped: 0,     // Shots refused because the pool was full
+        x: new Float64Array(capacity),
+        y: new Float64Array(capacity),
+        prevX: new Float64Array(capacity),
+        prevY: new Float64Array(capacity),
+        velX: new Float64Array(capacity),
+        velY: new Float64Array(capacity),
+        rotation: new Float64Array(capacity),
+        lane: new Uint8Array(capacity),
+    };
+}
+
+// Add a shot, returning its slot - or -1 if the pool is full and the shot is dropped
+function spawnProjectile(pool, x, y, velX, velY) {
+    if (pool.count >= pool.capacity) {
+        pool.dropped++;
+        return -1;
+    }
+    const i = pool.count++;
+    pool.x[i] = x;
+    pool.y[i] = y;
+    pool.prevX[i] = x;
+    pool.prevY[i] = y;
+    pool.velX[i] = velX;
+    pool.velY[i] = velY;
+    pool.rotation[i] = 0;
+    pool.lane[i] = 0;
+    return i;
+}
+
+function removeProjectile(pool, i) {
+    const last = --pool.count;
+    if (i === last) return;
+    pool.x[i] = pool.x[last];
+    pool.y[i] = pool.y[last];
+    pool.prevX[i] = pool.prevX[last];
+    pool.prevY[i] = pool.prevY[last];
+    pool.velX[i] = pool.velX[last];
+    pool.velY[i] = pool.velY[last];
+    pool.rotation[i] = pool.rotation[last];
+    pool.lane[i] = pool.lane[last];
+}
+
+function clearProjectiles(pool) {
+    pool.count = 0;
+}
+
+// Remember where every shot is before a step moves it
+function saveProjectilePositions(pool) {
+    pool.prevX.set(pool.x.subarray(0, pool.count));
+    pool.prevY.set(pool.y.subarray(0, pool.count));
+}
+
+// Move every shot by its velocity, turning each by spin
+function moveProjectiles(pool, spin = 0) {
+    const { x, y, velX, velY, rotation } = pool;
+    for (let i = 0; i < pool.count; i++) {
+        x[i] += velX[i];
+        y[i] += velY[i];
+        rotation[i] += spin;
+    }
+}
+
+// Call draw(x, y, rotation) for every shot, drawAlpha of the way through its last step
+function drawProjectiles(pool, draw) {
+    const { x, y, prevX, prevY, rotation } = pool;
+    for (let i = 0; i < pool.count; i++) {
+        draw(prevX[i] + (x[i] - prevX[i]) * drawAlpha, prevY[i] + (y[i] - prevY[i]) * drawAlpha, rotation[i]);
+    }
+}
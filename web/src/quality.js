@@ -0,0 +1,113 @@
+// ⚡ Quality tiers - expensive effects switched off on devices that can't keep up
+//
+// In auto mode the tier comes from rolling frame-time percentiles: it steps down
+// as soon as frames are slow and back up only after a long smooth stretch, and a
+// tier that proved too slow waits longer each time before it's tried again.
+// Q cycles auto and the fixed tiers; ?quality=low|medium|high picks one on load.
+
+const QUALITY_TIERS = [
+    // Glow baked without blur, still stars, no parallax hills or road grid; may render below 1x
+    { name: 'LOW', glow: false, twinkle: false, parallax: false, roadGrid: false, minScale: 0.5, maxScale: 1 },
+    { name: 'MEDIUM', glow: true, twinkle: false, parallax: true, roadGrid: true, minScale: 1, maxScale: 1.5 },
+    { name: 'HIGH', glow: true, twinkle: true, parallax: true, roadGrid: true, minScale: 1, maxScale: 2 },
+];
+const QUALITY_WINDOW = 120;         // Frames of history behind each decision
+const SLOW_MEDIAN_MS = 1000 / 50;   // Step down past either of these
+const SLOW_P95_MS = 1000 / 40;
+const SMOOTH_MEDIAN_MS = 1000 / 57; // Step up only below both of these...
+const SMOOTH_P95_MS = 1000 / 55;
+const SMOOTH_WINDOWS = 3;           // ...for this many windows in a row
+const RETRY_WINDOWS = 3;            // First wait before retrying a tier that was too slow
+
+let qualityTier = QUALITY_TIERS.length - 1;
+let quality = QUALITY_TIERS[qualityTier];
+let qualityOverride = null;         // Tier index the player picked, or null for auto
+
+// Rolling frame times and the auto governor's state
+const qualitySamples = new Float64Array(QUALITY_WINDOW);
+const qualityGovernor = {
+    frames: 0,
+    smoothWindows: 0,
+    blocked: -1,        // Tier that was too slow, not stepped back up to while waiting
+    wait: 0,            // Windows left until it may be retried
+    retryWindows: RETRY_WINDOWS,
+};
+
+// Forget every image baked with the old settings - the next frame repaints what it needs
+function clearBakedImages() {
+    clearLayerCache();
+    clearGlowSprites();
+    clearCharacterAtlas();
+    backdropShown = null;
+    hudShown = null;
+}
+
+function setQualityTier(tier) {
+    if (tier === qualityTier) return;
+    const glowChanged = QUALITY_TIERS[tier].glow !== quality.glow;
+    qualityTier = tier;
+    quality = QUALITY_TIERS[tier];
+    // Keep the render scale inside the new tier's range
+    const scale = Math.min(renderScaleMax(), Math.max(renderScaleMin(), renderScale));
+    if (scale !== renderScale) {
+        setRenderScale(scale);
+    } else if (glowChanged) {
+        clearBakedImages();
+    }
+}
+
+// Q cycles auto -> low -> medium -> high -> auto
+function cycleQuality() {
+    if (qualityOverride === null) qualityOverride = 0;
+    else if (qualityOverride < QUALITY_TIERS.length - 1) qualityOverride++;
+    else qualityOverride = null;
+    if (qualityOverride !== null) setQualityTier(qualityOverride);
+}
+
+// Value at fraction p of the sorted samples
+function percentile(sorted, p) {
+    return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+}
+
+// Feed one frame's time in; every QUALITY_WINDOW frames the auto tier may move a step
+function governQuality(frameMs) {
+    if (qualityOverride !== null || frameMs <= 0 || frameMs > 250) return;
+    const g = qualityGovernor;
+    qualitySamples[g.frames++] = frameMs;
+    if (g.frames < QUALITY_WINDOW) return;
+    g.frames = 0;
+
+    const sorted = qualitySamples.slice().sort();
+    const median = percentile(sorted, 0.5);
+    const p95 = percentile(sorted, 0.95);
+    if (g.wait > 0) g.wait--;
+
+    if ((median > SLOW_MEDIAN_MS || p95 > SLOW_P95_MS) && qualityTier > 0) {
+        // Back off for longer each time the same tier turns out too slow
+        g.retryWindows = g.blocked === qualityTier ? g.retryWindows * 2 : RETRY_WINDOWS;
+        g.blocked = qualityTier;
+        g.wait = g.retryWindows;
+        g.smoothWindows = 0;
+        setQualityTier(qualityTier - 1);
+        return;
+    }
+    g.smoothWindows = median < SMOOTH_MEDIAN_MS && p95 < SMOOTH_P95_MS ? g.smoothWindows + 1 : 0;
+    const next = qualityTier + 1;
+    if (g.smoothWindows >= SMOOTH_WINDOWS && next < QUALITY_TIERS.length &&
+        (next !== g.blocked || g.wait === 0)) {
+        g.smoothWindows = 0;
+        setQualityTier(next);
+    }
+}
+
+// ?quality=low|medium|high on the page URL fixes the tier - a worker gets it from the page (see host.js)
+const pageSearch = IN_WORKER ? self.pageSearch : (typeof location !== 'undefined' ? location.search : '');
+const qualityParam = /[?&]quality=(\w+)/.exec(pageSearch || '');
+if (qualityParam) {
+    const tier = QUALITY_TIERS.findIndex(t => t.name === qualityParam[1].toUpperCase());
+    if (tier >= 0) {
+        qualityOverride = tier;
+        qualityTier = tier;
+        quality = QUALITY_TIERS[tier];
+    }
+}
@@ -0,0 +1,42 @@
+// ⚡ Seeded randomness and the simulation clock - the same seed and input replay the same game
+
+// Everything the game rolls comes from this generator (mulberry32), so a run can be
+// replayed from its seed. Purely cosmetic noise (glitch pixels, exhaust flicker) keeps
+// using Math.random() so drawing more or fewer frames can't shift it
+let randomSeed = Date.now() >>> 0;
+let randomState = randomSeed;
+
+function seedRandom(seed) {
+    randomSeed = seed >>> 0;
+    randomState = randomSeed;
+}
+
+// mulberry32's output for one state, uniform in [0, 1)
+function mulberry32(state) {
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+}
+
+// Uniform in [0, 1), like Math.random()
+function random() {
+    randomState = (randomState + 0x6D2B79F5) >>> 0;
+    return mulberry32(randomState);
+}
+
+// A generator of its own for painting a cached background, seeded from the run and
+// the level: a layer repainted after a resolution or quality change comes out the
+// same, and painting never moves the simulation's generator
+function paintRandom() {
+    let state = (randomSeed ^ Math.imul(currentLevel, 0x9E3779B9)) >>> 0;
+    return () => {
+        state = (state + 0x6D2B79F5) >>> 0;
+        return mulberry32(state);
+    };
+}
+
+// Simulation clock - steps taken and game time in ms, advanced by each fixed step
+// (see gameLoop). Animation and AI timing read simTime instead of the wall clock
+let simTick = 0;
+let simTime = 0;
@@ -0,0 +1,39 @@
+// ⚡ Replays - a run is recorded as its seed plus the input applied at each step
+
+// Input applied so far this run, as [tick, type, a, b]
+let recordedInput = [];
+
+// Apply the input queued since the last step, recording when gameplay input happened
+function applyPendingInput() {
+    pendingInput.forEach(event => {
+        if (!isInterfaceInput(event)) recordedInput.push([simTick, ...event]);
+        applyInput(event);
+    });
+    pendingInput.length = 0;
+}
+
+// The run so far - JSON.stringify() it to save it
+function currentRecording() {
+    return { seed: randomSeed, ticks: simTick, input: recordedInput.slice() };
+}
+
+// Play a recorded run from the start as fast as possible, without drawing.
+// Needs a freshly loaded engine; onStep(tick) is called after every step, e.g. to check state
+function replayRun(run, onStep) {
+    seedRandom(run.seed);
+    simTick = 0;
+    simTime = 0;
+    recordedInput = [];
+    pendingInput.length = 0;
+    initGame();
+    
+    let next = 0;
+    while (simTick < run.ticks) {
+        while (next < run.input.length && run.input[next][0] === simTick) {
+            pendingInput.push(run.input[next].slice(1));
+            next++;
+        }
+        stepSimulation();
+        if (onStep) onStep(simTick);
+    }
+}
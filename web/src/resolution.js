@@ -0,0 +1,86 @@
+// ⚡ Resolution governor - picks the canvases' pixel density from how fast frames are
+//
+// The game always works in VIEW_WIDTH x VIEW_HEIGHT units. The canvases hold
+// renderScale pixels per unit and the page shows them at the view size, so the
+// browser scales the image when it composites. Retina screens go up to their
+// devicePixelRatio while frames stay well inside the 60 FPS budget; slow devices
+// drop below 1x and are upscaled instead, once the quality tier allows it.
+
+const MIN_RENDER_SCALE = 0.5;
+const MAX_RENDER_SCALE = 2;         // 3x screens would cost 9x the pixels for little visible gain
+const RENDER_SCALE_STEP = 0.25;
+const FRAME_BUDGET_MS = 1000 / 60;
+const GOVERNOR_WINDOW = 60;         // Frames averaged before each decision
+const GOVERNOR_HOLD = 5;            // First wait before retrying a scale that was too slow
+
+// The page's devicePixelRatio - a worker gets it from the page (see host.js)
+const pixelRatio = typeof devicePixelRatio === 'number' && devicePixelRatio > 0 ? devicePixelRatio : 1;
+const maxRenderScale = Math.max(1, Math.min(MAX_RENDER_SCALE, Math.round(pixelRatio / RENDER_SCALE_STEP) * RENDER_SCALE_STEP));
+
+let renderScale = 1;
+
+// Frame timings gathered for the current window
+const governor = {
+    frames: 0,
+    frameMs: 0,     // Summed time between frames
+    workMs: 0,      // Summed time spent stepping and drawing
+    tooSlow: Infinity,  // Last scale that was too slow - not stepped back up to while held
+    hold: 0,            // Windows left until it may be retried
+    holdWindows: GOVERNOR_HOLD,
+};
+
+// The scale range the current quality tier allows (see quality.js)
+function renderScaleMin() {
+    return Math.max(MIN_RENDER_SCALE, quality.minScale);
+}
+
+function renderScaleMax() {
+    return Math.max(renderScaleMin(), Math.min(maxRenderScale, quality.maxScale));
+}
+
+// Resize every canvas and cached image for a new render scale
+function setRenderScale(scale) {
+    renderScale = scale;
+    [canvas, backdropCanvas, hudCanvas].forEach(layer => {
+        layer.width = Math.round(VIEW_WIDTH * scale);
+        layer.height = Math.round(VIEW_HEIGHT * scale);
+        // Resizing resets the context, so draw code keeps working in view units
+        layer.getContext('2d').setTransform(scale, 0, 0, scale, 0, 0);
+    });
+    // Everything baked at the old density is repainted at the new one on first use
+    clearBakedImages();
+}
+
+// Feed one frame's timings in; every GOVERNOR_WINDOW frames the scale may move a step
+function governResolution(frameMs, workMs) {
+    const g = governor;
+    // Skip the first frame and stalls (a hidden tab, a breakpoint) - they say nothing about rendering cost
+    if (frameMs <= 0 || frameMs > 250) return;
+    g.frames++;
+    g.frameMs += frameMs;
+    g.workMs += workMs;
+    if (g.frames < GOVERNOR_WINDOW) return;
+
+    const frameAverage = g.frameMs / g.frames;
+    const workAverage = g.workMs / g.frames;
+    g.frames = g.frameMs = g.workMs = 0;
+    if (g.hold > 0) g.hold--;
+
+    // Missing frames, or the frame work is eating most of the budget - step down
+    if ((frameAverage > FRAME_BUDGET_MS * 1.2 || workAverage > FRAME_BUDGET_MS * 0.75) &&
+        renderScale > renderScaleMin()) {
+        // Hold off for longer each time the same scale turns out too slow, so a
+        // borderline device settles instead of rebaking every few seconds
+        g.holdWindows = g.tooSlow === renderScale ? g.holdWindows * 2 : GOVERNOR_HOLD;
+        g.tooSlow = renderScale;
+        g.hold = g.holdWindows;
+        setRenderScale(Math.max(renderScaleMin(), renderScale - RENDER_SCALE_STEP));
+        return;
+    }
+    // Plenty of headroom - step up, unless that scale was found too slow and is still held
+    const next = renderScale + RENDER_SCALE_STEP;
+    if (frameAverage < FRAME_BUDGET_MS * 1.05 && workAverage < FRAME_BUDGET_MS * 0.4 &&
+        next <= renderScaleMax() && (next < g.tooSlow || g.hold === 0)) {
+        setRenderScale(next);
+    }
+}
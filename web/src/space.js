@@ -0,0 +1,524 @@
+// ⚡ Space level - jet, missiles and drones
+
+// ========== LEVEL 3 - SPACE SHOOTER FUNCTIONS ==========
+
+// Draw player jet (based on character colors)
+function drawJet() {
+    const char = characters[selectedCharacter];
+    const mainColor = char.circuitColor || '#00FFFF';
+    const jetX = 80; // Fixed X position on screen
+    const y = jetY;
+    
+    // Jet trail/exhaust
+    const exhaustFlicker = Math.floor(Math.random() * 10);
+    drawGlowSprite(`jet-exhaust:${exhaustFlicker}`, jetX, y + JET_HEIGHT/2, [-40, -5, 30, 10], 15, g => {
+        g.shadowColor = '#FF6600';
+        g.shadowBlur = 15;
+        g.fillStyle = '#FF6600';
+        g.beginPath();
+        g.moveTo(-10, 0);
+        g.lineTo(-30 - exhaustFlicker, -5);
+        g.lineTo(-25 - exhaustFlicker/2, 0);
+        g.lineTo(-30 - exhaustFlicker, 5);
+        g.closePath();
+        g.fill();
+    });
+    
+    drawGlowSprite(`jet:${selectedCharacter}`, jetX, y, [-6, -13, JET_WIDTH + 6, JET_HEIGHT + 26], 8,
+        g => paintJet(g, char));
+    
+    // Draw player name above jet
+    if (playerName) {
+        ctx.font = 'bold 10px "Courier New", monospace';
+        ctx.textAlign = 'center';
+        drawGlowText(playerName.toUpperCase(), jetX + JET_WIDTH/2, y - 15, mainColor, 5);
+        ctx.textAlign = 'left';
+    }
+}
+
+// Paint the jet with its top-left corner at (0, 0)
+function paintJet(g, char) {
+    const mainColor = char.circuitColor || '#00FFFF';
+    const secondColor = char.secondaryColor || '#0088FF';
+    
+    // Main body (fuselage)
+    g.fillStyle = '#000000';
+    g.beginPath();
+    g.moveTo(JET_WIDTH, JET_HEIGHT/2);
+    g.lineTo(10, 0);
+    g.lineTo(-5, 5);
+    g.lineTo(-5, JET_HEIGHT - 5);
+    g.lineTo(10, JET_HEIGHT);
+    g.closePath();
+    g.fill();
+    
+    // Circuit outline
+    g.strokeStyle = mainColor;
+    g.shadowColor = mainColor;
+    g.shadowBlur = 8;
+    g.lineWidth = 2;
+    g.stroke();
+    
+    // Wings
+    g.fillStyle = '#000000';
+    // Top wing
+    g.beginPath();
+    g.moveTo(15, 5);
+    g.lineTo(30, -12);
+    g.lineTo(40, -10);
+    g.lineTo(35, 5);
+    g.closePath();
+    g.fill();
+    g.stroke();
+    
+    // Bottom wing
+    g.beginPath();
+    g.moveTo(15, JET_HEIGHT - 5);
+    g.lineTo(30, JET_HEIGHT + 12);
+    g.lineTo(40, JET_HEIGHT + 10);
+    g.lineTo(35, JET_HEIGHT - 5);
+    g.closePath();
+    g.fill();
+    g.stroke();
+    
+    // Cockpit
+    g.fillStyle = secondColor;
+    g.beginPath();
+    g.ellipse(35, JET_HEIGHT/2, 10, 6, 0, 0, Math.PI * 2);
+    g.fill();
+    
+    // Circuit lines on body
+    g.strokeStyle = mainColor;
+    g.lineWidth = 1;
+    g.beginPath();
+    g.moveTo(0, JET_HEIGHT/2);
+    g.lineTo(50, JET_HEIGHT/2);
+    g.stroke();
+    g.beginPath();
+    g.moveTo(20, 8);
+    g.lineTo(20, JET_HEIGHT - 8);
+    g.stroke();
+    
+    g.shadowBlur = 0;
+}
+
+// Draw missile (player weapon in Level 3)
+function drawMissile(x, y) {
+    const char = characters[selectedCharacter];
+    const missileColor = char.circuitColor || '#00FFFF';
+    
+    drawGlowSprite(`missile:${missileColor}`, x, y, [-6, -6, 27, 12], 10, g => {
+        g.shadowColor = missileColor;
+        g.shadowBlur = 10;
+        
+        // Missile body
+        g.fillStyle = '#000';
+        g.beginPath();
+        g.moveTo(20, 0);
+        g.lineTo(0, -5);
+        g.lineTo(-5, -4);
+        g.lineTo(-5, 4);
+        g.lineTo(0, 5);
+        g.closePath();
+        g.fill();
+        
+        // Circuit outline
+        g.strokeStyle = missileColor;
+        g.lineWidth = 2;
+        g.stroke();
+    });
+    
+    // Exhaust
+    const exhaust = Math.floor(Math.random() * 5);
+    drawGlowSprite(`missile-exhaust:${missileColor}:${exhaust}`, x, y, [-17, -2, 12, 4], 10, g => {
+        g.shadowColor = missileColor;
+        g.shadowBlur = 10;
+        g.fillStyle = '#FF6600';
+        g.beginPath();
+        g.moveTo(-5, -2);
+        g.lineTo(-12 - exhaust, 0);
+        g.lineTo(-5, 2);
+        g.closePath();
+        g.fill();
+    });
+}
+
+// Draw space drone enemy
+function drawSpaceDrone(drone) {
+    const { x, y, width, height, type, health } = drone;
+    const pulse = glowStep(0.7 + Math.sin(simTime / 200) * 0.3);
+    
+    const box = [0, -12, Math.max(width + 10, health * 15 + 17), height + 12];
+    drawGlowSprite(`drone:${type}:${width}:${height}:${health}:${pulse}`, x, y, box, 12 * pulse,
+        g => paintSpaceDrone(g, type, width, height, health, pulse));
+}
+
+// Paint a space drone with its top-left corner at (0, 0)
+function paintSpaceDrone(g, type, width, height, health, pulse) {
+    // Drone body - black with red circuits
+    g.fillStyle = '#000000';
+    
+    if (type === 'basic') {
+        // Basic drone - simple design
+        g.beginPath();
+        g.ellipse(width/2, height/2, width/2, height/2, 0, 0, Math.PI * 2);
+        g.fill();
+        
+        g.strokeStyle = '#FF0044';
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 6 * pulse;
+        g.lineWidth = 2;
+        g.stroke();
+        
+        // Eye
+        g.fillStyle = '#FF0044';
+        g.beginPath();
+        g.arc(width/2 + 5, height/2, 4, 0, Math.PI * 2);
+        g.fill();
+        
+    } else if (type === 'fast') {
+        // Fast drone - sleek triangle
+        g.beginPath();
+        g.moveTo(width, height/2);
+        g.lineTo(0, 0);
+        g.lineTo(10, height/2);
+        g.lineTo(0, height);
+        g.closePath();
+        g.fill();
+        
+        g.strokeStyle = '#FF6600';
+        g.shadowColor = '#FF6600';
+        g.shadowBlur = 8 * pulse;
+        g.lineWidth = 2;
+        g.stroke();
+        
+    } else if (type === 'heavy') {
+        // Heavy drone - chunky
+        g.fillRect(0, 0, width, height);
+        
+        g.strokeStyle = '#FF0044';
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 6 * pulse;
+        g.lineWidth = 2;
+        g.strokeRect(0, 0, width, height);
+        
+        // Cannon
+        g.fillRect(width - 5, height/2 - 3, 15, 6);
+        g.strokeRect(width - 5, height/2 - 3, 15, 6);
+        
+        // Health bar for heavy
+        if (health > 1) {
+            g.fillStyle = '#FF0044';
+            for (let i = 0; i < health; i++) {
+                g.fillRect(5 + i * 15, -8, 12, 4);
+            }
+        }
+        
+    } else if (type === 'boss') {
+        // Boss drone - large and menacing
+        g.beginPath();
+        g.moveTo(width, height/2);
+        g.lineTo(width - 20, 0);
+        g.lineTo(0, 10);
+        g.lineTo(0, height - 10);
+        g.lineTo(width - 20, height);
+        g.closePath();
+        g.fill();
+        
+        g.strokeStyle = '#FF0066';
+        g.shadowColor = '#FF0066';
+        g.shadowBlur = 12 * pulse;
+        g.lineWidth = 3;
+        g.stroke();
+        
+        // Multiple guns
+        g.fillStyle = '#FF0066';
+        g.fillRect(width - 10, 10, 20, 8);
+        g.fillRect(width - 10, height - 18, 20, 8);
+        g.fillRect(width - 5, height/2 - 4, 15, 8);
+        
+        // Health bar
+        g.fillStyle = '#FF0066';
+        for (let i = 0; i < health; i++) {
+            g.fillRect(5 + i * 10, -12, 8, 6);
+        }
+    }
+}
+
+// Draw drone projectile
+function drawDroneProjectile(x, y) {
+    drawGlowSprite('drone-shot', x, y, [-5, -5, 10, 10], 8, g => {
+        g.shadowColor = '#FF0044';
+        g.shadowBlur = 8;
+        g.fillStyle = '#FF0044';
+        g.beginPath();
+        g.arc(0, 0, 5, 0, Math.PI * 2);
+        g.fill();
+    });
+}
+
+// Draw space background
+function drawSpaceBackground() {
+    // Draw stars (parallax scrolling) over the backdrop (see layers.js) -
+    // lower quality tiers keep them at their average brightness
+    ctx.fillStyle = 'rgba(255, 255, 255, 0.5)';
+    stars.forEach(star => {
+        const screenX = (star.x - cameraX * 0.3) % VIEW_WIDTH;
+        if (quality.twinkle) {
+            const twinkle = 0.5 + Math.sin(simTime / 200 + star.brightness * 10) * 0.5;
+            ctx.fillStyle = `rgba(255, 255, 255, ${twinkle})`;
+        }
+        ctx.fillRect(screenX, star.y, star.size, star.size);
+    });
+    
+    // Nebula sits in front of the stars
+    drawOffscreen(cachedLayer('nebula', VIEW_WIDTH, VIEW_HEIGHT, paintNebula), 0, 0);
+}
+
+// Paint the deep space gradient into a cached layer
+function paintSpaceSky(g) {
+    const gradient = g.createLinearGradient(0, 0, 0, VIEW_HEIGHT);
+    gradient.addColorStop(0, '#000011');
+    gradient.addColorStop(0.5, '#000022');
+    gradient.addColorStop(1, '#001133');
+    g.fillStyle = gradient;
+    g.fillRect(0, 0, VIEW_WIDTH, VIEW_HEIGHT);
+}
+
+// Paint the nebula clouds into a transparent cached layer
+function paintNebula(g) {
+    g.fillStyle = 'rgba(0, 100, 150, 0.05)';
+    g.beginPath();
+    g.arc(300, 200, 150, 0, Math.PI * 2);
+    g.fill();
+    g.fillStyle = 'rgba(100, 0, 150, 0.05)';
+    g.beginPath();
+    g.arc(600, 350, 120, 0, Math.PI * 2);
+    g.fill();
+}
+
+// Draw Level 3 finish portal
+function drawSpacePortal() {
+    const portalX = 3500 - cameraX;
+    const portalY = VIEW_HEIGHT / 2;
+    const pulse = glowStep(0.6 + Math.sin(simTime / 150) * 0.4);
+    
+    // Only draw if visible
+    if (portalX > -100 && portalX < VIEW_WIDTH + 100) {
+        drawGlowSprite(`space-portal:${pulse}`, portalX, portalY, [-42, -82, 84, 164], 30 * pulse, g => {
+            // Outer glow
+            g.shadowColor = '#00FFAA';
+            g.shadowBlur = 30 * pulse;
+            g.strokeStyle = '#00FFAA';
+            g.lineWidth = 4;
+            g.beginPath();
+            g.ellipse(0, 0, 40, 80, 0, 0, Math.PI * 2);
+            g.stroke();
+            
+            // Inner portal
+            g.fillStyle = `rgba(0, 255, 170, ${0.3 * pulse})`;
+            g.fill();
+            
+            // Core
+            g.fillStyle = '#00FFAA';
+            g.beginPath();
+            g.arc(0, 0, 10, 0, Math.PI * 2);
+            g.fill();
+        });
+    }
+}
+
+// Update player jet
+function updateJet() {
+    // Vertical movement (↑/W/Space = Up, ↓/S = Down)
+    if (keys.jump) {
+        jetVelY = -JET_SPEED;
+    } else if (keys.down) {
+        jetVelY = JET_SPEED;
+    } else {
+        jetVelY *= 0.9; // Decelerate
+    }
+    
+    jetY += jetVelY;
+    
+    // Keep in bounds
+    if (jetY < 20) jetY = 20;
+    if (jetY > VIEW_HEIGHT - JET_HEIGHT - 20) jetY = VIEW_HEIGHT - JET_HEIGHT - 20;
+    
+    // Auto-scroll camera
+    cameraX += 1.5;
+    
+    // Check if reached end - go to Level 4
+    if (cameraX > 3400 && gameState === 'playing') {
+        goToNextLevel();
+        return; // Stop further updates
+    }
+    
+    // Update player position for collision detection
+    player.x = 80 + cameraX;
+    player.y = jetY;
+    player.width = JET_WIDTH;
+    player.height = JET_HEIGHT;
+}
+
+// Lifetime - anything this far outside the view won't come back and is despawned.
+// Live shots are capped by their pools and live drones by MAX_LIVE_DRONES (see
+// config.js); spawns past either are dropped and counted
+const DESPAWN_MARGIN = 50;
+
+// Add a drone, unless MAX_LIVE_DRONES are already live - returns whether it was added
+function spawnSpaceDrone(drone) {
+    if (spaceDrones.length >= MAX_LIVE_DRONES) {
+        spaceDronesDropped++;
+        return false;
+    }
+    spaceDrones.push(drone);
+    return true;
+}
+
+function outsideSpaceView(x, y) {
+    return x < cameraX - DESPAWN_MARGIN || x > cameraX + VIEW_WIDTH + DESPAWN_MARGIN ||
+           y < -DESPAWN_MARGIN || y > VIEW_HEIGHT + DESPAWN_MARGIN;
+}
+
+// Drop the drones the camera has passed - drones ahead of the view are still to come
+function despawnPassedDrones() {
+    for (let i = spaceDrones.length - 1; i >= 0; i--) {
+        const drone = spaceDrones[i];
+        if (drone.x + drone.width < cameraX - DESPAWN_MARGIN) {
+            spaceDrones.splice(i, 1);
+            spaceDespawned++;
+        }
+    }
+}
+
+// Live and culled entity counts on Level 3, for monitoring (shown by the performance HUD)
+function spaceEntityCounts() {
+    return {
+        drones: spaceDrones.length,
+        missiles: missiles.count,
+        droneShots: droneProjectiles.count,
+        despawned: spaceDespawned,
+        dropped: missiles.dropped + droneProjectiles.dropped + spaceDronesDropped,
+    };
+}
+
+// Put the drones into the broadphase grid, which covers the view plus a cell past its right edge
+function indexSpaceDrones() {
+    clearBroadphase(cameraX, 0, VIEW_WIDTH + GRID_CELL, VIEW_HEIGHT);
+    spaceDrones.forEach(drone => insertBroadphase(drone, drone.x, drone.y, drone.width, drone.height));
+}
+
+// The missile being checked and the drone it hit - shared with findMissileTarget so
+// the per-missile grid query doesn't need a new closure
+let missileX = 0;
+let missileY = 0;
+let missileTarget = null;
+
+function findMissileTarget(drone) {
+    if (drone.health > 0 && missileX > drone.x && missileX < drone.x + drone.width &&
+        missileY > drone.y && missileY < drone.y + drone.height) {
+        missileTarget = drone;
+        return true;
+    }
+    return false;
+}
+
+// Update missiles
+function updateMissiles() {
+    moveProjectiles(missiles);
+    indexSpaceDrones();
+    for (let i = missiles.count - 1; i >= 0; i--) {
+        missileX = missiles.x[i];
+        missileY = missiles.y[i];
+        
+        // Remove if off screen
+        if (outsideSpaceView(missileX, missileY)) {
+            removeProjectile(missiles, i);
+            spaceDespawned++;
+            continue;
+        }
+        
+        // Check collision with the drones in the missile's cell
+        missileTarget = null;
+        queryBroadphase(missileX, missileY, 0, 0, findMissileTarget);
+        if (missileTarget) {
+            const drone = missileTarget;
+            drone.health--;
+            removeProjectile(missiles, i);
+            if (drone.health <= 0) {
+                const bonus = drone.type === 'boss' ? 200 : (drone.type === 'heavy' ? 50 : 20);
+                score += bonus;
+                spaceDrones.splice(spaceDrones.indexOf(drone), 1);
+            }
+        }
+    }
+}
+
+// Collision between a drone and the player jet
+function jetHitByDrone(drone) {
+    const jetX = 80 + cameraX;
+    if (jetX < drone.x + drone.width && jetX + JET_WIDTH > drone.x &&
+        jetY < drone.y + drone.height && jetY + JET_HEIGHT > drone.y && invincibilityTimer <= 0) {
+        playerHealth -= 10;
+        invincibilityTimer = 60;
+        if (playerHealth <= 0) gameOver();
+    }
+    return false;
+}
+
+// Update space drones
+function updateSpaceDrones() {
+    const jetCenterY = jetY + JET_HEIGHT / 2;
+    
+    spaceDrones.forEach(drone => {
+        // Wave motion
+        const waveY = Math.sin(simTime / 500 + drone.waveOffset) * 20;
+        
+        // Move towards player (scroll with camera but also move left)
+        drone.x -= drone.speed * 0.5;
+        
+        // Shoot at player
+        drone.shootTimer++;
+        if (drone.shootTimer >= drone.shootCooldown && drone.x < cameraX + VIEW_WIDTH) {
+            spawnProjectile(droneProjectiles, drone.x, drone.y + drone.height / 2,
+                -6, (jetCenterY - (drone.y + drone.height/2)) * 0.02);
+            drone.shootTimer = 0;
+        }
+    });
+    
+    despawnPassedDrones();
+    
+    // Collision with player jet - only the drones around it
+    indexSpaceDrones();
+    queryBroadphase(80 + cameraX, jetY, JET_WIDTH, JET_HEIGHT, jetHitByDrone);
+    
+    // Update projectiles
+    moveProjectiles(droneProjectiles);
+    for (let i = droneProjectiles.count - 1; i >= 0; i--) {
+        const px = droneProjectiles.x[i];
+        const py = droneProjectiles.y[i];
+        
+        // Remove once it's off any edge
+        if (outsideSpaceView(px, py)) {
+            removeProjectile(droneProjectiles, i);
+            spaceDespawned++;
+            continue;
+        }
+        
+        // Check collision with player
+        if (px > 80 + cameraX - 10 && px < 80 + cameraX + JET_WIDTH + 10 &&
+            py > jetY - 10 && py < jetY + JET_HEIGHT + 10 &&
+            invincibilityTimer <= 0) {
+            playerHealth -= 5;
+            invincibilityTimer = 30;
+            removeProjectile(droneProjectiles, i);
+            if (playerHealth <= 0) gameOver();
+        }
+    }
+}
+
+// Shoot missile
+function shootMissile() {
+    spawnProjectile(missiles, 80 + cameraX + JET_WIDTH, jetY + JET_HEIGHT / 2, MISSILE_SPEED, 0);
+}
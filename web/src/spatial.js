@@ -0,0 +1,54 @@
+// ⚡ Spatial index - world entities kept sorted by x so only nearby ones are visited
+
+// Room around the view for glows, name tags and health bars drawn outside an entity's box
+const VIEW_MARGIN = 80;
+
+// Widest entity in each indexed list - a range query has to start this far to the left
+const indexReach = new WeakMap();
+
+// Sort a list by left edge in place. Entities only move a few pixels a frame, so a
+// list that was sorted last frame is nearly sorted and insertion sort is about one pass
+function sortByX(items) {
+    for (let i = 1; i < items.length; i++) {
+        const item = items[i];
+        let j = i - 1;
+        while (j >= 0 && items[j].x > item.x) {
+            items[j + 1] = items[j];
+            j--;
+        }
+        items[j + 1] = item;
+    }
+    return items;
+}
+
+// Sort a level's entity list and remember how wide its widest entity is
+function indexByX(items) {
+    let reach = 0;
+    items.forEach(item => {
+        reach = Math.max(reach, item.width || 0);
+    });
+    indexReach.set(items, reach);
+    return sortByX(items);
+}
+
+// Call visit(item) for every item overlapping left..right horizontally, in x order
+function forEachInRange(items, left, right, visit) {
+    // Binary search for the first item that could reach into the range
+    const start = left - (indexReach.get(items) || 0);
+    let lo = 0;
+    let hi = items.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (items[mid].x < start) lo = mid + 1;
+        else hi = mid;
+    }
+    for (let i = lo; i < items.length && items[i].x < right; i++) {
+        const item = items[i];
+        if (item.x + (item.width || 0) > left) visit(item);
+    }
+}
+
+// Call visit(item) for every item that can show up on screen this frame
+function forEachVisible(items, visit) {
+    forEachInRange(items, cameraX - VIEW_MARGIN, cameraX + VIEW_WIDTH + VIEW_MARGIN, visit);
+}
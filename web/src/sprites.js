@@ -0,0 +1,76 @@
+// ⚡ Character atlas - every character's frames baked onto one canvas
+
+// Preview glow pulses between 0.4 and 1.0, snapped like every other glow
+const PREVIEW_PULSES = [];
+for (let step = Math.round(0.4 * GLOW_STEPS); step <= GLOW_STEPS; step++) {
+    PREVIEW_PULSES.push(step / GLOW_STEPS);
+}
+
+// Frames baked for each character: [name, box around the frame's origin, largest blur, paint(g, char)]
+const CHARACTER_FRAMES = [
+    ['right', [-2, -2, player.width + 4, player.height + 20], 15,
+        (g, char) => paintPlayer(g, char, player.width, player.height, true)],
+    ['left', [-2, -2, player.width + 4, player.height + 20], 15,
+        (g, char) => paintPlayer(g, char, player.width, player.height, false)],
+    ...PREVIEW_PULSES.map(pulse => [`preview:${pulse}`, [0, 0, 36, 56], 8 * pulse,
+        (g, char) => paintCharacterPreview(g, char, pulse)]),
+    ...PREVIEW_PULSES.map(pulse => [`preview-glow:${pulse}`, [6, 55, 24, 6], 12 * pulse,
+        (g, char) => paintPreviewGlow(g, char.circuitColor || '#00FFFF', pulse)]),
+];
+
+// One row per character, one cell per frame - cells are baked the first time they're drawn
+const characterAtlas = {
+    image: null,
+    cells: {},          // Frame name -> { sx, width, height, dx, dy, paint }
+    rowHeight: 0,
+    baked: new Set(),
+};
+
+// Work out where every frame sits in a row
+function layoutCharacterAtlas() {
+    let sx = 0;
+    characterAtlas.rowHeight = 0;
+    CHARACTER_FRAMES.forEach(([name, box, blur, paint]) => {
+        const [left, top, width, height] = box;
+        const pad = glowPad(blur);
+        const cell = {
+            sx,
+            width: Math.ceil(width) + pad * 2,
+            height: Math.ceil(height) + pad * 2,
+            dx: left - pad,
+            dy: top - pad,
+            paint,
+        };
+        characterAtlas.cells[name] = cell;
+        characterAtlas.rowHeight = Math.max(characterAtlas.rowHeight, cell.height);
+        sx += cell.width;
+    });
+    characterAtlas.image = createOffscreen(sx, characterAtlas.rowHeight * characters.length);
+}
+
+// Blit one character frame with its origin at (x, y), baking it first if needed
+function drawCharacterFrame(charIndex, frame, x, y) {
+    if (!characterAtlas.image) layoutCharacterAtlas();
+    const cell = characterAtlas.cells[frame];
+    const sy = charIndex * characterAtlas.rowHeight;
+    const key = `${charIndex}:${frame}`;
+    if (!characterAtlas.baked.has(key)) {
+        const g = characterAtlas.image.getContext('2d');
+        g.save();
+        g.beginPath();
+        g.rect(cell.sx, sy, cell.width, cell.height);
+        g.clip();
+        g.translate(cell.sx - cell.dx, sy - cell.dy);
+        cell.paint(g, characters[charIndex]);
+        g.restore();
+        characterAtlas.baked.add(key);
+    }
+    drawOffscreenPart(characterAtlas.image, cell.sx, sy, cell.width, cell.height,
+        Math.round(x + cell.dx), Math.round(y + cell.dy), cell.width, cell.height);
+}
+
+// Forget every baked frame - needed when the canvas resolution or quality tier changes
+function clearCharacterAtlas() {
+    characterAtlas.image = null;
+    characterAtlas.baked.clear();
+}
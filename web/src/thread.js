@@ -0,0 +1,48 @@
+// ⚡ Thread - runs the engine on the page or inside a Web Worker
+//
+// In worker mode (see web/host.js) the page transfers its canvas with
+// transferControlToOffscreen() before loading the engine, so simulation and
+// drawing happen off the main thread. The page keeps the DOM: it forwards
+// input here as messages and shows the overlay when asked to.
+
+const IN_WORKER = typeof document === 'undefined';
+
+// Schedule the next frame - workers without requestAnimationFrame tick at 60 Hz
+function nextFrame(callback) {
+    if (typeof requestAnimationFrame === 'function') {
+        requestAnimationFrame(callback);
+    } else {
+        setTimeout(callback, 1000 / 60);
+    }
+}
+
+// Show the game over / mission complete overlay
+function showOverlay(title, html) {
+    if (IN_WORKER) {
+        postMessage({ type: 'overlay', title, html });
+        return;
+    }
+    overlayTitle.textContent = title;
+    overlayScore.innerHTML = html;
+    overlay.style.display = 'flex';
+}
+
+function hideOverlay() {
+    if (IN_WORKER) {
+        postMessage({ type: 'overlay', title: null });
+        return;
+    }
+    overlay.style.display = 'none';
+}
+
+// Input forwarded by the page
+function onHostMessage(e) {
+    const message = e.data;
+    if (message.type === 'keydown' || message.type === 'keyup') queueInput(message.type, message.key);
+    else if (message.type === 'touch') queueInput('touch', message.key, message.pressed);
+    else if (message.type === 'click') queueInput('click', message.x, message.y);
+}
+
+if (IN_WORKER) {
+    self.onmessage = onHostMessage;
+}